@@ -0,0 +1,209 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from typing import List
+
+from .runner import (
+    INPUT_PATTERN,
+    find_days,
+    find_inputs,
+    format_table,
+    get_solver,
+    run_all,
+)
+from .shared import main as solver_main
+from .shared.cancel import TIMEOUT_EXIT_CODE
+from .shared.progress import ProgressReport
+from .shared.solver import BOTH, part_type, print_answers
+from .shared.streams import is_stdin
+
+
+def make_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="advent_of_code",
+        description="Tools for all Advent of Code 2024 days.",
+        epilog="To solve a single day, run `advent_of_code <day> <input file> "
+        "[options]` instead (see `advent_of_code <day> --help`).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_run_all = subparsers.add_parser(
+        "run-all", help="Solve all days and parts in parallel"
+    )
+    parser_run_all.add_argument(
+        "input_dir",
+        type=Path,
+        help=f"Directory with an input file per day, named like `{INPUT_PATTERN}`",
+    )
+    parser_run_all.add_argument(
+        "--pattern",
+        default=INPUT_PATTERN,
+        help="Naming pattern for input files (default: %(default)s)",
+    )
+    parser_run_all.add_argument(
+        "--days", "-d", type=int, nargs="+", help="Only run these days"
+    )
+    parser_run_all.add_argument(
+        "--parts", "-p", type=int, nargs="+", default=[1, 2], choices=[1, 2]
+    )
+    parser_run_all.add_argument(
+        "--jobs", "-j", type=int, help="Number of worker processes (default: #CPUs)"
+    )
+    parser_run_all.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a `.pstats` file per day/part, next to the inputs",
+    )
+    parser_run_all.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Cancel each day/part that takes longer than this",
+    )
+
+    parser_serve = subparsers.add_parser(
+        "serve",
+        help="Run a daemon that keeps all days loaded and solves requests from "
+        "`client`",
+    )
+    parser_serve.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix socket to listen on (default: `$AOC_SOCKET`, or one in "
+        "`$XDG_RUNTIME_DIR` or the temporary directory)",
+    )
+    parser_serve.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=4,
+        help="Number of requests solved at the same time (default: %(default)s)",
+    )
+    parser_serve.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Cancel requests that take longer than this (default: no limit, "
+        "unless the request sets one)",
+    )
+
+    parser_client = subparsers.add_parser(
+        "client", help="Solve a day through the `serve` daemon"
+    )
+    parser_client.add_argument("day", type=int)
+    parser_client.add_argument("input_file", help="Path to input file, `-` for stdin")
+    parser_client.add_argument(
+        "--part",
+        "-p",
+        default=1,
+        type=part_type,
+        choices=[1, 2, BOTH],
+        help=f"Run either part 1 (default), part 2 or `{BOTH}`",
+    )
+    parser_client.add_argument(
+        "--socket", type=Path, help="Unix socket of the daemon (see `serve`)"
+    )
+    parser_client.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Have the daemon cancel the request after this long",
+    )
+
+    return parser
+
+
+def run_client(args: Namespace) -> int:
+    """Send a request to the daemon and print the result like a day's own CLI."""
+    from .serve import SUPPORTED, UNSUPPORTED, request  # Not needed elsewhere
+
+    if not SUPPORTED:
+        print(UNSUPPORTED, file=sys.stderr)
+        return 1
+
+    message = {"day": args.day, "part": args.part}
+    if args.timeout is not None:
+        message["timeout"] = args.timeout
+    if is_stdin(args.input_file):
+        message["input_text"] = sys.stdin.read()
+    else:
+        message["input_path"] = str(Path(args.input_file).resolve())
+
+    try:
+        response = request(message, args.socket)
+    except OSError as err:
+        print(f"Cannot reach the daemon: {err}", file=sys.stderr)
+        return 1
+
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        if "progress" in response:
+            print(f"Got to: {ProgressReport(**response['progress'])}", file=sys.stderr)
+        return TIMEOUT_EXIT_CODE if response.get("cancelled") else 1
+
+    print_answers(
+        response["answers"],
+        response["time"],
+        response["parse_time"],
+        parse_cached=response["parse_cached"],
+    )
+    return 0
+
+
+def run_day(day: int, argv: List[str]) -> int:
+    """Solve a single day, only importing the code of that day."""
+    try:
+        solver_class = get_solver(day)
+    except (ImportError, LookupError):
+        print(f"No solution found for day {day}", file=sys.stderr)
+        return 1
+
+    solver_main(solver_class, argv)
+    return 0
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0].isdigit():
+        return run_day(int(argv[0]), argv[1:])
+
+    args = make_parser().parse_args(argv)
+
+    if args.command == "run-all":
+        days = args.days or find_days()
+        inputs = find_inputs(args.input_dir, days, args.pattern)
+        if not inputs:
+            print(f"No input files found in `{args.input_dir}`", file=sys.stderr)
+            return 1
+
+        results, total_time = run_all(
+            inputs,
+            parts=args.parts,
+            jobs=args.jobs,
+            profile=args.profile,
+            timeout=args.timeout,
+        )
+        print(format_table(results, total_time))
+        if args.profile:
+            print("\nProfiles written to:")
+            for result in results:
+                if result.profile_file is not None:
+                    print(f"  {result.profile_file}")
+        return 1 if any(r.error is not None for r in results) else 0
+
+    if args.command == "serve":
+        from .serve import serve
+
+        try:
+            serve(args.socket, workers=args.workers, timeout=args.timeout)
+        except RuntimeError as err:
+            print(err, file=sys.stderr)
+            return 1
+    elif args.command == "client":
+        return run_client(args)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
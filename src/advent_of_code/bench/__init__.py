@@ -0,0 +1,160 @@
+import json
+import math
+import platform
+import statistics
+from argparse import ArgumentTypeError
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from advent_of_code.runner import get_solver
+
+
+def int_at_least(minimum: int) -> Callable[[str], int]:
+    """Get an argument type for integers of at least ``minimum``."""
+
+    def parse(value: str) -> int:
+        number = int(value)
+        if number < minimum:
+            raise ArgumentTypeError(f"must be at least {minimum}, not {number}")
+        return number
+
+    parse.__name__ = "int"  # For the message of argparse on a `ValueError`
+    return parse
+
+
+positive_int = int_at_least(1)  # For counts like ``--repeats``
+
+
+def percentile(samples: List[int], p: float) -> int:
+    """Get a percentile from a list of samples (nearest-rank method)."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(p / 100.0 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class BenchResult:
+    """Repeated timings of a single day/part."""
+
+    day: int
+    part: int
+    answer: str = ""
+    samples_ns: List[int] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        """Get statistics of the samples, as a JSON-friendly dict."""
+        return {
+            "day": self.day,
+            "part": self.part,
+            "answer": self.answer,
+            "repeats": len(self.samples_ns),
+            "min_ns": min(self.samples_ns),
+            "median_ns": int(statistics.median(self.samples_ns)),
+            "p95_ns": percentile(self.samples_ns, 95),
+            "stddev_ns": (
+                int(statistics.stdev(self.samples_ns))
+                if len(self.samples_ns) > 1
+                else 0
+            ),
+        }
+
+
+def bench_solver(
+    day: int, part: int, input_file: Path, repeats: int = 5, warmup: int = 1
+) -> BenchResult:
+    """Time a solver a number of times.
+
+    Each run gets a fresh solver instance. Only the solving itself is timed, not
+    the argument parsing.
+    """
+    solver_class = get_solver(day)
+    result = BenchResult(day=day, part=part)
+
+    for i in range(warmup + repeats):
+        solver = solver_class([str(input_file), "--part", str(part)])
+        start = perf_counter_ns()
+        answer = solver()
+        duration = perf_counter_ns() - start
+
+        result.answer = str(answer)
+        if i >= warmup:
+            result.samples_ns.append(duration)
+
+    return result
+
+
+def run_benchmarks(
+    inputs: Dict[int, Path],
+    parts: Iterable[int] = (1, 2),
+    repeats: int = 5,
+    warmup: int = 1,
+) -> List[BenchResult]:
+    """Benchmark all given days and parts, one after the other."""
+    return [
+        bench_solver(day, part, input_file, repeats=repeats, warmup=warmup)
+        for day, input_file in sorted(inputs.items())
+        for part in sorted(parts)
+    ]
+
+
+def to_json(results: List[BenchResult]) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [r.summary() for r in results],
+    }
+
+
+def load_results(path: Path) -> Dict[Tuple[int, int], Dict[str, Any]]:
+    """Load earlier results from file, like ``{(<day>, <part>): <summary>}``."""
+    data = json.loads(path.read_text())
+    return {(r["day"], r["part"]): r for r in data["results"]}
+
+
+@dataclass
+class Comparison:
+    """Difference of a result with its baseline."""
+
+    day: int
+    part: int
+    baseline_ns: int
+    median_ns: int
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.median_ns / self.baseline_ns if self.baseline_ns else math.inf
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1.0 + self.threshold
+
+
+def compare(
+    results: List[BenchResult],
+    baseline: Dict[Tuple[int, int], Dict[str, Any]],
+    threshold: float = 0.1,
+) -> List[Comparison]:
+    """Compare medians with a baseline.
+
+    Day/parts that are missing from the baseline are skipped.
+
+    :param threshold: Relative slowdown that counts as a regression, e.g. 0.1 for 10%
+    """
+    comparisons = []
+    for result in results:
+        base = baseline.get((result.day, result.part), None)
+        if base is None:
+            continue
+        comparisons.append(
+            Comparison(
+                day=result.day,
+                part=result.part,
+                baseline_ns=base["median_ns"],
+                median_ns=result.summary()["median_ns"],
+                threshold=threshold,
+            )
+        )
+    return comparisons
@@ -0,0 +1,143 @@
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from advent_of_code.bench import (
+    compare,
+    int_at_least,
+    load_results,
+    positive_int,
+    run_benchmarks,
+    to_json,
+)
+from advent_of_code.bench.startup import STARTUP_PART, bench_startup
+from advent_of_code.gen import write_input
+from advent_of_code.runner import INPUT_PATTERN, find_days, find_inputs
+
+
+def make_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="advent_of_code.bench",
+        description="Benchmark the solvers with repeated runs.",
+    )
+    parser.add_argument(
+        "input_dir",
+        type=Path,
+        nargs="?",
+        help=f"Directory with an input file per day, named like `{INPUT_PATTERN}`",
+    )
+    parser.add_argument("--pattern", default=INPUT_PATTERN)
+    parser.add_argument("--days", "-d", type=int, nargs="+", help="Only these days")
+    parser.add_argument(
+        "--parts", "-p", type=int, nargs="+", default=[1, 2], choices=[1, 2]
+    )
+    parser.add_argument(
+        "--repeats", "-n", type=positive_int, default=5, help="Number of timed runs"
+    )
+    parser.add_argument(
+        "--warmup", type=int_at_least(0), default=1, help="Number of untimed runs first"
+    )
+    parser.add_argument("--output", "-o", type=Path, help="Write results as JSON")
+    parser.add_argument(
+        "--compare", type=Path, help="Compare against an earlier JSON result"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown of the median that is a regression "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--generate",
+        type=float,
+        metavar="SCALE",
+        help="Benchmark with generated inputs of this scale, instead of an input "
+        "directory",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Random seed for `--generate`"
+    )
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        help="Also time the imports of each day, in a fresh interpreter "
+        "(with `-X importtime`)",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    if args.input_dir is None and args.generate is None and not args.startup:
+        parser.error(
+            "an input directory is required, unless using `--generate` or `--startup`"
+        )
+
+    with TemporaryDirectory() as tmp_dir:
+        if args.generate is not None:
+            args.input_dir = Path(tmp_dir)
+            for day in args.days or find_days():
+                input_file = args.input_dir / args.pattern.format(day=day)
+                write_input(day, input_file, scale=args.generate, seed=args.seed)
+
+        return run(args)
+
+
+def run(args: Namespace) -> int:
+    """Run and report the benchmarks, return the exit code."""
+    days = args.days or find_days()
+    results = []
+
+    if args.startup:
+        results += [bench_startup(day, repeats=args.repeats) for day in days]
+
+    if args.input_dir is not None:
+        inputs = find_inputs(args.input_dir, days, args.pattern)
+        if not inputs:
+            print(f"No input files found in `{args.input_dir}`", file=sys.stderr)
+            return 1
+
+        results += run_benchmarks(
+            inputs, parts=args.parts, repeats=args.repeats, warmup=args.warmup
+        )
+
+    print("Day     Part      min (ms)   median (ms)      p95 (ms)   stddev (ms)")
+    for result in results:
+        s = result.summary()
+        part = "startup" if s["part"] == STARTUP_PART else str(s["part"])
+        print(
+            f"{s['day']:3d}  {part:>7}"
+            + "".join(
+                f"  {s[key] / 1e6:12.3f}"
+                for key in ["min_ns", "median_ns", "p95_ns", "stddev_ns"]
+            )
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(to_json(results), indent=2))
+
+    if args.compare:
+        regressions = 0
+        print()
+        for comparison in compare(results, load_results(args.compare), args.threshold):
+            flag = " SLOWER" if comparison.regressed else ""
+            part = "startup" if comparison.part == STARTUP_PART else comparison.part
+            print(
+                f"Day {comparison.day:2d} part {part}: "
+                f"{comparison.ratio:6.2f}x baseline{flag}"
+            )
+            regressions += comparison.regressed
+
+        if regressions:
+            print(f"\n{regressions} regression(s) found")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
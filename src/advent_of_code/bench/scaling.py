@@ -0,0 +1,199 @@
+import math
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Iterable, List, Sequence
+
+from advent_of_code.bench import int_at_least, positive_int
+from advent_of_code.gen import write_input
+from advent_of_code.runner import find_days, get_solver
+
+
+def fit_exponent(sizes: Sequence[float], values: Sequence[float]) -> float:
+    """Fit ``value = c * size^k`` and return ``k``, the slope in a log-log plot.
+
+    This is a least-squares fit of a straight line through the logarithms.
+    """
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return math.nan
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance if variance else math.nan
+
+
+@dataclass
+class ScalingResult:
+    """Runtimes and peak memory of a day/part, for inputs of increasing size."""
+
+    day: int
+    part: int
+    budget: float | None = None  # Highest allowed runtime exponent
+    sizes: List[int] = field(default_factory=list)  # Bytes of input
+    times: List[float] = field(default_factory=list)  # Seconds
+    peaks: List[int] = field(default_factory=list)  # Bytes of traced memory
+
+    @property
+    def time_exponent(self) -> float:
+        return fit_exponent(self.sizes, self.times)
+
+    @property
+    def memory_exponent(self) -> float:
+        return fit_exponent(self.sizes, self.peaks)
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the runtime grows faster than the budget, or could not be fit."""
+        if self.budget is None:
+            return False
+        return not math.isfinite(self.time_exponent) or self.time_exponent > self.budget
+
+
+def measure_scaling(
+    day: int,
+    part: int,
+    scales: Iterable[float],
+    seed: int = 0,
+    repeats: int = 1,
+    memory: bool = True,
+    budget: float | None = None,
+) -> ScalingResult:
+    """Solve generated inputs of each scale and record the cost.
+
+    The fastest of the repeats is kept. The memory is measured in a separate run,
+    as tracing slows everything down.
+
+    :param budget: Override the ``SCALING_BUDGET`` of the solver
+    """
+    solver_class = get_solver(day)
+    if budget is None:
+        budget = solver_class.SCALING_BUDGET.get(part, None)
+    result = ScalingResult(day=day, part=part, budget=budget)
+
+    with TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            input_file = Path(tmp_dir) / f"day_{day:02d}_{scale}.txt"
+            write_input(day, input_file, scale=scale, seed=seed)
+            args = [str(input_file), "--part", str(part)]
+
+            durations = []
+            for _ in range(repeats):
+                solver = solver_class(args)
+                start = perf_counter()
+                solver()
+                durations.append(perf_counter() - start)
+
+            peak = 0
+            if memory:
+                solver = solver_class(args)
+                tracemalloc.start()
+                try:
+                    solver()
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+
+            result.sizes.append(input_file.stat().st_size)
+            result.times.append(min(durations))
+            result.peaks.append(peak)
+
+    return result
+
+
+def make_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="advent_of_code.bench.scaling",
+        description="Find how the runtime and memory of the solvers grow with the "
+        "input size, using generated inputs.",
+    )
+    parser.add_argument("--days", "-d", type=int, nargs="+", help="Only these days")
+    parser.add_argument(
+        "--parts", "-p", type=int, nargs="+", default=[1, 2], choices=[1, 2]
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=0.25,
+        help="Scale of the smallest input (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--factor",
+        type=float,
+        default=2.0,
+        help="Growth of the scale per step (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--steps",
+        type=int_at_least(2),
+        default=4,
+        help="Number of sizes, at least 2 to fit anything (default: %(default)s)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--repeats",
+        "-n",
+        type=positive_int,
+        default=1,
+        help="Number of timed runs per size",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip measuring the peak memory"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Highest allowed runtime exponent, instead of `SCALING_BUDGET` of each "
+        "solver",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = make_parser().parse_args(argv)
+    scales = [args.scale * args.factor**step for step in range(args.steps)]
+
+    print("Day  Part  time exp.  memory exp.  budget  largest (s)")
+    over_budget = 0
+    for day in args.days or find_days():
+        for part in args.parts:
+            result = measure_scaling(
+                day,
+                part,
+                scales,
+                seed=args.seed,
+                repeats=args.repeats,
+                memory=not args.no_memory,
+                budget=args.budget,
+            )
+            budget = "-" if result.budget is None else f"{result.budget:.2f}"
+            flag = ""
+            if result.over_budget:
+                measured = math.isfinite(result.time_exponent)
+                flag = " OVER BUDGET" if measured else " NOT MEASURED"
+            print(
+                f"{day:3d}  {part:4d}  {result.time_exponent:9.2f}  "
+                f"{result.memory_exponent:11.2f}  {budget:>6}  "
+                f"{result.times[-1]:11.3f}{flag}",
+                flush=True,
+            )
+            over_budget += result.over_budget
+
+    if over_budget:
+        print(
+            f"\n{over_budget} day/part(s) scale worse than their budget (or their "
+            "runtimes were too short to tell)"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
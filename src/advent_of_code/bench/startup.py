@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import advent_of_code
+from advent_of_code.bench import BenchResult
+
+STARTUP_PART = 0  # Pseudo part number of startup results
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def parse_import_time(output: str) -> Dict[str, int]:
+    """Get the cumulative time (us) of each top-level import, from `-X importtime`.
+
+    Nested imports are included in the time of the module that imported them.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        _, cumulative, name = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue  # Nested import, or the header
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure_import_time(module: str) -> int:
+    """Import a module in a fresh interpreter and return how long it took (ns).
+
+    Only the imports of this project are counted (including everything they import
+    in turn), not those of the interpreter startup itself.
+    """
+    src_dir = str(Path(advent_of_code.__file__).parent.parent)
+    python_path = os.pathsep.join(filter(None, [src_dir, os.getenv("PYTHONPATH")]))
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": python_path},
+    )
+    times = parse_import_time(process.stderr)
+    project = advent_of_code.__name__
+    return 1000 * sum(
+        time
+        for name, time in times.items()
+        if name == project or name.startswith(project + ".")
+    )
+
+
+def bench_startup(day: int, repeats: int = 5) -> BenchResult:
+    """Time the import of a single day, i.e. the startup overhead of a solution."""
+    result = BenchResult(day=day, part=STARTUP_PART)
+    module = f"advent_of_code.day_{day:02d}.__main__"
+    for _ in range(repeats):
+        result.samples_ns.append(measure_import_time(module))
+    return result
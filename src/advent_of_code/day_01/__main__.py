@@ -1,39 +1,61 @@
-from typing import List
+from typing import List, Sequence, Tuple
 
 from advent_of_code.shared import Solver, main
 
+Columns = Tuple[Sequence[int], Sequence[int]]
+
 
 class Day01(Solver):
 
-    def __call__(self) -> str:
-        column_left: List[int] = []
-        column_right: List[int] = []
-        for line in self.iterate_input():
-            left, _, right = line.partition(" ")
-            column_left.append(int(left))
-            column_right.append(int(right))
+    SOLVE_MODIFIES_INPUT = False
+    PARSE_VERSION = 2  # Columns are arrays now
+
+    def parse(self) -> Columns:
+        numbers = self.input_ints(per_line=2)
+        return numbers[0::2], numbers[1::2]  # Left and right column
+
+    def solve(self, parsed: Columns) -> str:
+        column_left, column_right = parsed
 
         column_left = sorted(column_left)
         column_right = sorted(column_right)
 
         if self.args.part == 1:
+            return str(self.total_distance(column_left, column_right))
+        else:
+            return str(self.similarity_score(column_left, column_right))
 
-            sum_distance = 0
-            for left, right in zip(column_left, column_right):
-                sum_distance += abs(right - left)
+    def solve_both(self, parsed: Columns) -> Tuple[str, str]:
+        column_left, column_right = parsed
 
-            return str(sum_distance)
+        column_left = sorted(column_left)
+        column_right = sorted(column_right)
 
-        else:
+        return (
+            str(self.total_distance(column_left, column_right)),
+            str(self.similarity_score(column_left, column_right)),
+        )
+
+    @staticmethod
+    def total_distance(column_left: List[int], column_right: List[int]) -> int:
+        """Get the summed distance of the sorted columns (part 1)."""
+        sum_distance = 0
+        for left, right in zip(column_left, column_right):
+            sum_distance += abs(right - left)
+
+        return sum_distance
 
-            column_right_counts = {v: column_right.count(v) for v in column_right}
+    @staticmethod
+    def similarity_score(column_left: List[int], column_right: List[int]) -> int:
+        """Get the similarity score of the columns (part 2)."""
+        column_right_counts = {v: column_right.count(v) for v in column_right}
 
-            score = 0
+        score = 0
 
-            for val in column_left:
-                score += val * column_right_counts.get(val, 0)
+        for val in column_left:
+            score += val * column_right_counts.get(val, 0)
 
-            return str(score)
+        return score
 
 
 if __name__ == "__main__":
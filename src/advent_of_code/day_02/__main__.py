@@ -5,12 +5,17 @@ from advent_of_code.shared import Solver, main
 
 class Day02(Solver):
 
-    def __call__(self) -> str:
+    SOLVE_MODIFIES_INPUT = False
 
-        count_safe = 0
-        for line in self.iterate_input():
-            numbers = [int(txt) for txt in line.split(" ")]
+    def parse(self) -> List[List[int]]:
+        return [
+            [int(txt) for txt in line.split()] for line in self.iterate_input_bytes()
+        ]
+
+    def solve(self, parsed: List[List[int]]) -> str:
 
+        count_safe = 0
+        for numbers in parsed:
             tolerance = 0 if self.args.part == 1 else 1
 
             if self.check_report(numbers):
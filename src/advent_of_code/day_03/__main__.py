@@ -5,11 +5,16 @@ from advent_of_code.shared import Solver, main
 
 class Day03(Solver):
 
-    RE_MULT = re.compile(r"mul\((\d+),(\d+)\)")
-    RE_MULT_ENABLE = re.compile(r"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+    SOLVE_MODIFIES_INPUT = False
 
-    def __call__(self) -> str:
-        txt = "\n".join(self.get_input())
+    RE_MULT = re.compile(rb"mul\((\d+),(\d+)\)")
+    RE_MULT_ENABLE = re.compile(rb"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+
+    def parse(self) -> bytes:
+        return self.get_input_bytes()
+
+    def solve(self, parsed: bytes) -> str:
+        txt = parsed
 
         result = 0
 
@@ -23,11 +28,11 @@ class Day03(Solver):
             enabled = True
 
             for match in self.RE_MULT_ENABLE.finditer(txt):
-                if match.group(0) == "do()":
+                if match.group(0) == b"do()":
                     enabled = True
-                elif match.group(0) == "don't()":
+                elif match.group(0) == b"don't()":
                     enabled = False
-                elif match.group(0).startswith("mul"):
+                elif match.group(0).startswith(b"mul"):
                     if enabled:
                         result += int(match.group(1)) * int(match.group(2))
 
@@ -1,16 +1,24 @@
 import re
+from typing import List
 
 from advent_of_code.shared import RowCol, Solver, main
 
 
 class Day04(Solver):
 
-    def __call__(self) -> str:
+    SOLVE_MODIFIES_INPUT = False
+
+    def parse(self) -> List[str]:
         lines = self.get_input()
 
         if lines[-1] == "":
             lines.pop(-1)
 
+        return lines
+
+    def solve(self, parsed: List[str]) -> str:
+        lines = parsed
+
         rows = len(lines)
         cols = len(lines[0])
 
@@ -1,21 +1,24 @@
 from collections import defaultdict
-from typing import List, Self, Set
+from types import MappingProxyType
+from typing import List, Mapping, Self, Set, Tuple
 
 from advent_of_code.shared import Solver, main
 
+Order = Mapping[int, Set["Page"]]
+# Like ``n: {pages that may only follow n, not precede it}``
+
 
 class Page:
     """Page entity, so it can be sorted.
 
     We will rely on the default `sorted` function. We just need to implement a custom
     comparison method, which will rely on the page order information.
+    All pages of one input share the same order, so different inputs never mix.
     """
 
-    ORDER: defaultdict[int, Set[Self]] = defaultdict(set)
-    # Like ``n: [list of numbers that may only follow n, not precede it]``
-
-    def __init__(self, number: int | str):
+    def __init__(self, number: int | str, order: Order = MappingProxyType({})):
         self.number = int(number) if isinstance(number, str) else number
+        self.order = order
 
     def __eq__(self, other: Self) -> bool:
         return self.number == other.number
@@ -27,54 +30,76 @@ class Page:
         return f"<Page ({self.number})>"
 
     def __lt__(self, other: Self) -> bool:
-        following = self.ORDER[self.number]
+        following = self.order.get(self.number, ())
         if other in following:
             return True  # `other` must be after `self`, so `self` is less than `other`
 
         return False  # `other` has no relation to `self`, just return false
 
 
-class Day05(Solver):
+Updates = List[List[Page]]
 
-    def __call__(self) -> str:
 
-        do_updates = False
+class Day05(Solver):
 
-        updates: List[List[Page]] = []
+    SOLVE_MODIFIES_INPUT = False
+    PARSE_VERSION = 2  # The rules are parsed into the order now
 
-        for line in self.iterate_input():
-            if line == "":
-                do_updates = True
-                continue
+    def parse(self) -> Tuple[Order, Updates]:
+        section_rules, section_updates = self.input_sections()
 
-            if not do_updates:
-                page_1, _, page_2 = line.partition("|")
-                page_1, page_2 = Page(page_1), Page(page_2)
-                Page.ORDER[page_1.number].add(page_2)
+        numbers = self.parse_ints(section_rules, per_line=2)  # Like "47|53"
+        order: defaultdict[int, Set[Page]] = defaultdict(set)
+        for page_1, page_2 in zip(numbers[0::2], numbers[1::2]):
+            order[page_1].add(Page(page_2, order))
 
-            else:
-                pages = [Page(t) for t in line.split(",")]
+        updates: Updates = []
+        for line in section_updates.splitlines():
+            if line:
+                pages = [Page(number, order) for number in self.parse_ints(line)]
                 updates.append(pages)
 
+        return order, updates
+
+    def solve(self, parsed: Tuple[Order, Updates]) -> str:
+        value_part_1, updates_invalid = self.split_updates(*parsed)
+
+        if self.args.part == 1:
+            return str(value_part_1)
+
+        return str(self.sort_updates(updates_invalid))
+
+    def solve_both(self, parsed: Tuple[Order, Updates]) -> Tuple[str, str]:
+        # Part 2 only needs the invalid updates that are found for part 1 anyway
+        value_part_1, updates_invalid = self.split_updates(*parsed)
+
+        return str(value_part_1), str(self.sort_updates(updates_invalid))
+
+    def split_updates(self, order: Order, updates: Updates) -> Tuple[int, Updates]:
+        """Find the updates that are in the wrong order.
+
+        :return: Score of the valid updates and a list of the invalid updates
+        """
         value_part_1 = 0
-        updates_invalid: List[List[Page]] = []
+        updates_invalid: Updates = []
 
         for update in updates:
-            if self.check_update_order(update):
+            if self.check_update_order(order, update):
                 value_part_1 += self.get_middle(update).number
             else:
                 updates_invalid.append(update)
 
-        if self.args.part == 1:
-            return str(value_part_1)
+        return value_part_1, updates_invalid
 
+    def sort_updates(self, updates_invalid: Updates) -> int:
+        """Sort the invalid updates and return their score."""
         value_part_2 = 0
 
         for update in updates_invalid:
             update_sorted = sorted(update)
             value_part_2 += self.get_middle(update_sorted).number
 
-        return str(value_part_2)
+        return value_part_2
 
     @staticmethod
     def get_middle(array: List[Page]) -> Page:
@@ -82,7 +107,7 @@ class Day05(Solver):
         return array[middle_idx]
 
     @staticmethod
-    def check_update_order(update: List[Page]) -> bool:
+    def check_update_order(order: Order, update: List[Page]) -> bool:
         """Return True if an update (i.e. set of pages) is in a valid order.
 
         Loop over each number and than over all the numbers after. For each pair find
@@ -92,7 +117,7 @@ class Day05(Solver):
         for i, page in enumerate(update):
 
             for other_page in update[(i + 1) :]:
-                following_pages = Page.ORDER[other_page.number]
+                following_pages = order.get(other_page.number, ())
 
                 # If the first number must actually follow the second number, a rule
                 # is violated and this is not a valid update:
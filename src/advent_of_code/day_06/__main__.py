@@ -8,22 +8,22 @@ Locations = defaultdict[RowCol, Set[Direction]]
 
 class Day06(Solver):
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self.grid = Grid()
+    def parse(self) -> Grid:
+        grid = Grid()
+        for line in self.iterate_input():
+            grid.add_str_row(line)
 
-    def __call__(self) -> str:
+        return grid
 
-        for line in self.iterate_input():
-            self.grid.add_str_row(line)
+    def solve(self, parsed: Grid) -> str:
+        grid = parsed
 
-        guard = self.grid.get_item_by_character("^")
-        self.grid.remove(guard)
+        guard = grid.get_item_by_character("^")
+        grid.remove(guard)
         guard.direction = Direction.NORTH
 
         if self.args.part == 1:
-            steps = self.get_number_of_steps(self.grid, guard)
+            steps = self.get_number_of_steps(grid, guard)
             return str(len(steps))  # Count individual tiles, not duplicate steps!
 
         else:
@@ -34,36 +34,40 @@ class Day06(Solver):
             # ^ locations history of the real guard in the real maze
 
             # Do the loop again, but step-by-step:
-            while self.grid.in_range(guard.loc):
-
-                # Find next location:
-                next_loc, next_dir = self.find_next_step(self.grid, guard)
+            with self.progress("guard steps") as progress:
+                while grid.in_range(guard.loc):
 
-                # What if that spot was a block instead:
-                if next_loc not in locations_visited and self.grid.in_range(next_loc):
-                    maze_temp = self.grid.copy()
-                    maze_temp.items[next_loc] = GridItem(loc=next_loc, character="O")
+                    # Find next location:
+                    next_loc, next_dir = self.find_next_step(grid, guard)
 
-                    guard_temp = GridItem(
-                        loc=guard.loc.copy(), character=guard.character
-                    )
-                    guard_temp.direction = guard.direction
-
-                    try:
-                        locations_visited_copy = defaultdict(set)
-                        for loc, item in locations_visited.items():
-                            locations_visited_copy[loc.copy()] = item.copy()
-
-                        self.get_number_of_steps(
-                            maze_temp, guard_temp, locations_visited_copy
+                    # What if that spot was a block instead:
+                    if next_loc not in locations_visited and grid.in_range(next_loc):
+                        maze_temp = grid.copy()
+                        maze_temp.items[next_loc] = GridItem(
+                            loc=next_loc, character="O"
                         )
-                    except RuntimeError:
-                        # Catch loops:
-                        possible_blocks += 1
 
-                locations_visited[guard.loc.copy()].add(guard.direction)
-                guard.loc = next_loc
-                guard.direction = next_dir
+                        guard_temp = GridItem(
+                            loc=guard.loc.copy(), character=guard.character
+                        )
+                        guard_temp.direction = guard.direction
+
+                        try:
+                            locations_visited_copy = defaultdict(set)
+                            for loc, item in locations_visited.items():
+                                locations_visited_copy[loc.copy()] = item.copy()
+
+                            self.get_number_of_steps(
+                                maze_temp, guard_temp, locations_visited_copy
+                            )
+                        except RuntimeError:
+                            # Catch loops:
+                            possible_blocks += 1
+
+                    locations_visited[guard.loc.copy()].add(guard.direction)
+                    guard.loc = next_loc
+                    guard.direction = next_dir
+                    progress.update()
 
             return str(possible_blocks)
 
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Tuple
+from typing import Collection, List, Tuple
 
 from advent_of_code.shared import Solver, main
 
@@ -20,21 +20,29 @@ class Operator(Enum):
 
 class Day07(Solver):
 
-    OPTIONS = [Operator.ADD, Operator.MULT]
+    SOLVE_MODIFIES_INPUT = False
 
-    def __call__(self) -> str:
-        result = 0
-
-        if self.args.part == 2:
-            Day07.OPTIONS.append(Operator.CONCAT)
+    OPTIONS = (Operator.ADD, Operator.MULT)
+    OPTIONS_PART_2 = OPTIONS + (Operator.CONCAT,)
 
+    def parse(self) -> List[Tuple[int, List[int]]]:
+        equations = []
         for line in self.iterate_input():
             total_str, _, numbers_str = line.strip().partition(":")
 
             total = int(total_str)
             numbers = [int(t) for t in numbers_str.strip().split(" ")]
+            equations.append((total, numbers))
+
+        return equations
+
+    def solve(self, parsed: List[Tuple[int, List[int]]]) -> str:
+        result = 0
+
+        options = self.OPTIONS_PART_2 if self.args.part == 2 else self.OPTIONS
 
-            if self.possible_equation(total, numbers):
+        for total, numbers in parsed:
+            if self.possible_equation(total, numbers, options):
                 result += total
 
         return str(result)
@@ -44,6 +52,7 @@ class Day07(Solver):
         cls,
         total: int,
         numbers: List[int],
+        options: Collection[Operator] = OPTIONS,
         operators: List[Operator] | None = None,
         total_backwards: int = 0,
     ) -> bool:
@@ -57,6 +66,7 @@ class Day07(Solver):
 
         :param total:
         :param numbers:
+        :param options:     Operators that may be used
         :param operators:   Recursive element
                             These are the last operators of this branch of execution
         :param total_backwards: Result with the operators we have already
@@ -80,7 +90,7 @@ class Day07(Solver):
         next_number_idx = len(numbers) - 1 - progress  # Number for the next operator
         next_number = numbers[next_number_idx]
 
-        if Operator.CONCAT in cls.OPTIONS:
+        if Operator.CONCAT in options:
             total_backwards_str = str(total_backwards)
             next_number_str = str(next_number)
             if total_backwards != next_number and total_backwards_str.endswith(
@@ -89,18 +99,18 @@ class Day07(Solver):
                 total_backwards_next_str = total_backwards_str[: -len(next_number_str)]
                 next_options.append((Operator.CONCAT, int(total_backwards_next_str)))
 
-        if Operator.MULT in cls.OPTIONS:
+        if Operator.MULT in options:
             if total_backwards % next_number == 0:
                 next_options.append((Operator.MULT, int(total_backwards / next_number)))
 
-        if Operator.ADD in cls.OPTIONS:
+        if Operator.ADD in options:
             if total_backwards > next_number:
                 next_options.append((Operator.ADD, total_backwards - next_number))
 
         for option, next_total_backwards in next_options:
             next_operations = [option] + operators[:]
             if cls.possible_equation(
-                total, numbers, next_operations, next_total_backwards
+                total, numbers, options, next_operations, next_total_backwards
             ):
                 return True
 
@@ -6,13 +6,19 @@ from advent_of_code.shared import Grid, GridItem, RowCol, Solver, main
 
 class Day08(Solver):
 
-    def __call__(self) -> str:
+    SOLVE_MODIFIES_INPUT = False
 
+    def parse(self) -> Grid:
         grid = Grid()
 
         for line in self.iterate_input():
             grid.add_str_row(line)
 
+        return grid
+
+    def solve(self, parsed: Grid) -> str:
+        grid = parsed
+
         # Group by characters:
         signals: defaultdict[str, List[GridItem]] = defaultdict(list)
         for item in grid.items.values():
@@ -36,7 +36,9 @@ BlockList = SortedList[Block]
 
 class Day09(Solver):
 
-    def __call__(self) -> str:
+    SCALING_BUDGET = {1: 1.3, 2: 2.3}  # Moving whole blocks is quadratic
+
+    def parse(self) -> BlockList:
 
         line = next(self.iterate_input())
 
@@ -56,6 +58,11 @@ class Day09(Solver):
 
             position += number
 
+        return blocks
+
+    def solve(self, parsed: BlockList) -> str:
+        blocks = parsed
+
         if self.args.part == 1:
             compacted_blocks = self.compact_blocks_by_byte(blocks)
         else:
@@ -73,7 +80,7 @@ class Day09(Solver):
 
         while len(blocks) > 0:
             # Find the next gap in the original list:
-            while len(blocks) > 1 and blocks[0].in_range(position):
+            while len(blocks) > 0 and blocks[0].in_range(position):
                 block = blocks.pop(0)
                 compacted_blocks.add(block)
                 position += block.length
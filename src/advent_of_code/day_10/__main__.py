@@ -1,24 +1,42 @@
 from collections import defaultdict
-from typing import List, Set
+from typing import List, Set, Tuple
 
 from advent_of_code.shared import Grid, GridItem, RowCol, Solver, main
 
 
 class Day10(Solver):
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    SOLVE_MODIFIES_INPUT = False  # Metadata is fully reset on each run
 
-        self.grid = Grid()
-
-    def __call__(self) -> str:
+    def parse(self) -> Grid:
+        grid = Grid()
         for line in self.iterate_input():
-            self.grid.add_str_row(line)
+            grid.add_str_row(line)
+
+        return grid
+
+    def solve(self, parsed: Grid) -> str:
+        trailheads = self.find_trailheads(parsed)
+
+        key = "ends" if self.args.part == 1 else "paths"
+        return str(self.score(trailheads, key))
 
+    def solve_both(self, parsed: Grid) -> Tuple[str, str]:
+        # Both scores come out of the same walk through the grid
+        trailheads = self.find_trailheads(parsed)
+
+        return str(self.score(trailheads, "ends")), str(self.score(trailheads, "paths"))
+
+    @staticmethod
+    def find_trailheads(grid: Grid) -> List[GridItem]:
+        """Return all the 0 tiles, with the reachable 9s and number of paths to them.
+
+        These are stored under the "ends" and "paths" keys of each item's data.
+        """
         items_by_value: defaultdict[int, List[GridItem]] = defaultdict(list)
 
         # Fill in some meta-data:
-        for item in self.grid.items.values():
+        for item in grid.items.values():
             val = int(item.character)
             item.data["value"] = val
             items_by_value[val].append(item)
@@ -33,24 +51,29 @@ class Day10(Solver):
         for value in range(9, -1, -1):
             for item in items_by_value[value]:
                 # Check the neighbouring tiles:
-                for neighbour in self.grid.neighbours(item):
+                for neighbour in grid.neighbours(item):
                     if neighbour.data["value"] == value - 1:
                         neighbour.data["ends"] = neighbour.data["ends"].union(
                             item.data["ends"]
                         )
                         neighbour.data["paths"] += item.data["paths"]
 
+        return items_by_value[0]
+
+    @staticmethod
+    def score(trailheads: List[GridItem], key: str) -> int:
+        """Get the total score based on either the "ends" or the "paths"."""
         scores_total = 0
 
-        for item in items_by_value[0]:
-            if self.args.part == 1:
+        for item in trailheads:
+            if key == "ends":
                 this_score = len(item.data["ends"])
             else:
                 this_score = item.data["paths"]
 
             scores_total += this_score
 
-        return str(scores_total)
+        return scores_total
 
 
 if __name__ == "__main__":
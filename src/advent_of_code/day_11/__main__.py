@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import List
+from typing import List, Sequence
 
 from advent_of_code.shared import Solver, main
 
@@ -8,17 +8,25 @@ StonesDict = defaultdict[int, int]
 
 class Day11(Solver):
 
-    def __call__(self) -> str:
+    SOLVE_MODIFIES_INPUT = False
+    PARSE_VERSION = 2  # The stones are an array now
+
+    def parse(self) -> Sequence[int]:
+        data = self.get_input_bytes()
+        stones = self.parse_ints(data)
+        if not stones or len(stones) != len(data.split()):
+            raise ValueError("Expected only numbers in the input")
+        return stones
+
+    def solve(self, parsed: Sequence[int]) -> str:
 
         # The order of the stones doesn't matter and the number of unique
         # ones isn't so great, so just keep a count of each value instead
         stones: StonesDict = defaultdict(lambda: 0)
         # Like: {"stone": "count"}
 
-        for line in self.iterate_input():
-            for stone in [int(t) for t in line.split(" ")]:
-                stones[stone] += 1
-            break
+        for stone in parsed:
+            stones[stone] += 1
 
         number_of_blinks = 25 if self.args.part == 1 else 75
 
@@ -1,20 +1,27 @@
 from collections import defaultdict
-from typing import List, Set
+from typing import List, Set, Tuple
 
 from advent_of_code.shared import Grid, RowCol, Solver, main
 
 
 class Day12(Solver):
 
+    SOLVE_MODIFIES_INPUT = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.garden = Grid()
 
-    def __call__(self) -> str:
-
+    def parse(self) -> Grid:
+        garden = Grid()
         for line in self.iterate_input():
-            self.garden.add_str_row(line)
+            garden.add_str_row(line)
+
+        return garden
+
+    def solve(self, parsed: Grid) -> str:
+        self.garden = parsed
 
         regions_by_char = self.find_regions()
 
@@ -29,6 +36,20 @@ class Day12(Solver):
 
         return str(total_score)
 
+    def solve_both(self, parsed: Grid) -> Tuple[str, str]:
+        self.garden = parsed
+
+        # Finding the regions is the expensive bit, so do it only once:
+        regions_by_char = self.find_regions()
+
+        total_score_1, total_score_2 = 0, 0
+        for _, regions in regions_by_char.items():
+            for region in regions:
+                total_score_1 += self.calculate_score(region)
+                total_score_2 += self.calculate_score_edges(region)
+
+        return str(total_score_1), str(total_score_2)
+
     def find_regions(self) -> defaultdict[str, List[Set[RowCol]]]:
         """Detect matching garden plots (= regions)."""
         # List of sets, each representing one region
@@ -1,4 +1,3 @@
-import re
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -22,12 +21,16 @@ class Game:
         if args or kwargs:
             super().__init__(*args, **kwargs)
 
-    def get_button_presses(self) -> None | Tuple[int, int]:
+    def get_button_presses(self, offset: int = 0) -> None | Tuple[int, int]:
         """Return the minimum number of button presses to win this game.
 
         We really solve the question by composing a 2x2 matrix for the two equations,
         one for X and one for Y.
+
+        :param offset: Extra distance of the prize, in both X and Y
         """
+        prize = (self.prize[0] + offset, self.prize[1] + offset)
+
         det = self.button_a[0] * self.button_b[1] - self.button_a[1] * self.button_b[0]
 
         if det == 0:
@@ -36,12 +39,12 @@ class Game:
         # 2x2 matrix inverse:
         det_inv = 1.0 / det
         a = (
-            self.prize[0] * det_inv * self.button_b[1]
-            - self.prize[1] * det_inv * self.button_b[0]
+            prize[0] * det_inv * self.button_b[1]
+            - prize[1] * det_inv * self.button_b[0]
         )
         b = (
-            -self.prize[0] * det_inv * self.button_a[1]
-            + self.prize[1] * det_inv * self.button_a[0]
+            -prize[0] * det_inv * self.button_a[1]
+            + prize[1] * det_inv * self.button_a[0]
         )
 
         a_int = int(round(a))
@@ -56,39 +59,32 @@ class Game:
 
 class Day13(Solver):
 
-    RE_INPUT = re.compile(r"(.+): X.(\d+), Y.(\d+)")
+    SOLVE_MODIFIES_INPUT = False
 
-    def __call__(self) -> str:
+    PRIZE_OFFSET_PART_2 = 10000000000000
 
+    def parse(self) -> List[Game]:
         games: List[Game] = []
+        for section in self.input_sections():
+            # Like "Button A: X+94, Y+34 / Button B: X+22, Y+67 / Prize: X=8400, ..."
+            numbers = self.parse_ints(section)
+            if len(numbers) != 6:
+                raise ValueError(f"Unexpected claw machine: {section.decode()}")
+
+            game = Game()
+            game.button_a = numbers[0], numbers[1]
+            game.button_b = numbers[2], numbers[3]
+            game.prize = numbers[4], numbers[5]
+            games.append(game)
+
+        return games
 
-        new_game = None
-        for line in self.iterate_input():
-            if not line:
-                new_game = None
-                continue
-
-            if new_game is None:
-                new_game = Game()
-
-            match = self.RE_INPUT.match(line)
-            xy = (int(match.group(2)), int(match.group(3)))
-            name = match.group(1)
-            if name == "Button A":
-                new_game.button_a = xy
-            elif name == "Button B":
-                new_game.button_b = xy
-            elif name == "Prize":
-                if self.args.part == 2:
-                    xy = (xy[0] + 10000000000000, xy[1] + 10000000000000)
-                new_game.prize = xy
-                games.append(new_game)
-            else:
-                raise ValueError(f"Didn't recognize `{name}`")
+    def solve(self, parsed: List[Game]) -> str:
+        offset = self.PRIZE_OFFSET_PART_2 if self.args.part == 2 else 0
 
         score = 0
-        for game in games:
-            presses = game.get_button_presses()
+        for game in parsed:
+            presses = game.get_button_presses(offset)
             if presses is not None:
                 this_score = presses[0] * Game.COST_A + presses[1] * Game.COST_B
                 score += this_score
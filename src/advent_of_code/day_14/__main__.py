@@ -46,9 +46,20 @@ class Robot(GridItem):
 
 class Day14(Solver):
 
-    def __call__(self) -> str:
+    def parse(self) -> List[Robot]:
+        numbers = self.input_ints(per_line=4)  # Like "p=0,4 v=3,-3" for each robot
+        robots = []
+        for i in range(0, len(numbers), 4):
+            robot = Robot()
+            # Our row-column system is transposed (x = col, y = row):
+            robot.loc = RowCol(numbers[i + 1], numbers[i])
+            robot.velocity = RowCol(numbers[i + 3], numbers[i + 2])
+            robots.append(robot)
 
-        robots: List[Robot] = [Robot.from_str(line) for line in self.iterate_input()]
+        return robots
+
+    def solve(self, parsed: List[Robot]) -> str:
+        robots = parsed
 
         if self.args.part == 1:
             for robot in robots:
@@ -74,14 +85,17 @@ class Day14(Solver):
             # I read by other solutions that when the Christmas trees shows, all roots
             # are in a unique position. So we just search for that instead.
             seconds = 0
-            while True:
-                for r in robots:
-                    r.move()
-                seconds += 1
-
-                if self.positions_are_unique(robots):
-                    # self.print(robots)
-                    break
+            # All positions repeat after ROWS * COLS seconds, so that's the maximum:
+            with self.progress("seconds", total=Robot.ROWS * Robot.COLS) as progress:
+                while True:
+                    for r in robots:
+                        r.move()
+                    seconds += 1
+                    progress.update()
+
+                    if self.positions_are_unique(robots):
+                        # self.print(robots)
+                        break
             score = seconds
 
         return str(score)
@@ -1,20 +1,26 @@
-from typing import List, Set
+from typing import List, Set, Tuple
 
 from advent_of_code.shared import Direction, Grid, GridItem, RowCol, Solver, main
 
 
 class Day15(Solver):
 
+    SOLVE_MODIFIES_INPUT = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.grid = Grid()
         self.robot: GridItem | None = None
 
-    def __call__(self) -> str:
+    def parse(self) -> Tuple[List[str], List[Direction]]:
+        """Read the map lines and the robot instructions.
 
+        The map is kept as text, as part 2 needs a widened version of it.
+        """
         doing_map = True
 
+        map_lines: List[str] = []
         instructions: List[Direction] = []
 
         for line in self.iterate_input():
@@ -23,18 +29,24 @@ class Day15(Solver):
                 continue
 
             if doing_map:
-                if self.args.part == 2:
-                    line = "".join(
-                        [
-                            "@." if c == "@" else "[]" if c == "O" else (c + c)
-                            for c in line
-                        ]
-                    )
-                self.grid.add_str_row(line)
+                map_lines.append(line)
             else:
                 for char in line.strip():
                     instructions.append(self.direction_from_char(char))
 
+        return map_lines, instructions
+
+    def solve(self, parsed: Tuple[List[str], List[Direction]]) -> str:
+        map_lines, instructions = parsed
+
+        self.grid = Grid()
+        for line in map_lines:
+            if self.args.part == 2:
+                line = "".join(
+                    ["@." if c == "@" else "[]" if c == "O" else (c + c) for c in line]
+                )
+            self.grid.add_str_row(line)
+
         self.robot = self.grid.get_item_by_character("@")
 
         # Perform all instructions:
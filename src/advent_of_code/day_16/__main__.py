@@ -16,6 +16,8 @@ Path = List[Tuple[RowCol, Direction]]
 
 class Day16(Solver):
 
+    SOLVE_MODIFIES_INPUT = False
+
     COST_STEP = 1
     COST_TURN = 1_000
 
@@ -24,10 +26,15 @@ class Day16(Solver):
 
         self.grid = Grid()
 
-    def __call__(self) -> str:
-
+    def parse(self) -> Grid:
+        grid = Grid()
         for line in self.iterate_input():
-            self.grid.add_str_row(line)
+            grid.add_str_row(line)
+
+        return grid
+
+    def solve(self, parsed: Grid) -> str:
+        self.grid = parsed
 
         start = self.grid.get_item_by_character("S")
         start.direction = Direction.EAST
@@ -53,57 +60,60 @@ class Day16(Solver):
 
         all_path_tiles: Set[RowCol] = set()
 
-        while path_queue:
-            # Consume the lowest-score option from the queue:
+        with self.progress("paths") as progress:
+            while path_queue:
+                progress.update()
+                # Consume the lowest-score option from the queue:
 
-            this_score, this_path = path_queue.pop()
+                this_score, this_path = path_queue.pop()
 
-            tip_loc, tip_direction = this_path[-1]  # Find where this path ends
+                tip_loc, tip_direction = this_path[-1]  # Find where this path ends
 
-            if tip_loc == end.loc:  # Found the (first of multiple) optimal path(s)
+                if tip_loc == end.loc:  # Found the (first of multiple) optimal path(s)
 
-                if self.args.part == 1:
-                    # Just return the score of the best path:
-                    return this_score
+                    if self.args.part == 1:
+                        # Just return the score of the best path:
+                        return this_score
 
-                if optimal_score is None:
-                    optimal_score = this_score
+                    if optimal_score is None:
+                        optimal_score = this_score
 
-                if optimal_score is not None and this_score == optimal_score:
-                    # Found a path that is the optimal path or just as good
-                    all_path_tiles |= set(loc for loc, _ in this_path)
+                    if optimal_score is not None and this_score == optimal_score:
+                        # Found a path that is the optimal path or just as good
+                        all_path_tiles |= set(loc for loc, _ in this_path)
 
-            # Check 4 possible directions:
-            for next_direction in Direction:
-                if next_direction == tip_direction.opposite():
-                    continue  # Don't bother doubling back
+                # Check 4 possible directions:
+                for next_direction in Direction:
+                    if next_direction == tip_direction.opposite():
+                        continue  # Don't bother doubling back
 
-                next_loc = tip_loc.next(next_direction)
-                next_tile = self.grid.items.get(next_loc, None)
-                if next_tile is not None and next_tile.character == "#":
-                    continue  # Cannot go this way, skip
+                    next_loc = tip_loc.next(next_direction)
+                    next_tile = self.grid.items.get(next_loc, None)
+                    if next_tile is not None and next_tile.character == "#":
+                        continue  # Cannot go this way, skip
 
-                if next_loc in [loc for loc, _ in this_path]:
-                    continue  # We started making a loop, give up here
-                # Not really needed in regular Dijkstra, but we use a lt-or-eq operator,
-                # so this helps
+                    if next_loc in [loc for loc, _ in this_path]:
+                        continue  # We started making a loop, give up here
+                    # Not really needed in regular Dijkstra, but we use a lt-or-eq
+                    # operator, so this helps
 
-                turns = 0 if next_direction == tip_direction else 1  # Never backwards
-                next_score = this_score + self.COST_STEP + self.COST_TURN * turns
+                    # Never backwards:
+                    turns = 0 if next_direction == tip_direction else 1
+                    next_score = this_score + self.COST_STEP + self.COST_TURN * turns
 
-                if (
-                    next_direction not in best_scores[next_loc]
-                    or next_score < best_scores[next_loc][next_direction]
-                    or (
-                        self.args.part == 2
-                        and next_score == best_scores[next_loc][next_direction]
-                    )
-                ):
+                    if (
+                        next_direction not in best_scores[next_loc]
+                        or next_score < best_scores[next_loc][next_direction]
+                        or (
+                            self.args.part == 2
+                            and next_score == best_scores[next_loc][next_direction]
+                        )
+                    ):
 
-                    # Found a better path!
-                    next_path = this_path[:] + [(next_loc, next_direction)]
-                    best_scores[next_loc][next_direction] = next_score
-                    path_queue.push(next_score, next_path)
+                        # Found a better path!
+                        next_path = this_path[:] + [(next_loc, next_direction)]
+                        best_scores[next_loc][next_direction] = next_score
+                        path_queue.push(next_score, next_path)
 
         if self.args.part == 2:
             return len(all_path_tiles)
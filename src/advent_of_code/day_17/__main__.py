@@ -1,7 +1,7 @@
 from enum import IntEnum
-from typing import List
+from typing import List, Tuple
 
-from advent_of_code.shared import Solver, main
+from advent_of_code.shared import NULL_PROGRESS, NullProgress, Progress, Solver, main
 
 
 class Instruction(IntEnum):
@@ -88,7 +88,9 @@ class Machine:
 
         return index + 2  # Default increment
 
-    def find_circular_program(self, program: List[int]) -> int:
+    def find_circular_program(
+        self, program: List[int], progress: Progress | NullProgress = NULL_PROGRESS
+    ) -> int:
         """Find value for `a` such that output equals the program itself.
 
         We see a pattern that for `a = 8^n` the output has `n + 1` items,
@@ -97,6 +99,8 @@ class Machine:
         list. So to converge to a solution, we find the last digit in the output
         and the program that are different and then increment `a` with the right
         exponent of 8.
+
+        :param progress: Updated for each step of the convergence
         """
         # Find the lowest meaningful value for register `a`:
         n = 0
@@ -117,6 +121,7 @@ class Machine:
             self.a += 8**pos  # Increment the octo-bit of this position
 
             output = Machine(self.a, self.b, self.c).do_program(program)
+            progress.update()
 
             if len(output) > len(program):
                 raise RuntimeError("Not converging to solution")
@@ -126,7 +131,9 @@ class Machine:
 
 class Day17(Solver):
 
-    def __call__(self) -> str:
+    SOLVE_MODIFIES_INPUT = False
+
+    def parse(self) -> Tuple[List[int], List[int]]:
 
         reading_registers = True
         registers: List[int] = []
@@ -143,13 +150,19 @@ class Day17(Solver):
                 _, _, numbers_str = line.partition(": ")
                 program = [int(txt) for txt in numbers_str.split(",")]
 
+        return registers, program
+
+    def solve(self, parsed: Tuple[List[int], List[int]]) -> str:
+        registers, program = parsed
+
         machine = Machine(*registers)
 
         if self.args.part == 1:
             output = machine.do_program(program)
             return ",".join(str(t) for t in output)
         else:
-            machine.find_circular_program(program)
+            with self.progress("find_circular_program") as progress:
+                machine.find_circular_program(program, progress)
             return str(machine.a)
 
 
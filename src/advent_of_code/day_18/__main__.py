@@ -15,26 +15,34 @@ Path = List[RowCol]
 
 class Day18(Solver):
 
+    SOLVE_MODIFIES_INPUT = False
+
     BYTE_LIMIT = 1024
     GRID_SIZE = 70  # Grid size (inclusive)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.grid = Grid()
-        self.grid.rows = self.GRID_SIZE + 1
-        self.grid.cols = self.GRID_SIZE + 1
+        self.grid = self.make_grid()
+
+    @classmethod
+    def make_grid(cls) -> Grid:
+        grid = Grid()
+        grid.rows = cls.GRID_SIZE + 1
+        grid.cols = cls.GRID_SIZE + 1
+        return grid
 
-    def __call__(self) -> str:
+    def parse(self) -> List[GridItem]:
+        numbers = self.input_ints(per_line=2)  # Like "x,y" on each line
+        return [
+            GridItem(loc=RowCol(coord_y, coord_x), character="#")
+            for coord_x, coord_y in zip(numbers[0::2], numbers[1::2])
+        ]
 
-        i = 0
-        obstacles: List[GridItem] = []
-        for line in self.iterate_input():
-            coord_x, _, coord_y = line.strip().partition(",")
-            coord_x, coord_y = int(coord_x), int(coord_y)
-            item = GridItem(loc=RowCol(coord_y, coord_x), character="#")
-            obstacles.append(item)
+    def solve(self, parsed: List[GridItem]) -> str:
+        obstacles = parsed
 
+        self.grid = self.make_grid()
         start = RowCol(0, 0)
         goal = RowCol(self.GRID_SIZE, self.GRID_SIZE)
 
@@ -47,16 +55,20 @@ class Day18(Solver):
 
         else:
             path_so_far = None
-            for _index, obstacle in enumerate(obstacles):
-                self.grid.add(obstacle)
-
-                if path_so_far is not None and obstacle.loc not in path_so_far:
-                    continue  # No need to check validity, already walking around it
-
-                try:
-                    _, path_so_far = self.find_shorest_path(start, goal)
-                except RuntimeError:
-                    return f"{obstacle.loc.col},{obstacle.loc.row}"  # X,Y vs row,col
+            with self.progress("obstacles", total=len(obstacles)) as progress:
+                for obstacle in obstacles:
+                    self.grid.add(obstacle)
+                    progress.update()
+
+                    if path_so_far is not None and obstacle.loc not in path_so_far:
+                        continue  # No need to check validity, already walking around it
+
+                    try:
+                        _, path_so_far = self.find_shorest_path(start, goal)
+                    except RuntimeError:
+                        return (
+                            f"{obstacle.loc.col},{obstacle.loc.row}"  # X,Y vs row,col
+                        )
 
             raise RuntimeError("Couldn't find limiting block!")
 
@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, List, Set
+from typing import List, Set, Tuple
 
 from advent_of_code.shared import Solver, main
 
@@ -7,6 +7,8 @@ Towel = str
 
 class Day19(Solver):
 
+    SOLVE_MODIFIES_INPUT = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -14,8 +16,9 @@ class Day19(Solver):
         self.stock_lookup = {}
         self.stock_max = 0
 
-    def __call__(self) -> str:
+    def parse(self) -> Tuple[Set[Towel], List[Towel]]:
 
+        stock: Set[Towel] = set()
         designs: List[Towel] = []
 
         first_line = True
@@ -26,13 +29,17 @@ class Day19(Solver):
 
             if first_line:
                 for part in line.split(","):
-                    part = part.strip()
-                    self.stock.add(part)
-                    self.stock_max = max(self.stock_max, len(part))
+                    stock.add(part.strip())
             else:
                 # designs.append(Color.towel_from_str(line))
                 designs.append(line.strip())
 
+        return stock, designs
+
+    def solve(self, parsed: Tuple[Set[Towel], List[Towel]]) -> str:
+        self.stock, designs = parsed
+        self.stock_max = max(len(towel) for towel in self.stock)
+
         result = 0
 
         if self.args.part == 1:
@@ -47,51 +54,25 @@ class Day19(Solver):
         return str(result)
 
     def possible_design(self, design: Towel) -> int:
-        """Return number of possible designs.
-
-        Use the early return argument to check for any possibility at all.
+        """Return number of ways to make the design.
 
-        We work by tracking how many concurrent options there are for sub-designs of
-        increasing length. This way we don't need to track multiple ways of making
-        partially completed designs, but we just count them.
+        Count the ways to make each end of the design, from the shortest end to the
+        whole design: an end can start with any matching stock towel, followed by
+        any way of making the (shorter) end after it. This is a plain loop, so the
+        length of a design is not limited by the recursion depth.
         """
-        options_so_far: Dict[int, int] = {0: 1}
-        # Like: `{ <# of colors so far>: <# of options for it, ... }
-        # Collection of how many options there are for these number of colours pinned
-        # already
-
-        options = 0
-
-        while options_so_far:
-            # Take a 'path' from the 'queue' to pursue:
-            option_length = next(iter(options_so_far))
-            option_count = options_so_far.pop(option_length)
-
-            if option_length == len(design):
-                if self.args.part == 1:  # Just return on the first already
-                    return 1
-                else:
-                    options += option_count
-                    continue
-
-            design_remaining = design[option_length:]
-
-            for stock_option in self.find_stock_towel(design_remaining):
-                new_length = option_length + len(stock_option)
-                if new_length not in options_so_far:
-                    options_so_far[new_length] = option_count
-                else:
-                    options_so_far[new_length] += option_count
-
-        return options
-
-    def find_stock_towel(self, pattern: Towel) -> Iterable[Towel]:
-        """Yield the matching stock towels to the start of the given pattern."""
-        i_max = min(self.stock_max, len(pattern)) + 1
-        for i in range(1, i_max):
-            substr = pattern[:i]
-            if substr in self.stock:
-                yield substr
+        ways = [0] * len(design) + [1]
+        # Like: `ways[<start>]` is the number of ways to make `design[<start>:]`
+
+        for start in range(len(design) - 1, -1, -1):
+            i_max = min(self.stock_max, len(design) - start) + 1
+            ways[start] = sum(
+                ways[start + i]
+                for i in range(1, i_max)
+                if design[start : start + i] in self.stock
+            )
+
+        return ways[0]
 
 
 if __name__ == "__main__":
@@ -5,17 +5,27 @@ from advent_of_code.shared import Direction, Grid, RowCol, Solver, main
 
 class Day20(Solver):
 
+    SOLVE_MODIFIES_INPUT = False
+
     CHEAT_MINIMUM: int = 100  # Minimum numer of picoseconds to save (inclusive)
     CHEAT_DURATION: int = 20  # Number of steps to take while cheating (part 2)
 
+    SCALING_BUDGET = {1: 2.3, 2: 2.3}  # Cheats are checked between all path pairs
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.grid = Grid()
 
-    def __call__(self) -> str:
+    def parse(self) -> Grid:
+        grid = Grid()
         for line in self.iterate_input():
-            self.grid.add_str_row(line)
+            grid.add_str_row(line)
+
+        return grid
+
+    def solve(self, parsed: Grid) -> str:
+        self.grid = parsed
 
         start = self.grid.get_item_by_character("S")
         goal = self.grid.get_item_by_character("E")
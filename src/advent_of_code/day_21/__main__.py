@@ -1,7 +1,7 @@
 from enum import StrEnum
 from typing import Dict, List, Tuple
 
-from advent_of_code.shared import Direction, RowCol, Solver, main
+from advent_of_code.shared import Cache, Direction, RowCol, Solver, main
 
 Buttons = Dict[str, RowCol]
 
@@ -13,6 +13,10 @@ class KeypadType(StrEnum):
     DIRECTIONAL = "directional"
 
 
+PathDirections = Dict[KeypadType, Dict[Tuple[str, str], List[str]]]
+ComplexityCache = Cache[Tuple[int, str], int]  # Like ``{(<depth>, <code>): <length>}``
+
+
 class Keypad:
     """Abstraction of a specific keypad."""
 
@@ -43,15 +47,18 @@ class Keypad:
     }
 
     # Look-up table on how to possibly navigate from any button to another button
-    # (including the final 'A' to press that button):
-    PATH_DIRECTIONS: Dict[KeypadType, Dict[Tuple[str, str], List[str]]] = {}
+    # (including the final 'A' to press that button). It only depends on the fixed
+    # layouts, so it is built once and shared by all inputs:
+    PATH_DIRECTIONS: PathDirections = {}
 
-    MIN_COMPLEXITY_CACHE: Dict[Tuple[int, str], int] = {}
+    # Bound for the results of a run, far above the few hundred actually needed:
+    COMPLEXITY_CACHE_SIZE = 10_000
 
     def __init__(self, pad_type: KeypadType):
 
         if not self.PATH_DIRECTIONS:
-            Keypad.build_lookup()
+            # Assigned in one go, so other threads never see a partial table
+            Keypad.PATH_DIRECTIONS = Keypad.build_lookup()
 
         self.pad_type = pad_type
 
@@ -73,12 +80,13 @@ class Keypad:
         return sequences
 
     @classmethod
-    def build_lookup(cls):
+    def build_lookup(cls) -> PathDirections:
         """Build the directional lookup table."""
+        path_directions: PathDirections = {}
         for pad_type in KeypadType:
             buttons = cls.BUTTONS[pad_type]
 
-            cls.PATH_DIRECTIONS[pad_type] = {}
+            path_directions[pad_type] = {}
 
             for button_from in buttons.keys():
                 for button_to in buttons.keys():
@@ -93,7 +101,9 @@ class Keypad:
                         for path in paths
                     ]
 
-                    cls.PATH_DIRECTIONS[pad_type][(button_from, button_to)] = path_strs
+                    path_directions[pad_type][(button_from, button_to)] = path_strs
+
+        return path_directions
 
     @classmethod
     def find_all_keypad_directions(
@@ -121,7 +131,9 @@ class Keypad:
         return paths
 
     @classmethod
-    def get_final_complexity_of_stack(cls, pads: List["Keypad"], code: str) -> int:
+    def get_final_complexity_of_stack(
+        cls, pads: List["Keypad"], code: str, cache: ComplexityCache | None = None
+    ) -> int:
         """Return the smallest directional sequence length of the stack of keypads.
 
         It finds the length of the shortest paths for chained pads.
@@ -136,13 +148,16 @@ class Keypad:
         At a depth of 25 this bogs down - but there is loads of repetition. Each code
         (at a specified depth) will always have same min. complexity, so cache it to
         minimize recursion steps.
+
+        :param cache: Results so far, pass the same one for all codes of a run
         """
+        if cache is None:
+            cache = Cache(cls.COMPLEXITY_CACHE_SIZE, name="Keypad complexity")
+
         depth = len(pads) - 1
         cache_key = (depth, code)
-        try:
-            return cls.MIN_COMPLEXITY_CACHE[cache_key]
-        except KeyError:
-            pass
+        if (min_length := cache.get(cache_key)) is not None:
+            return min_length
 
         paths_per_character = pads[0].get_sequence_paths(code)
         # Like: `[ <paths for char 1>, <paths for char 2>, ... ]``
@@ -154,19 +169,25 @@ class Keypad:
                 min_length += min(map(len, paths))
             else:  # Recurse deeper
                 min_length += min(
-                    cls.get_final_complexity_of_stack(pads[1:], path) for path in paths
+                    cls.get_final_complexity_of_stack(pads[1:], path, cache)
+                    for path in paths
                 )
             # Sum the length of the shortest string in each list
 
-        cls.MIN_COMPLEXITY_CACHE[cache_key] = min_length
+        cache.put(cache_key, min_length)
 
         return min_length
 
 
 class Day21(Solver):
 
-    def __call__(self) -> str:
-        codes: List[str] = [txt.strip() for txt in self.iterate_input()]
+    SOLVE_MODIFIES_INPUT = False
+
+    def parse(self) -> List[str]:
+        return [txt.strip() for txt in self.iterate_input()]
+
+    def solve(self, parsed: List[str]) -> str:
+        codes = parsed
 
         score = 0
 
@@ -178,8 +199,11 @@ class Day21(Solver):
 
         pads += [Keypad(KeypadType.DIRECTIONAL) for _ in range(depth)]
 
+        cache: ComplexityCache = Cache(
+            Keypad.COMPLEXITY_CACHE_SIZE, name="Keypad complexity"
+        )  # One per run, so it is released with it
         for code in codes:
-            complexity = Keypad.get_final_complexity_of_stack(pads, code)
+            complexity = Keypad.get_final_complexity_of_stack(pads, code, cache)
             code_int = int(code[:-1])
             score += complexity * code_int
 
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Dict, Iterable, Set, Tuple
+from typing import Dict, Iterable, Sequence, Set, Tuple
 
 from advent_of_code.shared import Solver, main
 
@@ -55,8 +55,14 @@ class MarketSecrets:
 
 class Day22(Solver):
 
-    def __call__(self) -> str:
-        starting_secrets = [int(txt) for txt in self.iterate_input()]
+    SOLVE_MODIFIES_INPUT = False
+    PARSE_VERSION = 2  # The numbers are an array now
+
+    def parse(self) -> Sequence[int]:
+        return self.input_ints(per_line=1)
+
+    def solve(self, parsed: Sequence[int]) -> str:
+        starting_secrets = parsed
 
         if self.args.part == 1:
             result = 0
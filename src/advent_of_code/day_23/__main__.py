@@ -12,15 +12,23 @@ from advent_of_code.shared import (
 
 class Day23(Solver):
 
+    SOLVE_MODIFIES_INPUT = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.graph = Graph()
 
-    def __call__(self) -> str:
+    def parse(self) -> Graph:
+        graph = Graph()
         for line in self.iterate_input():
             node_1, _, node_2 = line.strip().partition("-")
-            self.graph.add_edge_and_nodes(EdgeBidirectional, node_1, node_2)
+            graph.add_edge_and_nodes(EdgeBidirectional, node_1, node_2)
+
+        return graph
+
+    def solve(self, parsed: Graph) -> str:
+        self.graph = parsed
 
         if self.args.part == 1:
 
@@ -105,31 +113,33 @@ class Day23(Solver):
 
         biggest_cluster: FrozenSet[Node] = frozenset()
 
-        while clusters_queue:
-            cluster = clusters_queue.pop()
+        with self.progress("clusters") as progress:
+            while clusters_queue:
+                progress.update()
+                cluster = clusters_queue.pop()
 
-            # Keep a continually adjusting set of nodes that are connected to all
-            # nodes in the current cluster
-            new_nodes: None | Set[Node] = None
-            for node in cluster:
-                connected_nodes = all_connected_nodes[node]
+                # Keep a continually adjusting set of nodes that are connected to all
+                # nodes in the current cluster
+                new_nodes: None | Set[Node] = None
+                for node in cluster:
+                    connected_nodes = all_connected_nodes[node]
 
-                if new_nodes is None:
-                    new_nodes = set(connected_nodes)
-                else:
-                    new_nodes.intersection_update(connected_nodes)
+                    if new_nodes is None:
+                        new_nodes = set(connected_nodes)
+                    else:
+                        new_nodes.intersection_update(connected_nodes)
+
+                    if not new_nodes:
+                        break
 
                 if not new_nodes:
-                    break
-
-            if not new_nodes:
-                # No new connected nodes, this cluster is finished
-                if len(cluster) > len(biggest_cluster):
-                    biggest_cluster = cluster
-            else:
-                for new_node in new_nodes:
-                    new_cluster = frozenset(cluster | {new_node})
-                    clusters_queue.add(new_cluster)
+                    # No new connected nodes, this cluster is finished
+                    if len(cluster) > len(biggest_cluster):
+                        biggest_cluster = cluster
+                else:
+                    for new_node in new_nodes:
+                        new_cluster = frozenset(cluster | {new_node})
+                        clusters_queue.add(new_cluster)
 
         return biggest_cluster
 
@@ -99,6 +99,8 @@ class Adder:
 
 class Day24(Solver):
 
+    SOLVE_MODIFIES_INPUT = False  # Part 2 ignores the wire values set by part 1
+
     def __init__(self, *args, **kwargs):
 
         super().__init__(*args, **kwargs)
@@ -107,7 +109,9 @@ class Day24(Solver):
         self.gates: List[Gate] = []
         self.adders: List[Adder] = []
 
-    def __call__(self) -> str:
+    def parse(self) -> Tuple[Dict[str, Wire], List[Gate]]:
+        wires: Dict[str, Wire] = {}
+        gates: List[Gate] = []
 
         # Process input file:
         first_section = True
@@ -119,7 +123,7 @@ class Day24(Solver):
             if first_section:
                 name, _, value = line.partition(": ")
                 new_wire = Wire(name, value == "1")  # Self-registering
-                self.wires[name] = new_wire
+                wires[name] = new_wire
             else:
                 parts = line.split(" ")
                 input_names = [parts[0], parts[2]]
@@ -127,15 +131,20 @@ class Day24(Solver):
                 output_name = parts[4]
 
                 for name in input_names + [output_name]:
-                    if name not in self.wires:
-                        self.wires[name] = Wire(name, None)
+                    if name not in wires:
+                        wires[name] = Wire(name, None)
 
                 new_gate = Gate(
-                    [self.wires[n] for n in input_names],
+                    [wires[n] for n in input_names],
                     logic_type,
-                    self.wires[output_name],
+                    wires[output_name],
                 )
-                self.gates.append(new_gate)
+                gates.append(new_gate)
+
+        return wires, gates
+
+    def solve(self, parsed: Tuple[Dict[str, Wire], List[Gate]]) -> str:
+        self.wires, self.gates = parsed
 
         # Organize all the wires a little:
         self.adders = [Adder() for w in self.wires.keys() if w.startswith("z")]
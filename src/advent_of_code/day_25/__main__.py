@@ -1,4 +1,4 @@
-from typing import List, Self
+from typing import List, Self, Tuple
 
 from advent_of_code.shared import Solver, main
 
@@ -26,10 +26,9 @@ class Tumblers:
 
 class Day25(Solver):
 
-    def __call__(self) -> str:
-
-        # Parse inputs:
+    SOLVE_MODIFIES_INPUT = False
 
+    def parse(self) -> Tuple[List[Tumblers], List[Tumblers]]:
         locks: List[Tumblers] = []
         keys: List[Tumblers] = []
 
@@ -57,6 +56,11 @@ class Day25(Solver):
             else:
                 lines_block.insert(0, line)
 
+        return locks, keys
+
+    def solve(self, parsed: Tuple[List[Tumblers], List[Tumblers]]) -> str:
+        locks, keys = parsed
+
         if self.args.part == 1:
             result = 0
             for lock in locks:
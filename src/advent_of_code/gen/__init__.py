@@ -0,0 +1,51 @@
+"""Seeded generators of puzzle inputs, to test the solvers at any scale.
+
+The scale is relative to the size of the real puzzle inputs, e.g. ``scale=10`` makes
+an input with about ten times as many lines (or ten times the area, for grids).
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from random import Random
+from typing import Iterator
+
+from advent_of_code.shared.streams import COMPRESSION_MODULES, STDIN
+
+from .days import GENERATORS
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> Iterator[str]:
+    """Yield the lines of an input for a day.
+
+    The same arguments always produce the same input.
+    """
+    try:
+        generator = GENERATORS[day]
+    except KeyError:
+        raise LookupError(f"No generator for day {day}") from None
+
+    return generator(Random(seed), scale)
+
+
+def write_input(day: int, path: Path | str, scale: float = 1.0, seed: int = 0):
+    """Write a generated input to a file, ``-`` for stdout.
+
+    Files ending in ``.gz``, ``.xz`` or ``.bz2`` are compressed.
+    """
+    path = Path(path)
+    if str(path) == STDIN:
+        fh = sys.stdout
+    elif path.suffix in COMPRESSION_MODULES:
+        module = importlib.import_module(COMPRESSION_MODULES[path.suffix])
+        fh = module.open(path, "wt")
+    else:
+        fh = open(path, "w")
+
+    try:
+        for line in generate(day, scale, seed):
+            fh.write(line)
+            fh.write("\n")
+    finally:
+        if fh is not sys.stdout:
+            fh.close()
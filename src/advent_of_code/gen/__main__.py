@@ -0,0 +1,38 @@
+import sys
+from argparse import ArgumentParser
+
+from advent_of_code.gen import GENERATORS, write_input
+
+
+def make_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="advent_of_code.gen",
+        description="Generate a random puzzle input, of any size.",
+    )
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument(
+        "--scale",
+        "-s",
+        type=float,
+        default=1.0,
+        help="Size relative to a real input (default: %(default)s)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--output",
+        "-o",
+        default="-",
+        help="File to write to, `.gz`, `.xz` and `.bz2` are compressed (default: "
+        "stdout)",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = make_parser().parse_args(argv)
+    write_input(args.day, args.output, scale=args.scale, seed=args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
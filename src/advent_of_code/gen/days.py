@@ -0,0 +1,652 @@
+import math
+import string
+from collections import deque
+from random import Random
+from typing import Callable, Dict, Iterator, List, Tuple
+
+Generator = Callable[[Random, float], Iterator[str]]
+
+GENERATORS: Dict[int, Generator] = {}  # Like ``{<day>: <generator function>}``
+
+
+def register(day: int) -> Callable[[Generator], Generator]:
+    """Decorator to make a function the generator of a day."""
+
+    def decorator(func: Generator) -> Generator:
+        GENERATORS[day] = func
+        return func
+
+    return decorator
+
+
+def scaled(base: int, scale: float, minimum: int = 1) -> int:
+    """Scale a count, like the number of lines."""
+    return max(minimum, round(base * scale))
+
+
+def scaled_side(base: int, scale: float, minimum: int = 5) -> int:
+    """Scale the side of a square grid, such that the area scales linearly."""
+    return max(minimum, round(base * math.sqrt(scale)))
+
+
+def grid_lines(grid: List[bytearray]) -> Iterator[str]:
+    for row in grid:
+        yield row.decode()
+
+
+@register(1)
+def day_01(rng: Random, scale: float) -> Iterator[str]:
+    for _ in range(scaled(1000, scale)):
+        yield f"{rng.randrange(10_000, 100_000)}   {rng.randrange(10_000, 100_000)}"
+
+
+@register(2)
+def day_02(rng: Random, scale: float) -> Iterator[str]:
+    for _ in range(scaled(1000, scale)):
+        sign = rng.choice((-1, 1))
+        levels = [rng.randint(25, 75)]
+        for _ in range(rng.randint(4, 7)):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):  # Make some reports unsafe
+            levels[rng.randrange(len(levels))] += rng.choice((-4, -1, 0, 2, 5))
+
+        yield " ".join(str(level) for level in levels)
+
+
+@register(3)
+def day_03(rng: Random, scale: float) -> Iterator[str]:
+    junk = "!@#$%^&*()[]{}<>,'?:;+-/ _~ wherefromselectwhyhow"
+    broken = ["mul(4*", "mul ( 2 , 4 )", "mul[3,7]", "mul(6,9!", "?(12,34)", "don"]
+    for _ in range(scaled(6, scale)):
+        tokens: List[str] = []
+        length = 0
+        while length < 3000:
+            choice = rng.random()
+            if choice < 0.08:
+                token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+            elif choice < 0.09:
+                token = rng.choice(("do()", "don't()"))
+            elif choice < 0.1:
+                token = rng.choice(broken)
+            else:
+                token = "".join(rng.choices(junk, k=rng.randint(1, 4)))
+            tokens.append(token)
+            length += len(token)
+        yield "".join(tokens)
+
+
+@register(4)
+def day_04(rng: Random, scale: float) -> Iterator[str]:
+    side = scaled_side(140, scale)
+    for _ in range(side):
+        yield "".join(rng.choices("XMAS", k=side))
+
+
+@register(5)
+def day_05(rng: Random, scale: float) -> Iterator[str]:
+    # The number of rules grows with the square of the number of pages
+    num_pages = scaled_side(49, scale)
+    order = rng.sample(range(10, 10 + 2 * num_pages + 80), num_pages)
+
+    rules = [(i, j) for i in range(num_pages) for j in range(i + 1, num_pages)]
+    rng.shuffle(rules)
+    for i, j in rules:
+        yield f"{order[i]}|{order[j]}"
+
+    yield ""
+
+    position = {page: i for i, page in enumerate(order)}
+    for _ in range(scaled(200, scale)):
+        length = rng.randrange(5, min(23, num_pages) + 1, 2)  # Odd, for the middle
+        pages = rng.sample(order, length)
+        if rng.random() < 0.5:
+            pages.sort(key=position.__getitem__)
+        yield ",".join(str(page) for page in pages)
+
+
+def walk_guard(grid: List[bytearray], start: Tuple[int, int]) -> Tuple | None:
+    """Let the guard of day 6 walk, return the last obstacle if they end in a loop."""
+    steps = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    rows, cols = len(grid), len(grid[0])
+    (row, col), direction = start, 0
+    turns = set()
+    while True:
+        next_row, next_col = row + steps[direction][0], col + steps[direction][1]
+        if not (0 <= next_row < rows and 0 <= next_col < cols):
+            return None  # Left the map
+
+        if grid[next_row][next_col] == ord("#"):
+            if (row, col, direction) in turns:
+                return next_row, next_col
+            turns.add((row, col, direction))
+            direction = (direction + 1) % 4
+        else:
+            row, col = next_row, next_col
+
+
+@register(6)
+def day_06(rng: Random, scale: float) -> Iterator[str]:
+    side = scaled_side(130, scale, minimum=10)
+    grid = [bytearray(rng.choices(b".#", weights=(95, 5), k=side)) for _ in range(side)]
+    start = (rng.randrange(side), rng.randrange(side))
+    grid[start[0]][start[1]] = ord(".")
+
+    # The guard must leave the map, so remove obstacles until there is no loop:
+    while (obstacle := walk_guard(grid, start)) is not None:
+        grid[obstacle[0]][obstacle[1]] = ord(".")
+
+    grid[start[0]][start[1]] = ord("^")
+    yield from grid_lines(grid)
+
+
+@register(7)
+def day_07(rng: Random, scale: float) -> Iterator[str]:
+    for _ in range(scaled(850, scale)):
+        operators = rng.choice(("+*", "+*|"))
+        target = 10**15
+        while target >= 10**15:  # Keep it in the range of the real inputs
+            numbers = [
+                rng.randint(1, rng.choice((9, 99, 999)))
+                for _ in range(rng.randint(2, 12))
+            ]
+            target = numbers[0]
+            for number in numbers[1:]:
+                operator = rng.choice(operators)
+                if operator == "+":
+                    target += number
+                elif operator == "*":
+                    target *= number
+                else:
+                    target = int(f"{target}{number}")
+
+        if rng.random() < 0.4:
+            target += rng.randint(1, 9)  # Most likely no longer solvable
+
+        yield f"{target}: " + " ".join(str(number) for number in numbers)
+
+
+@register(8)
+def day_08(rng: Random, scale: float) -> Iterator[str]:
+    side = scaled_side(50, scale)
+    frequencies = string.digits + string.ascii_letters
+    num_antennas = min(scaled(200, scale), side * side)
+
+    grid = [bytearray(b"." * side) for _ in range(side)]
+    for cell in rng.sample(range(side * side), num_antennas):
+        grid[cell // side][cell % side] = ord(rng.choice(frequencies))
+    yield from grid_lines(grid)
+
+
+@register(9)
+def day_09(rng: Random, scale: float) -> Iterator[str]:
+    length = scaled(19_999, scale) | 1  # Ends with a file
+    yield "".join(
+        str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9))
+        for i in range(length)
+    )
+
+
+@register(10)
+def day_10(rng: Random, scale: float) -> Iterator[str]:
+    side = scaled_side(50, scale)
+    grid = [bytearray(rng.choices(b"0123456789", k=side)) for _ in range(side)]
+
+    # Random digits rarely form a trail, so draw some uphill trails in it:
+    for _ in range(side * side // 20):
+        trail = [(rng.randrange(side), rng.randrange(side))]
+        while len(trail) < 10:
+            row, col = trail[-1]
+            options = [
+                (row + d_row, col + d_col)
+                for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= row + d_row < side
+                and 0 <= col + d_col < side
+                and (row + d_row, col + d_col) not in trail
+            ]
+            if not options:
+                break
+            trail.append(rng.choice(options))
+
+        if len(trail) == 10:
+            for height, (row, col) in enumerate(trail):
+                grid[row][col] = ord("0") + height
+
+    yield from grid_lines(grid)
+
+
+@register(11)
+def day_11(rng: Random, scale: float) -> Iterator[str]:
+    stones = [rng.randrange(10 ** rng.randint(1, 7)) for _ in range(scaled(8, scale))]
+    yield " ".join(str(stone) for stone in stones)
+
+
+@register(12)
+def day_12(rng: Random, scale: float) -> Iterator[str]:
+    side = scaled_side(140, scale)
+    cells = side * side
+    plants = bytearray(cells)  # 0 for not assigned yet
+
+    # Grow regions from random seeds, by assigning neighbours in random order:
+    frontier = rng.sample(range(cells), max(1, cells // 30))
+    for cell in frontier:
+        plants[cell] = ord(rng.choice(string.ascii_uppercase))
+
+    while frontier:
+        i = rng.randrange(len(frontier))
+        cell = frontier[i]
+        row, col = divmod(cell, side)
+        free = [
+            neighbour
+            for neighbour, valid in [
+                (cell - side, row > 0),
+                (cell + side, row < side - 1),
+                (cell - 1, col > 0),
+                (cell + 1, col < side - 1),
+            ]
+            if valid and not plants[neighbour]
+        ]
+        if free:
+            neighbour = rng.choice(free)
+            plants[neighbour] = plants[cell]
+            frontier.append(neighbour)
+        else:
+            frontier[i] = frontier[-1]
+            frontier.pop()
+
+    for row in range(side):
+        yield plants[row * side : (row + 1) * side].decode()
+
+
+PRIZE_OFFSET_DAY_13 = 10_000_000_000_000  # Like `Day13.PRIZE_OFFSET_PART_2`
+
+
+@register(13)
+def day_13(rng: Random, scale: float) -> Iterator[str]:
+    for i in range(scaled(320, scale)):
+        while True:
+            button_a = (rng.randint(10, 99), rng.randint(10, 99))
+            button_b = (rng.randint(10, 99), rng.randint(10, 99))
+            if button_a[0] * button_b[1] != button_a[1] * button_b[0]:
+                break  # Not parallel
+
+        kind = rng.random()
+        if kind < 0.4:  # Solvable for part 1
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            prize = (
+                a * button_a[0] + b * button_b[0],
+                a * button_a[1] + b * button_b[1],
+            )
+        elif kind < 0.8 and (button_a[0] > button_a[1]) != (button_b[0] > button_b[1]):
+            # Solvable for part 2: find the presses for a far away prize and move
+            # the prize to where those presses end up
+            det = button_a[0] * button_b[1] - button_a[1] * button_b[0]
+            far = PRIZE_OFFSET_DAY_13 + rng.randint(5000, 15_000)
+            a = round(far * (button_b[1] - button_b[0]) / det)
+            b = round(far * (button_a[0] - button_a[1]) / det)
+            prize = (
+                a * button_a[0] + b * button_b[0] - PRIZE_OFFSET_DAY_13,
+                a * button_a[1] + b * button_b[1] - PRIZE_OFFSET_DAY_13,
+            )
+        else:
+            prize = (rng.randint(1000, 20_000), rng.randint(1000, 20_000))
+
+        if i > 0:
+            yield ""
+        yield f"Button A: X+{button_a[0]}, Y+{button_a[1]}"
+        yield f"Button B: X+{button_b[0]}, Y+{button_b[1]}"
+        yield f"Prize: X={prize[0]}, Y={prize[1]}"
+
+
+@register(14)
+def day_14(rng: Random, scale: float) -> Iterator[str]:
+    # The room size is fixed by `day_14.Robot`
+    cols, rows = 101, 103
+    num_robots = min(scaled(500, scale), rows * cols)
+
+    # Part 2 looks for the moment all robots are on a unique position, so make sure
+    # that happens, by picking the positions at that moment and moving back:
+    seconds = rng.randrange(1, rows * cols)
+    for cell in rng.sample(range(rows * cols), num_robots):
+        y, x = divmod(cell, cols)
+        v_x, v_y = rng.choice((-1, 1)) * rng.randint(1, 99), rng.randint(-99, 99)
+        x, y = (x - seconds * v_x) % cols, (y - seconds * v_y) % rows
+        yield f"p={x},{y} v={v_x},{v_y}"
+
+
+@register(15)
+def day_15(rng: Random, scale: float) -> Iterator[str]:
+    side = scaled_side(50, scale, minimum=8)
+    grid = [bytearray(b"#" * side)]
+    for _ in range(side - 2):
+        row = bytearray(rng.choices(b".O#", weights=(70, 25, 5), k=side - 2))
+        grid.append(bytearray(b"#") + row + b"#")
+    grid.append(bytearray(b"#" * side))
+    grid[rng.randrange(1, side - 1)][rng.randrange(1, side - 1)] = ord("@")
+    yield from grid_lines(grid)
+
+    yield ""
+
+    moves = scaled(20_000, scale)
+    for start in range(0, moves, 1000):
+        yield "".join(rng.choices("<>^v", k=min(1000, moves - start)))
+
+
+def carve_maze(rng: Random, side: int, extra_openings: float) -> List[bytearray]:
+    """Make a maze by a random depth-first walk, with walls on even positions.
+
+    Some walls are removed afterward, to make loops.
+    """
+    grid = [bytearray(b"#" * side) for _ in range(side)]
+    grid[1][1] = ord(".")
+    stack = [(1, 1)]
+    while stack:
+        row, col = stack[-1]
+        options = [
+            (row + d_row, col + d_col)
+            for d_row, d_col in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + d_row < side - 1
+            and 0 < col + d_col < side - 1
+            and grid[row + d_row][col + d_col] == ord("#")
+        ]
+        if not options:
+            stack.pop()
+            continue
+        next_row, next_col = rng.choice(options)
+        grid[(row + next_row) // 2][(col + next_col) // 2] = ord(".")
+        grid[next_row][next_col] = ord(".")
+        stack.append((next_row, next_col))
+
+    for row in range(1, side - 1):
+        for col in range(1 + row % 2, side - 1, 2):  # Walls between two cells
+            if rng.random() < extra_openings:
+                grid[row][col] = ord(".")
+
+    return grid
+
+
+@register(16)
+def day_16(rng: Random, scale: float) -> Iterator[str]:
+    side = scaled_side(141, scale, minimum=7) | 1
+    grid = carve_maze(rng, side, extra_openings=0.05)
+    grid[side - 2][1] = ord("S")
+    grid[1][side - 2] = ord("E")
+    yield from grid_lines(grid)
+
+
+def run_day_17_program(program: List[int], a: int) -> List[int]:
+    """Run the kind of program we generate for day 17, which is a single loop."""
+    output = []
+    b = c = 0
+    while True:
+        for i in range(0, len(program), 2):
+            opcode, operand = program[i], program[i + 1]
+            combo = [0, 1, 2, 3, a, b, c, None][operand]
+            if opcode == 0:
+                a = a >> combo
+            elif opcode == 1:
+                b = b ^ operand
+            elif opcode == 2:
+                b = combo % 8
+            elif opcode == 4:
+                b = b ^ c
+            elif opcode == 5:
+                output.append(combo % 8)
+            elif opcode == 7:
+                c = a >> combo
+        if a == 0:
+            return output
+
+
+def find_quine(program: List[int]) -> int | None:
+    """Find the lowest `a` for which the program outputs itself.
+
+    Each loop shifts `a` by three bits, so build it up three bits at a time,
+    starting from the last output.
+    """
+    candidates = [0]
+    for length in range(1, len(program) + 1):
+        candidates = [
+            (a << 3) + bits
+            for a in candidates
+            for bits in range(8)
+            if (a << 3) + bits > 0
+            and run_day_17_program(program, (a << 3) + bits) == program[-length:]
+        ]
+    return min(candidates, default=None)
+
+
+@register(17)
+def day_17(rng: Random, scale: float) -> Iterator[str]:
+    # Part 2 needs a program that can output itself, which only works for a
+    # specific shape of program (a loop that shifts `a` by three bits). The scale
+    # only affects the length of the output of part 1.
+    while True:
+        x, y, z = rng.randrange(8), rng.randrange(8), rng.randrange(8)
+        body = [2, 4, 1, x, 7, 5, 1, y, 4, z, 5, 5]
+        body = body[:-2] + [0, 3] + body[-2:] if rng.random() < 0.5 else body + [0, 3]
+        program = body + [3, 0]
+        if find_quine(program) is not None:
+            break
+
+    digits = scaled(9, scale)
+    yield f"Register A: {rng.randrange(8 ** (digits - 1), 8**digits)}"
+    yield "Register B: 0"
+    yield "Register C: 0"
+    yield ""
+    yield "Program: " + ",".join(str(value) for value in program)
+
+
+def is_reachable(blocked: set, size: int) -> bool:
+    """Check if the bottom-right corner can be reached from the top-left one."""
+    queue = deque([(0, 0)])
+    seen = {(0, 0)}
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == (size - 1, size - 1):
+            return True
+        for next_x, next_y in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if (
+                0 <= next_x < size
+                and 0 <= next_y < size
+                and (next_x, next_y) not in seen
+                and (next_x, next_y) not in blocked
+            ):
+                seen.add((next_x, next_y))
+                queue.append((next_x, next_y))
+    return False
+
+
+@register(18)
+def day_18(rng: Random, scale: float) -> Iterator[str]:
+    # The grid size and the number of bytes for part 1 are fixed by `Day18`, so the
+    # scale is ignored. All cells are listed, so part 2 always finds a blocking byte.
+    size, byte_limit = 71, 1024
+    cells = [(x, y) for x in range(size) for y in range(size)]
+    cells = cells[1:-1]  # Never block the start and the goal
+    while True:
+        rng.shuffle(cells)
+        if is_reachable(set(cells[:byte_limit]), size):
+            break
+
+    for x, y in cells:
+        yield f"{x},{y}"
+
+
+@register(19)
+def day_19(rng: Random, scale: float) -> Iterator[str]:
+    colors = "wubrg"
+    # Make a double of one color impossible, by leaving out that single color and
+    # only using it inside other patterns:
+    rare = rng.choice(colors)
+    patterns = {color for color in colors if color != rare}
+    while len(patterns) < 450:
+        pattern = "".join(rng.choices(colors, k=rng.randint(2, 8)))
+        if rare not in (pattern[0], pattern[-1]) and rare * 2 not in pattern:
+            patterns.add(pattern)
+    patterns_list = sorted(patterns)
+    rng.shuffle(patterns_list)
+    yield ", ".join(patterns_list)
+
+    yield ""
+
+    for _ in range(scaled(400, scale)):
+        length = rng.randint(20, 60)
+        if rng.random() < 0.6:
+            design = ""
+            while len(design) < length:
+                design += rng.choice(patterns_list)
+        else:
+            design = "".join(rng.choices(colors, k=length))
+            position = rng.randrange(length)
+            design = design[:position] + rare * 2 + design[position:]
+        yield design
+
+
+@register(20)
+def day_20(rng: Random, scale: float) -> Iterator[str]:
+    # A single track snaking through the grid, like in the real inputs, with lanes
+    # separated by walls of one or two thick
+    side = scaled_side(141, scale, minimum=9)
+    grid = [bytearray(b"#" * side) for _ in range(side)]
+
+    row, going_right = 1, True
+    grid[row][1] = ord("S")
+    while True:
+        grid[row][2 : side - 1] = b"." * (side - 3)
+        end_col = side - 2 if going_right else 1
+        gap = rng.choice((1, 2))
+        if row + gap + 1 >= side - 1:
+            grid[row][end_col] = ord("E")
+            break
+
+        for connection in range(row + 1, row + gap + 2):
+            grid[connection][end_col] = ord(".")
+        row, going_right = row + gap + 1, not going_right
+        grid[row][1 : side - 1] = b"." * (side - 2)
+
+    if rng.random() < 0.5:  # Transpose
+        grid = [bytearray(column) for column in zip(*grid)]
+
+    yield from grid_lines(grid)
+
+
+@register(21)
+def day_21(rng: Random, scale: float) -> Iterator[str]:
+    for _ in range(scaled(5, scale)):
+        yield f"{rng.randrange(1000):03d}A"
+
+
+@register(22)
+def day_22(rng: Random, scale: float) -> Iterator[str]:
+    for _ in range(scaled(2000, scale)):
+        yield str(rng.randrange(1, 1 << 24))
+
+
+@register(23)
+def day_23(rng: Random, scale: float) -> Iterator[str]:
+    num_nodes = scaled(520, scale, minimum=20)
+    length = 2
+    while 26**length < 1.2 * num_nodes:
+        length += 1
+    names = set()
+    while len(names) < num_nodes:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=length)))
+    nodes = sorted(names)
+    rng.shuffle(nodes)
+
+    # Plant one big clique, connect all others randomly with a similar degree:
+    degree = 13
+    edges = set()
+    clique = nodes[:degree]
+    for i, node_1 in enumerate(clique):
+        for node_2 in clique[i + 1 :]:
+            edges.add((node_1, node_2))
+
+    # Each node of the clique gets just one more connection
+    clique_set = set(clique)
+    stubs = [node for node in nodes for _ in range(1 if node in clique_set else degree)]
+    rng.shuffle(stubs)
+    for node_1, node_2 in zip(stubs[::2], stubs[1::2]):
+        if node_1 != node_2 and (node_2, node_1) not in edges:
+            edges.add((node_1, node_2))
+
+    edges_list = sorted(edges)
+    rng.shuffle(edges_list)
+    for node_1, node_2 in edges_list:
+        yield f"{node_1}-{node_2}"
+
+
+@register(24)
+def day_24(rng: Random, scale: float) -> Iterator[str]:
+    bits = scaled(45, scale, minimum=8)
+
+    names = set()
+    while len(names) < 5 * bits:  # Can't start with x, y or z
+        first = rng.choice(string.ascii_lowercase[:-3])
+        names.add(first + "".join(rng.choices(string.ascii_lowercase, k=2)))
+    internal_names = sorted(names)
+    rng.shuffle(internal_names)
+    internal = iter(internal_names)
+
+    # A ripple carry adder, with names like ``gates[(<bit>, <role>)]``
+    gates: Dict[Tuple[int, str], List[str]] = {}
+    gates[0, "z"] = ["x00", "XOR", "y00", "z00"]
+    gates[0, "carry"] = ["x00", "AND", "y00", next(internal)]
+    for bit in range(1, bits):
+        x, y, z = f"x{bit:02d}", f"y{bit:02d}", f"z{bit:02d}"
+        carry_in = gates[bit - 1, "carry"][3]
+        half_sum, half_carry, carry_part = (
+            next(internal),
+            next(internal),
+            next(internal),
+        )
+        carry = f"z{bits:02d}" if bit == bits - 1 else next(internal)
+        gates[bit, "sum"] = [x, "XOR", y, half_sum]
+        gates[bit, "and"] = [x, "AND", y, half_carry]
+        gates[bit, "z"] = [half_sum, "XOR", carry_in, z]
+        gates[bit, "carry_part"] = [half_sum, "AND", carry_in, carry_part]
+        gates[bit, "carry"] = [half_carry, "OR", carry_part, carry]
+
+    # Swap outputs like in the real inputs, of which part 2 finds the names
+    swaps = max(4, bits // 11)
+    swap_bits = rng.sample(range(2, bits - 1), swaps)
+    for i, bit in enumerate(swap_bits):
+        if i == 0:
+            pair = ("sum", "and")
+        else:
+            pair = ("z", rng.choice(("and", "carry_part", "carry")))
+        gate_1, gate_2 = gates[bit, pair[0]], gates[bit, pair[1]]
+        gate_1[3], gate_2[3] = gate_2[3], gate_1[3]
+
+    for letter in "xy":
+        for bit in range(bits):
+            yield f"{letter}{bit:02d}: {rng.randint(0, 1)}"
+
+    yield ""
+
+    lines = []
+    for input_1, logic, input_2, output in gates.values():
+        if rng.random() < 0.5:
+            input_1, input_2 = input_2, input_1
+        lines.append(f"{input_1} {logic} {input_2} -> {output}")
+    rng.shuffle(lines)
+    yield from lines
+
+
+@register(25)
+def day_25(rng: Random, scale: float) -> Iterator[str]:
+    for i in range(scaled(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        # From the top, for a key (the bottom row is full):
+        rows = [
+            "".join("#" if height >= level else "." for height in heights)
+            for level in range(6, -1, -1)
+        ]
+        if is_lock:
+            rows = rows[::-1]
+
+        if i > 0:
+            yield ""
+        yield from rows
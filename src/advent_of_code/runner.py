@@ -0,0 +1,188 @@
+import importlib
+import os
+import pkgutil
+import re
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Dict, Iterable, List, Tuple, Type
+
+import advent_of_code
+from advent_of_code.shared import Solver
+
+RE_DAY_PACKAGE = re.compile(r"day_(\d+)")
+
+INPUT_PATTERN = "day_{day:02d}.txt"  # Default name of input files in a directory
+
+
+@dataclass
+class JobResult:
+    """Outcome of solving a single day/part combination."""
+
+    day: int
+    part: int
+    answer: str | None
+    wall_time: float  # Seconds
+    cpu_time: float  # Seconds, of the worker process
+    error: str | None = None
+    profile_file: Path | None = None
+
+
+def get_solver(day: int) -> Type[Solver]:
+    """Import the module of a single day and return its puzzle solver class."""
+    module = importlib.import_module(f"advent_of_code.day_{day:02d}.__main__")
+    for obj in vars(module).values():
+        if (
+            isinstance(obj, type)
+            and issubclass(obj, Solver)
+            and obj.__module__ == module.__name__
+        ):
+            return obj
+
+    raise LookupError(f"No solver found for day {day}")
+
+
+def find_days() -> List[int]:
+    """Return the numbers of all days that have a solution package."""
+    days = []
+    for module_info in pkgutil.iter_modules(advent_of_code.__path__):
+        if match := RE_DAY_PACKAGE.fullmatch(module_info.name):
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def find_solvers() -> Dict[int, Type[Solver]]:
+    """Discover all solver classes, like ``{<day>: <solver class>}``."""
+    return {day: get_solver(day) for day in find_days()}
+
+
+def find_inputs(
+    input_dir: Path, days: Iterable[int], pattern: str = INPUT_PATTERN
+) -> Dict[int, Path]:
+    """Find input files in a directory for the given days.
+
+    Days without an input file are silently left out.
+    """
+    inputs = {}
+    for day in days:
+        input_file = input_dir / pattern.format(day=day)
+        if input_file.is_file():
+            inputs[day] = input_file
+    return inputs
+
+
+def run_job(
+    day: int,
+    part: int,
+    input_file: str | Path,
+    profile: bool = False,
+    timeout: float | None = None,
+) -> JobResult:
+    """Solve one day/part, catching any exception.
+
+    This is run inside a worker process, so it should only receive and return simple
+    objects.
+
+    :param profile: If True, write a `.pstats` file next to the input
+    :param timeout: Cancel the job after this many seconds, see ``--timeout``
+    """
+    start_wall, start_cpu = perf_counter(), process_time()
+    answer, error, profile_file = None, None, None
+    profiler = None
+    if profile:
+        # Only imported when needed, as the dispatcher imports this module too
+        from cProfile import Profile
+
+        profiler = Profile()
+    try:
+        argv = [str(input_file), "--part", str(part)]
+        if timeout is not None:
+            argv += ["--timeout", str(timeout)]
+        solver = get_solver(day)(argv)
+        with profiler or nullcontext():
+            answer = str(solver())
+        if profiler is not None:
+            profile_file = solver.output_path("pstats")
+            profiler.dump_stats(profile_file)
+    except Exception as err:
+        error = f"{type(err).__name__}: {err}"
+
+    return JobResult(
+        day=day,
+        part=part,
+        answer=answer,
+        wall_time=perf_counter() - start_wall,
+        cpu_time=process_time() - start_cpu,
+        error=error,
+        profile_file=profile_file,
+    )
+
+
+def run_all(
+    inputs: Dict[int, Path],
+    parts: Iterable[int] = (1, 2),
+    jobs: int | None = None,
+    profile: bool = False,
+    timeout: float | None = None,
+) -> Tuple[List[JobResult], float]:
+    """Solve all given days and parts concurrently.
+
+    :param inputs: Input file for each day, like ``{<day>: <path>}``
+    :param parts: Parts to run for each day
+    :param jobs: Number of worker processes (default: one per CPU)
+    :param profile: Write a `.pstats` file for each job, next to its input
+    :param timeout: Cancel each job that takes longer than this many seconds
+    :return: Results sorted with the slowest job first, and the total wall time
+    """
+    # Imported here, this takes a while and a single day is solved without it
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    start = perf_counter()
+    results: List[JobResult] = []
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(run_job, day, part, input_file, profile, timeout)
+            for day, input_file in sorted(inputs.items())
+            for part in parts
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    results.sort(key=lambda r: r.wall_time, reverse=True)
+
+    return results, perf_counter() - start
+
+
+def format_table(results: List[JobResult], total_time: float) -> str:
+    """Turn a list of results into a printable table."""
+    header = ("Day", "Part", "Answer", "Wall (s)", "CPU (s)")
+    rows = [
+        (
+            str(r.day),
+            str(r.part),
+            r.answer if r.error is None else f"ERROR: {r.error}",
+            f"{r.wall_time:.3f}",
+            f"{r.cpu_time:.3f}",
+        )
+        for r in results
+    ]
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+
+    lines = []
+    for row in [header] + rows:
+        cells = [
+            cell.ljust(width) if i == 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ]
+        lines.append("  ".join(cells))
+    lines.insert(1, "  ".join("-" * width for width in widths))
+
+    sum_of_jobs = sum(r.wall_time for r in results)
+    lines.append("")
+    lines.append(
+        f"{len(results)} jobs in {total_time:.2f} seconds "
+        f"(sum of jobs: {sum_of_jobs:.2f} seconds)"
+    )
+    return "\n".join(lines)
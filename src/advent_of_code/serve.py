@@ -0,0 +1,297 @@
+"""Long-running daemon that solves puzzles for clients on a Unix domain socket.
+
+Every day module is imported once at startup, and parsed inputs and answers are
+kept in memory, so a request only pays for the actual solving. The protocol is a
+JSON object per line in both directions, see :meth:`SolverService.handle`.
+"""
+
+import copy
+import json
+import math
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Type
+
+from advent_of_code.runner import find_solvers
+from advent_of_code.shared import Cache, Solver
+from advent_of_code.shared.cancel import Cancelled
+from advent_of_code.shared.solver import BOTH
+
+SOCKET_ENV = "AOC_SOCKET"  # Environment variable to override the socket path
+
+SUPPORTED = hasattr(socket, "AF_UNIX")  # Unix domain sockets are missing on Windows
+UNSUPPORTED = "The daemon needs Unix domain sockets, not supported on this platform"
+
+# Only so this module can still be imported without them, `Server` checks first:
+_BaseServer = socketserver.UnixStreamServer if SUPPORTED else socketserver.BaseServer
+
+
+def default_socket_path() -> Path:
+    """Get the socket path, like ``$XDG_RUNTIME_DIR/advent_of_code.sock``."""
+    if env_path := os.environ.get(SOCKET_ENV):
+        return Path(env_path)
+
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "advent_of_code.sock"
+    return Path(tempfile.gettempdir()) / f"advent_of_code-{os.getuid()}.sock"
+
+
+class SolverService:
+    """Solves requests with a pool of worker threads and warm in-memory caches.
+
+    As the code cannot change while the daemon runs, cache keys only consist of the
+    solver class and the hash of the input (and the part, for answers).
+    """
+
+    CANCEL_GRACE = 1.0
+    # Seconds to wait for a cancelled request to stop, before giving up on it (a
+    # solver without long loops that check the token cannot be stopped)
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_parsed: int = 32,
+        max_answers=10_000,
+        timeout: float | None = None,
+    ):
+        self.timeout = timeout  # Default of requests, in seconds
+        self.solvers: Dict[int, Type[Solver]] = find_solvers()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.parsed_cache = Cache(max_parsed, name="daemon parsed inputs", lock=True)
+        self.answer_cache = Cache(max_answers, name="daemon answers", lock=True)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Solve a request, and return either the result or ``{"error": <message>}``.
+
+        A request looks like ``{"day": 1, "part": 1, "input_path": <path>}``, where
+        ``part`` may also be ``"both"``, and ``input_text`` (the content) can replace
+        ``input_path``. An optional ``timeout`` (in seconds) overrides the default of
+        the service. The result looks like ``{"answers": [<answer>, ...],
+        "time": <seconds>, "parse_time": <seconds or null>, "parse_cached": <bool>,
+        "answer_cached": <bool>}``. A cancelled request gives ``"cancelled": true``
+        with the error, and ``"progress"`` if a long loop was reached.
+        """
+        try:
+            check_request(request)
+        except ValueError as err:
+            return {"error": f"Invalid request: {err}"}
+
+        timeout = request.get("timeout", self.timeout)
+        future = self.executor.submit(self.solve_request, request, timeout)
+        try:
+            return future.result(
+                timeout=None if timeout is None else timeout + self.CANCEL_GRACE
+            )
+        except Cancelled as err:
+            response = {"error": str(err), "cancelled": True}
+            if err.progress is not None:
+                response["progress"] = asdict(err.progress)
+            return response
+        except TimeoutError:  # The solver ignores its token, it keeps a worker busy
+            return {"error": f"Timed out after {timeout:g} s", "cancelled": True}
+        except Exception as err:
+            return {"error": f"{type(err).__name__}: {err}"}
+
+    def solve_request(
+        self, request: Dict[str, Any], timeout: float | None = None
+    ) -> Dict[str, Any]:
+        day = request.get("day")
+        if day not in self.solvers:
+            raise LookupError(f"No solution found for day {day}")
+        part = request.get("part", 1)
+
+        if "input_text" in request:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                input_file = Path(tmp_dir) / "input.txt"
+                input_file.write_text(request["input_text"])
+                return self.solve(self.solvers[day], part, input_file, timeout)
+
+        if "input_path" in request:
+            input_file = Path(request["input_path"])
+            return self.solve(self.solvers[day], part, input_file, timeout)
+
+        raise ValueError("Request needs either `input_path` or `input_text`")
+
+    def solve(
+        self,
+        solver_class: Type[Solver],
+        part: int | str,
+        input_file: Path,
+        timeout: float | None = None,
+    ) -> Dict[str, Any]:
+        start = perf_counter()
+        argv = [str(input_file), "--part", str(part), "--no-parse-cache"]
+        if timeout is not None:
+            argv += ["--timeout", str(timeout)]
+        try:
+            solver = solver_class(argv)
+        except SystemExit:  # From argparse, which printed why already
+            raise ValueError(f"Invalid arguments for the solver: {argv}") from None
+        parts = [1, 2] if solver.args.part == BOTH else [solver.args.part]
+        digest = solver.input_digest()
+        answer_keys = [(solver_class, number, digest) for number in parts]
+
+        answers = [self.answer_cache.get(key) for key in answer_keys]
+        if all(answer is not None for answer in answers):
+            return {
+                "answers": answers,
+                "time": perf_counter() - start,
+                "parse_time": None,
+                "parse_cached": False,
+                "answer_cached": True,
+            }
+
+        parse_time, parse_cached = None, False
+        with solver.deadline():
+            if not solver.has_phases():
+                if solver.args.part == BOTH:
+                    answers = solver.both()
+                else:
+                    answers = [solver()]
+            else:
+                parse_key = (solver_class, digest)
+                parsed = self.parsed_cache.get(parse_key)
+                parse_cached = parsed is not None
+                if parsed is None:
+                    parsed = solver.parse()
+                    self.parsed_cache.put(parse_key, parsed)
+                if solver.SOLVE_MODIFIES_INPUT:
+                    parsed = copy.deepcopy(parsed)  # Keep the cached one intact
+                parse_time = perf_counter() - start
+
+                if solver.args.part == BOTH:
+                    answers = solver.solve_both(parsed)
+                else:
+                    answers = [solver.solve(parsed)]
+
+        answers = [str(answer) for answer in answers]
+        for key, answer in zip(answer_keys, answers):
+            self.answer_cache.put(key, answer)
+
+        return {
+            "answers": answers,
+            "time": perf_counter() - start,
+            "parse_time": parse_time,
+            "parse_cached": parse_cached,
+            "answer_cached": False,
+        }
+
+
+def check_request(request: Any):
+    """Raise a ``ValueError`` if a request is malformed.
+
+    Types are compared exactly, so e.g. ``true`` is not accepted as a number.
+    """
+    if type(request) is not dict:
+        raise ValueError("expected a JSON object")
+
+    day = request.get("day")
+    if type(day) is not int:
+        raise ValueError(f"`day` must be a number, not {day!r}")
+
+    part = request.get("part", 1)
+    if type(part) not in (int, str) or part not in (1, 2, BOTH):
+        raise ValueError(f'`part` must be 1, 2 or "{BOTH}", not {part!r}')
+
+    timeout = request.get("timeout")
+    if timeout is not None and (
+        type(timeout) not in (int, float) or not 0 < timeout < math.inf
+    ):
+        raise ValueError(f"`timeout` must be a positive number, not {timeout!r}")
+
+    for key in ("input_path", "input_text"):
+        if key in request and type(request[key]) is not str:
+            raise ValueError(f"`{key}` must be a string")
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Answer each JSON line received on a connection with a JSON line."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as err:
+                response = {"error": f"Invalid request: {err}"}
+            else:
+                response = self.server.service.handle(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingMixIn, _BaseServer):
+    """Accept clients on a Unix domain socket, each in its own thread."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, service: SolverService):
+        if not SUPPORTED:
+            raise RuntimeError(UNSUPPORTED)
+        self.service = service
+        self.socket_path = socket_path
+        if socket_path.is_socket():
+            if is_listening(socket_path):
+                raise RuntimeError(f"A daemon is already listening on `{socket_path}`")
+            socket_path.unlink()  # Left behind by a daemon that was killed
+        super().__init__(str(socket_path), RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+        self.service.close()
+
+
+def is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def request(message: Dict[str, Any], socket_path: Path | None = None) -> Dict:
+    """Send a request to a running daemon and wait for the response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path or default_socket_path()))
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(message).encode() + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def serve(
+    socket_path: Path | None = None, workers: int = 4, timeout: float | None = None
+):
+    """Run the daemon until interrupted (or terminated).
+
+    :param timeout: Default time limit of requests, in seconds
+    """
+    if not SUPPORTED:
+        raise RuntimeError(UNSUPPORTED)
+
+    socket_path = socket_path or default_socket_path()
+    service = SolverService(workers=workers, timeout=timeout)
+    with Server(socket_path, service) as server:
+
+        def stop(*_):
+            # `shutdown` waits for the loop below, which runs in this same thread
+            threading.Thread(target=server.shutdown).start()
+
+        signal.signal(signal.SIGTERM, stop)
+        print(f"Serving {len(service.solvers)} days on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -1,5 +1,55 @@
-from .coordinates import Direction  # noqa
-from .graph import Edge, EdgeBase, EdgeBidirectional, Graph, Node  # noqa
-from .grid import Grid, GridItem, RowCol  # noqa
-from .priority_list import PriorityList  # noqa
-from .solver import Solver, main  # noqa
+"""Code shared between the days.
+
+Attributes are imported lazily on first access (PEP 562), so a day only loads the
+modules (and third-party packages like `bidict`) it actually uses.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule that defines it
+_ATTRIBUTES = {
+    "Cache": "cache",
+    "memoize": "cache",
+    "Direction": "coordinates",
+    "Edge": "graph",
+    "EdgeBase": "graph",
+    "EdgeBidirectional": "graph",
+    "Graph": "graph",
+    "Node": "graph",
+    "NULL_PROGRESS": "progress",
+    "NullProgress": "progress",
+    "Progress": "progress",
+    "Grid": "grid",
+    "GridItem": "grid",
+    "RowCol": "grid",
+    "PriorityList": "priority_list",
+    "Solver": "solver",
+    "main": "solver",
+}
+
+__all__ = list(_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .cache import Cache, memoize  # noqa
+    from .coordinates import Direction  # noqa
+    from .graph import Edge, EdgeBase, EdgeBidirectional, Graph, Node  # noqa
+    from .grid import Grid, GridItem, RowCol  # noqa
+    from .priority_list import PriorityList  # noqa
+    from .progress import NULL_PROGRESS, NullProgress, Progress  # noqa
+    from .solver import Solver, main  # noqa
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Skip this function next time
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,91 @@
+"""Solve many input files for the same day in parallel, see ``--batch``."""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from time import perf_counter
+from typing import Any, Dict, List, Sequence, TextIO, Type
+
+from .cancel import Cancelled
+from .solver import Solver, solve_timed
+
+MAX_CHUNK_SIZE = 64
+CHUNKS_PER_WORKER = 4  # Fewer, larger chunks mean less overhead but worse balancing
+
+
+def chunk_size(files: int, jobs: int) -> int:
+    """Number of files to hand to a worker at once."""
+    return max(1, min(MAX_CHUNK_SIZE, files // (jobs * CHUNKS_PER_WORKER)))
+
+
+def solve_file(
+    cli_class: Type[Solver], input_file: str, argv: Sequence[str]
+) -> Dict[str, Any]:
+    """Solve a single file, catching any exception.
+
+    :param argv: Command line arguments for the solver, except the input file
+    """
+    start = perf_counter()
+    result: Dict[str, Any] = {"input": input_file}
+    try:
+        solver = cli_class([input_file, *argv])
+        answers, parse_duration = solve_timed(solver)
+        result["answers"] = [str(answer) for answer in answers]
+        result["parse_time"] = parse_duration
+    except Exception as err:
+        result["error"] = f"{type(err).__name__}: {err}"
+        if isinstance(err, Cancelled) and err.progress is not None:
+            result["progress"] = asdict(err.progress)
+
+    result["time"] = perf_counter() - start
+    return result
+
+
+def solve_chunk(
+    cli_class: Type[Solver], input_files: List[str], argv: Sequence[str]
+) -> List[Dict[str, Any]]:
+    return [solve_file(cli_class, input_file, argv) for input_file in input_files]
+
+
+def run_batch(
+    cli_class: Type[Solver],
+    input_files: Sequence[str],
+    argv: Sequence[str],
+    jobs: int | None = None,
+    stream: TextIO | None = None,
+) -> int:
+    """Solve all files on a pool of processes, writing a JSON line per file.
+
+    Lines are written as soon as their chunk of files is done, so they are not in
+    the order of the input files.
+
+    :param argv: Command line arguments for the solver of each file
+    :param stream: Where to write the lines (default: stdout)
+    :return: The number of files that failed
+    """
+    stream = stream or sys.stdout
+    jobs = jobs or os.cpu_count() or 1
+    size = chunk_size(len(input_files), jobs)
+    chunks = [list(input_files[i : i + size]) for i in range(0, len(input_files), size)]
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(solve_chunk, cli_class, chunk, argv): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as err:  # E.g. a worker process got killed
+                error = f"{type(err).__name__}: {err}"
+                results = [{"input": file, "error": error} for file in futures[future]]
+
+            for result in results:
+                failed += "error" in result
+                stream.write(json.dumps(result) + "\n")
+            stream.flush()
+
+    return failed
@@ -0,0 +1,245 @@
+"""Bounded in-memory caches with hit/miss/eviction counters.
+
+Use :class:`Cache` directly, or :func:`memoize` to cache the results of a function.
+All caches are registered (weakly), so their counters can be printed with
+:func:`print_cache_stats` (see ``--stats``, which also keeps the caches of a run
+alive until they are printed).
+"""
+
+import functools
+import sys
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, TextIO, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+LRU = "lru"  # Evict the least recently used entry first
+LFU = "lfu"  # Evict the least frequently used entry first (oldest among equals)
+
+_MISSING = object()
+
+CACHES: "weakref.WeakSet[Cache]" = weakref.WeakSet()  # All caches that exist
+
+
+class Cache(Generic[K, V]):
+    """Mapping with a limited number of entries.
+
+    Both eviction policies take constant time per operation.
+
+    :param max_entries: Maximum size (default: unlimited)
+    :param policy: :data:`LRU` or :data:`LFU`
+    :param name: Shown in the statistics
+    :param lock: Make it safe to use from multiple threads
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        policy: str = LRU,
+        name: str = "cache",
+        lock: bool = False,
+    ):
+        if policy not in (LRU, LFU):
+            raise ValueError(f"Unknown eviction policy `{policy}`")
+
+        self.max_entries = max_entries
+        self.policy = policy
+        self.name = name
+        self._lock = threading.Lock() if lock else None
+
+        self._entries: Dict[K, V] | OrderedDict[K, V] = OrderedDict()
+        # For LFU, the use count of each key and the keys per use count (oldest
+        # first):
+        self._uses: Dict[K, int] = {}
+        self._keys_by_uses: defaultdict[int, OrderedDict[K, None]] = defaultdict(
+            OrderedDict
+        )
+        self._min_uses = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        CACHES.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """Return the stored value (counted as a use), or the default."""
+        if self._lock is not None:
+            with self._lock:
+                return self._get(key, default)
+        return self._get(key, default)
+
+    def put(self, key: K, value: V):
+        if self._lock is not None:
+            with self._lock:
+                return self._put(key, value)
+        return self._put(key, value)
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        """Return the stored value, or compute and store it."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        if self._lock is not None:
+            with self._lock:
+                return self._clear()
+        return self._clear()
+
+    def _get(self, key: K, default: Any) -> V | Any:
+        entries = self._entries
+        if key not in entries:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        if self.policy == LRU:
+            entries.move_to_end(key)
+        else:
+            self._touch(key)
+        return entries[key]
+
+    def _put(self, key: K, value: V):
+        if key in self._entries:
+            self._entries[key] = value
+            self._touch(key)
+            return
+
+        if self.max_entries is not None and len(self._entries) >= self.max_entries:
+            self._evict()
+
+        self._entries[key] = value
+        if self.policy == LFU:
+            self._uses[key] = 1
+            self._keys_by_uses[1][key] = None
+            self._min_uses = 1
+
+    def _clear(self):
+        self._entries.clear()
+        self._uses.clear()
+        self._keys_by_uses.clear()
+        self._min_uses = 0
+
+    def _touch(self, key: K):
+        if self.policy == LRU:
+            self._entries.move_to_end(key)
+            return
+
+        uses = self._uses[key]
+        keys = self._keys_by_uses[uses]
+        del keys[key]
+        if not keys:
+            del self._keys_by_uses[uses]
+            if self._min_uses == uses:
+                self._min_uses = uses + 1
+
+        self._uses[key] = uses + 1
+        self._keys_by_uses[uses + 1][key] = None
+
+    def _evict(self):
+        if not self._entries:
+            return
+
+        if self.policy == LRU:
+            self._entries.popitem(last=False)
+        else:
+            keys = self._keys_by_uses[self._min_uses]
+            key, _ = keys.popitem(last=False)
+            if not keys:
+                del self._keys_by_uses[self._min_uses]
+            del self._uses[key]
+            del self._entries[key]
+
+        self.evictions += 1
+
+
+def memoize(
+    max_entries: int | None = None, policy: str = LRU, per_instance: bool = False
+) -> Callable[[Callable], Callable]:
+    """Decorator to cache the results of a function, by its positional arguments.
+
+    The arguments must be hashable. By default a single cache is shared by all
+    calls, available as ``<function>.cache``. With ``per_instance``, a method gets a
+    separate cache for each instance instead (so it goes away with the instance),
+    see ``<method>.cache_of(<instance>)``.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+
+        if not per_instance:
+            cache = Cache(max_entries, policy, name=name)
+
+            @functools.wraps(func)
+            def wrapper(*args):
+                value = cache.get(args, _MISSING)
+                if value is _MISSING:
+                    value = func(*args)
+                    cache.put(args, value)
+                return value
+
+            wrapper.cache = cache
+            return wrapper
+
+        attribute = f"_cache_{func.__name__}"
+
+        def cache_of(instance) -> Cache:
+            instance_cache = instance.__dict__.get(attribute)
+            if instance_cache is None:
+                instance_cache = Cache(max_entries, policy, name=name)
+                instance.__dict__[attribute] = instance_cache
+            return instance_cache
+
+        @functools.wraps(func)
+        def method_wrapper(self, *args):
+            instance_cache = cache_of(self)
+            value = instance_cache.get(args, _MISSING)
+            if value is _MISSING:
+                value = func(self, *args)
+                instance_cache.put(args, value)
+            return value
+
+        method_wrapper.cache_of = cache_of
+        return method_wrapper
+
+    return decorator
+
+
+def print_cache_stats(
+    caches: Iterable[Cache] | None = None, stream: TextIO | None = None
+):
+    """Print the counters of the caches that were used (default: all that exist)."""
+    stream = stream or sys.stdout
+    caches = sorted(
+        (cache for cache in caches or CACHES if cache.hits or cache.misses),
+        key=lambda cache: cache.name,
+    )
+    if not caches:
+        return
+
+    print("\nCaches:", file=stream)
+    width = max(len(cache.name) for cache in caches)
+    for cache in caches:
+        print(
+            f"  {cache.name:<{width}}  {cache.hits:>10,} hits  {cache.misses:>10,} "
+            f"misses  {cache.evictions:>10,} evictions  ({cache.hit_rate:.1%} hits, "
+            f"{len(cache):,} entries)",
+            file=stream,
+        )
@@ -0,0 +1,65 @@
+"""Cooperative cancellation of long runs, see ``--timeout``.
+
+A run cannot be interrupted safely from outside, so instead its long loops check a
+:class:`CancelToken` (through :meth:`.Progress.update`) and stop by raising
+:class:`Cancelled`.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .progress import ProgressReport
+
+TIMEOUT_EXIT_CODE = 124  # Like the `timeout` command
+
+
+class Cancelled(Exception):
+    """Raised inside a run once its token was cancelled."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.progress: "ProgressReport | None" = None  # Of the innermost loop, if any
+
+
+class CancelToken:
+    """Flag for a run, set from another thread (e.g. by a timer).
+
+    Checking it is a single attribute lookup, so loops can do so every iteration.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self.reason = "Cancelled"
+        self._timer: threading.Timer | None = None
+
+    def cancel(self, reason: str = "Cancelled"):
+        self.reason = reason
+        self.cancelled = True
+
+    def check(self):
+        """Raise :class:`Cancelled` if the run was cancelled."""
+        if self.cancelled:
+            raise Cancelled(self.reason)
+
+    @contextmanager
+    def timeout(self, seconds: float) -> Iterator["CancelToken"]:
+        """Context after which the token gets cancelled.
+
+        Nested contexts keep the outer timer.
+        """
+        if self._timer is not None:
+            yield self
+            return
+
+        self._timer = threading.Timer(
+            seconds, self.cancel, args=(f"Timed out after {seconds:g} s",)
+        )
+        self._timer.daemon = True
+        self._timer.start()
+        try:
+            yield self
+        finally:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,147 @@
+import os
+import pickle
+import struct
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, List, Tuple
+
+CACHE_DIR_ENV = "AOC_CACHE_DIR"  # Environment variable to override the location
+
+
+def default_cache_dir() -> Path:
+    """Get the root directory for caches, like ``~/.cache/advent_of_code``."""
+    if env_dir := os.environ.get(CACHE_DIR_ENV):
+        return Path(env_dir)
+
+    xdg_dir = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_dir) if xdg_dir else Path.home() / ".cache"
+    return base / "advent_of_code"
+
+
+class CorruptEntryError(ValueError):
+    """Raised by :func:`loads` for data that cannot be decoded (e.g. truncated)."""
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object with pickle protocol 5.
+
+    Large buffers that support it are stored out-of-band, after the pickle stream,
+    so they don't need to be copied while pickling. The layout is a header with
+    the number of chunks and their lengths, followed by the chunks themselves.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    chunks = [data] + [buffer.raw() for buffer in buffers]
+    lengths = [memoryview(chunk).nbytes for chunk in chunks]
+
+    header = struct.pack(f"<I{len(chunks)}Q", len(chunks), *lengths)
+    return b"".join([header] + chunks)
+
+
+def loads(blob: bytes) -> Any:
+    """Counterpart of :func:`dumps`.
+
+    Any failure to decode the data raises a :class:`CorruptEntryError`.
+    """
+    view = memoryview(blob)
+    try:
+        (count,) = struct.unpack_from("<I", view)
+        lengths = struct.unpack_from(f"<{count}Q", view, 4)
+    except struct.error as err:
+        raise CorruptEntryError(f"Invalid header: {err}") from err
+
+    position = 4 + 8 * count
+    if count < 1 or position + sum(lengths) != view.nbytes:
+        raise CorruptEntryError("Size does not match the header")
+
+    chunks = []
+    for length in lengths:
+        chunks.append(view[position : position + length])
+        position += length
+
+    try:
+        return pickle.loads(chunks[0], buffers=chunks[1:])
+    except Exception as err:  # Unpickling garbage can fail in many ways
+        raise CorruptEntryError(f"Cannot unpickle: {err!r}") from err
+
+
+class DiskCache:
+    """Directory of files with a size limit, where the least recently used go first.
+
+    Entries are identified by a key string. Reading an entry updates its
+    modification time, which is what the eviction is based on.
+    """
+
+    SUFFIX = ".bin"
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path(self, key: str) -> Path:
+        """Get the file belonging to a key (keys are hashed into a filename)."""
+        return self.directory / (sha256(key.encode()).hexdigest() + self.SUFFIX)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the stored data, or ``None``."""
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        """Store data (atomically) and evict old entries if needed."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def entries(self) -> List[Tuple[Path, os.stat_result]]:
+        """Get the stats of each entry, with the least recently used first."""
+        entries = []
+        for path in self.directory.glob("*" + self.SUFFIX):
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                continue  # Removed in the meantime
+
+        entries.sort(key=lambda entry: entry[1].st_mtime_ns)
+        return entries
+
+    def evict(self):
+        """Remove the least recently used entries until within the limits."""
+        entries = self.entries()
+        total_bytes = sum(stat.st_size for _, stat in entries)
+
+        while entries and (
+            (self.max_bytes is not None and total_bytes > self.max_bytes)
+            or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            path, stat = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
+            self.evictions += 1
+
+    def clear(self):
+        """Remove all entries."""
+        for path, _ in self.entries():
+            path.unlink(missing_ok=True)
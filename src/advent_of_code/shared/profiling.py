@@ -0,0 +1,457 @@
+import importlib
+import importlib.util
+import linecache
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from cProfile import Profile
+from pathlib import Path
+from time import perf_counter, perf_counter_ns, sleep
+from types import CodeType, FunctionType, ModuleType
+from typing import Callable, Dict, Iterator, List, Set, TextIO, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def print_profile(profiler: Profile, top: int = 20, stream: TextIO | None = None):
+    """Print the most expensive functions, by cumulative and by own (self) time."""
+    stream = stream or sys.stdout
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs()
+
+    for sort_key, title in [("cumulative", "cumulative"), ("tottime", "self")]:
+        print(f"\nTop {top} functions by {title} time:", file=stream)
+        stats.sort_stats(sort_key).print_stats(top)
+
+
+class SampleProfiler:
+    """Context manager that samples the stack of the thread that enters it.
+
+    Unlike cProfile, nothing is added to the profiled code: a background thread
+    wakes up at a fixed interval and walks the current frame of the profiled thread
+    (from ``sys._current_frames()``). Stacks are counted as tuples of code objects,
+    which are only turned into names at the end. The time spent sampling (while the
+    profiled thread waits for the GIL) is measured as :attr:`overhead`.
+
+    The actual rate is lower than the interval suggests, as the sampler has to wait
+    for the profiled thread to release the GIL, see ``sys.getswitchinterval()``.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval  # Seconds between samples
+        self.stacks: Counter[Tuple[CodeType, ...]] = Counter()  # Outermost first
+        self.samples = 0
+        self.duration = 0.0
+        self.overhead = 0.0  # Seconds spent taking samples
+        self._thread_id: int | None = None
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self):
+        self._thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._running = True
+        self._start = perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.duration = perf_counter() - self._start
+        self._running = False
+        self._thread.join()
+
+    def _sample(self):
+        # A plain sleep needs the GIL only once per wake-up, unlike `Event.wait`
+        thread_id, stacks, interval = self._thread_id, self.stacks, self.interval
+        while True:
+            sleep(interval)
+            if not self._running:
+                return
+
+            start = perf_counter()
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stack.reverse()
+            stacks[tuple(stack)] += 1
+            self.samples += 1
+            self.overhead += perf_counter() - start
+
+    @staticmethod
+    def label(code: CodeType) -> str:
+        """Name of a frame, like ``Machine.do_instruction (__main__.py:42)``."""
+        filename = Path(code.co_filename).name
+        return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+    def collapsed(self) -> List[str]:
+        """Get the stacks in the collapsed format of FlameGraph, most common first.
+
+        Each line is like ``main;solve;next_secret 123``, which can be rendered by
+        e.g. ``flamegraph.pl``, speedscope or inferno.
+        """
+        labels: Dict[CodeType, str] = {}
+        lines = []
+        for stack, count in self.stacks.most_common():
+            names = []
+            for code in stack:
+                if code not in labels:
+                    labels[code] = self.label(code).replace(";", ":")
+                names.append(labels[code])
+            lines.append(f"{';'.join(names)} {count}")
+        return lines
+
+    def write_collapsed(self, path: Path):
+        path.write_text("".join(line + "\n" for line in self.collapsed()))
+
+    def top_functions(self, top: int = 20) -> List[Tuple[str, int, int]]:
+        """Get the functions with the most samples, like ``(<label>, <self>, <total>)``.
+
+        Sorted by the samples in the function itself (the innermost frame).
+        """
+        own: Counter[CodeType] = Counter()
+        total: Counter[CodeType] = Counter()
+        for stack, count in self.stacks.items():
+            if stack:
+                own[stack[-1]] += count
+            for code in set(stack):  # Count recursive functions once per sample
+                total[code] += count
+        return [
+            (self.label(code), count, total[code])
+            for code, count in own.most_common(top)
+        ]
+
+
+def print_samples(
+    profiler: SampleProfiler, top: int = 20, stream: TextIO | None = None
+):
+    """Print the functions where most samples were taken."""
+    stream = stream or sys.stdout
+    duration = profiler.duration or float("inf")
+    print(
+        f"\n{profiler.samples:,} samples in {profiler.duration:.2f} seconds "
+        f"({profiler.samples / duration:,.0f}/s, sampling took "
+        f"{profiler.overhead / duration:.2%} of the time), top {top} functions by "
+        "self samples:",
+        file=stream,
+    )
+    if not profiler.samples:
+        return
+
+    print(f"  {'self':>6}  {'total':>6}  function", file=stream)
+    for label, own, total in profiler.top_functions(top):
+        print(
+            f"  {own / profiler.samples:>6.1%}  {total / profiler.samples:>6.1%}  "
+            f"{label}",
+            file=stream,
+        )
+
+
+def find_module(name: str) -> ModuleType:
+    """Get a module by name, where a package means its ``__main__`` module.
+
+    A day run as ``python -m advent_of_code.day_<nn>`` is loaded as ``__main__``, so
+    loaded modules are matched by file, to not import a second copy of it.
+    """
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named `{name}`")
+    if spec.submodule_search_locations is not None:
+        spec = importlib.util.find_spec(f"{name}.__main__") or spec
+
+    origin = Path(spec.origin).resolve()
+    for module in list(sys.modules.values()):
+        file = getattr(module, "__file__", None)
+        if file is not None and Path(file).resolve() == origin:
+            return module
+    return importlib.import_module(spec.name)
+
+
+def iterate_code_objects(module: ModuleType) -> Iterator[CodeType]:
+    """Yield the code of all functions defined in a module, including nested ones."""
+    seen: Set[int] = set()  # Ids of the visited objects
+    filename = getattr(module, "__file__", None)
+
+    def from_code(code: CodeType) -> Iterator[CodeType]:
+        if code.co_filename != filename or id(code) in seen:
+            return
+        seen.add(id(code))
+        yield code
+        for const in code.co_consts:  # Nested functions, lambdas, comprehensions
+            if isinstance(const, CodeType):
+                yield from from_code(const)
+
+    def from_object(obj) -> Iterator[CodeType]:
+        if isinstance(obj, (staticmethod, classmethod)):
+            obj = obj.__func__
+        elif isinstance(obj, property):
+            for accessor in (obj.fget, obj.fset, obj.fdel):
+                yield from from_object(accessor)
+            return
+
+        if isinstance(obj, type):
+            if obj.__module__ == module.__name__ and id(obj) not in seen:
+                seen.add(id(obj))
+                for value in vars(obj).values():
+                    yield from from_object(value)
+            return
+
+        # Follow decorators (that use `functools.wraps`) to the original function
+        while obj is not None:
+            if isinstance(obj, FunctionType):
+                yield from from_code(obj.__code__)
+            obj = getattr(obj, "__wrapped__", None)
+
+    for value in list(vars(module).values()):
+        yield from from_object(value)
+
+
+class LineProfiler:
+    """Context manager that times each line of the functions of one module.
+
+    This uses ``sys.monitoring`` (Python 3.12+). Events are only enabled for the
+    code of the module, so all other code runs at full speed. The time of a line
+    lasts until the next line of the same call, so it includes the functions it
+    calls.
+    """
+
+    TOOL_NAME = "advent_of_code line profiler"
+
+    def __init__(self, module: ModuleType):
+        if not hasattr(sys, "monitoring"):
+            raise RuntimeError("Line profiling needs Python 3.12 or newer")
+
+        self.module = module
+        self.codes = list(iterate_code_objects(module))
+        self.hits: Counter[Tuple[CodeType, int]] = Counter()
+        self.times: Counter[Tuple[CodeType, int]] = Counter()  # In nanoseconds
+        self._stack: List[list] = []  # Calls like ``[<code>, <line>, <line start>]``
+        self._tool_id: int | None = None
+
+    def _callbacks(self) -> Dict[int, Callable]:
+        events = sys.monitoring.events
+        return {
+            events.PY_START: self._start,
+            events.PY_RESUME: self._start,
+            events.LINE: self._line,
+            events.PY_RETURN: self._return,
+            events.PY_YIELD: self._return,
+        }
+
+    def __enter__(self):
+        monitoring = sys.monitoring
+        free_ids = [i for i in range(6) if monitoring.get_tool(i) is None]
+        if not free_ids:
+            raise RuntimeError("No free `sys.monitoring` tool ID for line profiling")
+        if monitoring.PROFILER_ID in free_ids:
+            self._tool_id = monitoring.PROFILER_ID
+        else:  # E.g. taken by cProfile
+            self._tool_id = free_ids[-1]
+        monitoring.use_tool_id(self._tool_id, self.TOOL_NAME)
+
+        events = 0
+        for event, callback in self._callbacks().items():
+            monitoring.register_callback(self._tool_id, event, callback)
+            events |= event
+        for code in self.codes:
+            monitoring.set_local_events(self._tool_id, code, events)
+        return self
+
+    def __exit__(self, *exc_info):
+        monitoring = sys.monitoring
+        for code in self.codes:
+            monitoring.set_local_events(self._tool_id, code, 0)
+        for event in self._callbacks():
+            monitoring.register_callback(self._tool_id, event, None)
+        monitoring.free_tool_id(self._tool_id)
+        self._tool_id = None
+
+    def _start(self, code: CodeType, _offset: int):
+        self._stack.append([code, None, 0])
+
+    def _line(self, code: CodeType, line: int):
+        now = perf_counter_ns()
+        stack = self._stack
+        while stack and stack[-1][0] is not code:
+            self._end_call(now)  # Left by an exception
+        if not stack:  # A call that started before profiling
+            stack.append([code, None, 0])
+
+        call = stack[-1]
+        if call[1] is not None:
+            self.times[code, call[1]] += now - call[2]
+        call[1], call[2] = line, now
+        self.hits[code, line] += 1
+
+    def _return(self, code: CodeType, _offset: int, _value: object):
+        now = perf_counter_ns()
+        while self._stack:
+            if self._end_call(now) is code:
+                break
+
+    def _end_call(self, now: int) -> CodeType:
+        code, line, start = self._stack.pop()
+        if line is not None:
+            self.times[code, line] += now - start
+        return code
+
+    def functions(self) -> List[Tuple[CodeType, int]]:
+        """Get the functions that ran, with their total time (ns), slowest first."""
+        totals: Counter[CodeType] = Counter({code: 0 for code, _ in self.hits})
+        for (code, _), time in self.times.items():
+            totals[code] += time
+        return totals.most_common()
+
+
+def print_line_profile(
+    profiler: LineProfiler, top: int = 20, stream: TextIO | None = None
+):
+    """Print the source of the slowest functions, with the hits and time per line."""
+    stream = stream or sys.stdout
+    functions = profiler.functions()
+    print(
+        f"\nLine profile of `{profiler.module.__name__}`, top {top} of "
+        f"{len(functions)} functions that ran:",
+        file=stream,
+    )
+
+    for code, total in functions[:top]:
+        lines = [line for _, _, line in code.co_lines() if line is not None]
+        first, last = code.co_firstlineno, max(lines, default=code.co_firstlineno)
+        print(
+            f"\n{code.co_qualname} ({Path(code.co_filename).name}:{first}): "
+            f"{total / 1e9:.3f} seconds",
+            file=stream,
+        )
+        print(
+            f"  {'Line':>5}  {'Hits':>10}  {'Time (ms)':>10}  {'Per hit (us)':>12}  "
+            f"{'% Time':>6}  Source",
+            file=stream,
+        )
+        for line in range(first, last + 1):
+            source = linecache.getline(code.co_filename, line).rstrip()
+            hits = profiler.hits.get((code, line), 0)
+            if not hits:
+                blank = f"{'':>10}  {'':>10}  {'':>12}  {'':>6}"
+                print(f"  {line:>5}  {blank}  {source}", file=stream)
+                continue
+
+            time = profiler.times.get((code, line), 0)
+            share = time / total if total else 0.0
+            print(
+                f"  {line:>5}  {hits:>10,}  {time / 1e6:>10.1f}  "
+                f"{time / 1e3 / hits:>12.2f}  {share:>6.1%}  {source}",
+                file=stream,
+            )
+
+
+def get_rss() -> int | None:
+    """Get the current resident set size of this process in bytes, if possible."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None  # Not Linux
+
+
+def get_peak_rss() -> int | None:
+    """Get the highest resident set size of this process in bytes, if possible."""
+    if resource is None:
+        return None  # E.g. on Windows
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class MemoryTracer:
+    """Context manager to trace Python memory allocations with `tracemalloc`.
+
+    A snapshot at the end of a run misses everything that was freed already, so a
+    background thread takes a new snapshot each time the traced memory grows
+    significantly beyond the previous one. The sites are reported from the snapshot
+    closest to the peak.
+    """
+
+    INTERVAL = 0.05  # Seconds between checks of the traced memory
+    GROWTH = 1.2  # Take a new snapshot above this factor of the previous one
+
+    def __init__(self):
+        self.peak = 0
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_size = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self):
+        tracemalloc.start()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._take_snapshot()
+        _, self.peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    def _sample(self):
+        while not self._stop.wait(self.INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._snapshot_size * self.GROWTH:
+                self._take_snapshot()
+
+    def _take_snapshot(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current <= self._snapshot_size:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        self.snapshot, self._snapshot_size = snapshot, current
+
+    def top_sites(self, top: int = 10) -> List[tracemalloc.Statistic]:
+        """Get the allocation sites using the most memory, grouped by file:line."""
+        if self.snapshot is None:
+            return []
+        return self.snapshot.statistics("lineno")[:top]
+
+
+def format_bytes(size: int) -> str:
+    """Turn a number of bytes into a readable string, like ``"1.5 MB"``."""
+    if size < 1e3:
+        return f"{size} B"
+    if size < 1e6:
+        return f"{size / 1e3:.1f} kB"
+    if size < 1e9:
+        return f"{size / 1e6:.1f} MB"
+    return f"{size / 1e9:.1f} GB"
+
+
+def print_memory(tracer: MemoryTracer, top: int = 10, stream: TextIO | None = None):
+    """Print the memory usage and top allocation sites of a traced run."""
+    stream = stream or sys.stdout
+
+    usage = [f"peak traced: {format_bytes(tracer.peak)}"]
+    if (rss := get_rss()) is not None:
+        usage.append(f"final RSS: {format_bytes(rss)}")
+    if (peak_rss := get_peak_rss()) is not None:
+        usage.append(f"peak RSS: {format_bytes(peak_rss)}")
+    print(f"(Memory - {', '.join(usage)})", file=stream)
+
+    print(f"\nTop {top} allocation sites near the peak:", file=stream)
+    for statistic in tracer.top_sites(top):
+        frame = statistic.traceback[0]
+        print(
+            f"  {frame.filename}:{frame.lineno}: {format_bytes(statistic.size)} "
+            f"in {statistic.count} blocks",
+            file=stream,
+        )
@@ -0,0 +1,161 @@
+"""Progress reports for long loops, see ``--progress``.
+
+A loop calls :meth:`Progress.update` for each iteration, which is also where a run
+gets cancelled (see ``--timeout``). Without a sink or a timeout the tracker is
+:data:`NULL_PROGRESS`, whose methods do nothing.
+"""
+
+import json
+import sys
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Callable, TextIO
+
+from .cancel import Cancelled, CancelToken
+
+
+@dataclass
+class ProgressReport:
+    """Snapshot of a loop."""
+
+    label: str
+    count: int  # Iterations so far
+    total: int | None  # Expected number of iterations, if known
+    elapsed: float  # Seconds
+    rate: float  # Iterations per second
+    eta: float | None  # Seconds until done, if the total is known
+    done: bool = False
+
+    def __str__(self) -> str:
+        text = f"[{self.label}] {self.count:,}"
+        if self.total:
+            text += f" / {self.total:,} ({self.count / self.total:.0%})"
+        text += f" in {self.elapsed:.1f} s ({self.rate:,.0f}/s)"
+        if self.done:
+            text += ", done"
+        elif self.eta is not None:
+            text += f", ETA {self.eta:.1f} s"
+        return text
+
+
+Sink = Callable[[ProgressReport], None]
+
+
+class TextSink:
+    """Write reports as readable lines, to stderr by default."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream
+
+    def __call__(self, report: ProgressReport):
+        print(report, file=self.stream or sys.stderr, flush=True)
+
+
+class JsonSink:
+    """Write reports as JSON lines, to stderr by default."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream
+
+    def __call__(self, report: ProgressReport):
+        print(json.dumps(asdict(report)), file=self.stream or sys.stderr, flush=True)
+
+
+class Progress:
+    """Count the iterations of a loop and report to a sink at an interval.
+
+    If the cancel token is set, it is checked on each update. The
+    :class:`~.cancel.Cancelled` exception then gets a report of how far the loop got.
+
+    Use as a context manager, to also report when the loop is done::
+
+        with Progress("search", total=len(items), sink=TextSink()) as progress:
+            for item in items:
+                ...
+                progress.update()
+    """
+
+    def __init__(
+        self,
+        label: str,
+        total: int | None,
+        sink: Sink | None,
+        interval: float = 1.0,
+        cancel: CancelToken | None = None,
+    ):
+        self.label = label
+        self.total = total
+        self.sink = sink
+        self.interval = interval
+        self.cancel = cancel
+
+        self.count = 0
+        self.start = perf_counter()
+        self._next_report = self.start + interval
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+            return
+
+        # Stopped early, so report how far it got rather than that it is done
+        report = self.report(perf_counter())
+        if isinstance(exc, Cancelled) and exc.progress is None:
+            exc.progress = report  # Unless an inner loop set it already
+        if self.sink is not None:
+            self.sink(report)
+
+    def update(self, count: int = 1):
+        self.count += count
+        if self.cancel is not None:
+            self.cancel.check()
+        if self.sink is None:
+            return
+
+        now = perf_counter()
+        if now >= self._next_report:
+            self._next_report = now + self.interval
+            self.sink(self.report(now))
+
+    def close(self):
+        if self.sink is not None:
+            self.sink(self.report(perf_counter(), done=True))
+
+    def report(self, now: float, done: bool = False) -> ProgressReport:
+        elapsed = now - self.start
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(self.total - self.count, 0) / rate
+
+        return ProgressReport(
+            label=self.label,
+            count=self.count,
+            total=self.total,
+            elapsed=elapsed,
+            rate=rate,
+            eta=eta,
+            done=done,
+        )
+
+
+class NullProgress:
+    """Stand-in for :class:`Progress` that does nothing, when nobody is listening."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def update(self, count: int = 1):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_PROGRESS = NullProgress()
@@ -0,0 +1,111 @@
+"""Machine-readable records of runs, with resource usage, see ``--json``."""
+
+import gc
+import json
+import os
+import platform
+import re
+import sys
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence
+
+from .profiling import get_peak_rss
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from .solver import Solver
+
+STDOUT = "-"  # Value of ``--json`` to write to stdout
+
+
+def get_cpu_times() -> tuple[float, float] | None:
+    """Get the user and system CPU time of this process so far, if possible."""
+    if resource is None:
+        return None
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime, usage.ru_stime
+
+
+def get_gc_counts() -> List[int]:
+    """Get the number of garbage collections so far, per generation."""
+    return [generation["collections"] for generation in gc.get_stats()]
+
+
+class RunRecorder:
+    """Take the resource usage at the start of a run, to report what it used."""
+
+    def __init__(self):
+        self.timestamp = datetime.now(timezone.utc)
+        self.cpu_start = get_cpu_times()
+        self.gc_start = get_gc_counts()
+
+    def record(
+        self,
+        solver: "Solver",
+        answers: Sequence[str] | None,
+        duration: float,
+        parse_time: float | None,
+        **fields: Any,
+    ) -> Dict[str, Any]:
+        """Get the record of the run, with the resources used since the start.
+
+        :param answers: ``None`` if the run failed
+        :param duration: Wall time of the run, in seconds
+        :param fields: Extra fields, like ``error``
+        """
+        name = type(solver).__name__
+        day = re.search(r"\d+", name)
+
+        record: Dict[str, Any] = {
+            "timestamp": self.timestamp.isoformat(),
+            "solver": name,
+            "day": int(day.group()) if day else None,
+            "part": solver.args.part,
+            "input": str(solver.input_file),
+            "input_digest": None if solver.is_stdin() else solver.input_digest(),
+            "input_size": (
+                None if solver.is_stdin() else os.stat(solver.input_file).st_size
+            ),
+            "answers": None if answers is None else [str(a) for a in answers],
+            "time": duration,
+            "parse_time": parse_time,
+            "solve_time": None if parse_time is None else duration - parse_time,
+            "parse_cached": bool(solver.parse_cache_hit),
+        }
+
+        cpu_end = get_cpu_times()
+        if self.cpu_start is not None and cpu_end is not None:
+            record["cpu_user"] = cpu_end[0] - self.cpu_start[0]
+            record["cpu_system"] = cpu_end[1] - self.cpu_start[1]
+        else:
+            record["cpu_user"] = record["cpu_system"] = None
+
+        record["max_rss"] = get_peak_rss()
+        record["gc_collections"] = [
+            end - start for start, end in zip(self.gc_start, get_gc_counts())
+        ]
+        record["python"] = (
+            f"{platform.python_implementation()} {platform.python_version()}"
+        )
+        record.update(fields)
+        return record
+
+
+def write_record(record: Dict[str, Any], target: str = STDOUT):
+    """Write a record as a JSON line to stdout, or append it to a file.
+
+    Each record is written at once, so parallel runs can share a file.
+    """
+    line = json.dumps(record) + "\n"
+    if target == STDOUT:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        return
+
+    with open(target, "a") as fh:
+        fh.write(line)
@@ -1,8 +1,58 @@
+import copy
+import hashlib
+import mmap
+import os
+import pickle
+import re
 import sys
-from argparse import ArgumentParser, Namespace
+from argparse import ArgumentParser, BooleanOptionalAction, Namespace
+from array import array
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict
 from pathlib import Path
-from time import time
-from typing import Iterator, List, Type
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Sequence, TextIO, Tuple, Type
+
+from .cancel import TIMEOUT_EXIT_CODE, Cancelled, CancelToken
+from .disk_cache import (
+    CorruptEntryError,
+    DiskCache,
+    default_cache_dir,
+    dumps,
+    loads,
+)
+from .progress import NULL_PROGRESS, JsonSink, NullProgress, Progress, Sink, TextSink
+from .streams import is_compressed, is_stdin, open_binary, open_text
+
+BOTH = "both"  # Value of the ``--part`` option to solve both parts
+
+RE_INT = re.compile(rb"-?\d+")
+INT_SEPARATORS = bytes(c if c in b"-0123456789" else ord(" ") for c in range(256))
+# Translation table that turns everything except integer characters into spaces
+
+PARSE_CACHE_ENV = "AOC_PARSE_CACHE"  # Set to "1" to enable the parse cache by default
+ANSWER_CACHE_ENV = (
+    "AOC_ANSWER_CACHE"  # Set to "1" to enable the answer cache by default
+)
+
+# Options of a single run that the workers of ``--batch`` do not support:
+BATCH_UNSUPPORTED = (
+    "answer_cache",
+    "clear_cache",
+    "profile",
+    "sample_profile",
+    "line_profile",
+    "trace_memory",
+    "progress",
+    "progress_json",
+    "stats",
+    "json",
+)
+
+
+def part_type(value: str) -> int | str:
+    """Argument type for the ``--part`` option."""
+    return value if value == BOTH else int(value)
 
 
 class Solver:
@@ -10,15 +60,56 @@ class Solver:
 
     NAME = "__main__"
 
+    SOLVE_MODIFIES_INPUT: bool = True
+    # Set to ``False`` when :meth:`solve` leaves the parsed input intact, so both
+    # parts can be solved from the same object without copying it first
+
+    PARSE_VERSION: int = 1
+    # Increment when the result of :meth:`parse` changes, to invalidate cached inputs
+
+    SCALING_BUDGET: Dict[int, float] = {}
+    # Highest accepted exponent of the runtime vs. the input size per part (e.g. 1.0
+    # for linear), see `advent_of_code.bench.scaling`
+
     def __init__(self, *args, **kwargs):
         self.argument_parser: None | ArgumentParser = None
         self.args: None | Namespace = None
 
+        self.parse_cache_hit: bool | None = None  # ``None`` if not used
+        self._input_digest: str | None = None
+
+        self.progress_sink: Sink | None = None  # Receives reports of long loops
+        self.cancel_token = CancelToken()  # Checked by long loops, see `--timeout`
+
         self.argument_parser = self.make_parser()
         self.args = self.argument_parser.parse_args(*args, **kwargs)
+        if self.args.progress_json:
+            self.progress_sink = JsonSink()
+        elif self.args.progress:
+            self.progress_sink = TextSink()
+        if self.args.line_profile is not None and not hasattr(sys, "monitoring"):
+            self.argument_parser.error("`--line-profile` needs Python 3.12 or newer")
+        if (self.args.input_file is None) == (self.args.batch is None):
+            self.argument_parser.error("give either an input file or `--batch`")
+        if self.args.batch:
+            for dest in BATCH_UNSUPPORTED:
+                # Compared with the default, which can come from the environment
+                if getattr(self.args, dest) != self.argument_parser.get_default(dest):
+                    option = "--" + dest.replace("_", "-")
+                    self.argument_parser.error(
+                        f"`{option}` is not supported with `--batch`"
+                    )
+            self.input_file = None  # Each file gets its own instance, see `main`
+            return
+
         self.input_file = Path(self.args.input_file)
-        with open(self.input_file):
-            pass  # Assert file exists
+        if self.is_stdin():
+            # The input can only be read once, and there is nothing to hash
+            self.args.parse_cache = False
+            self.args.answer_cache = False
+        else:
+            with open(self.input_file):
+                pass  # Assert file exists
 
     @classmethod
     def make_parser(cls) -> ArgumentParser:
@@ -27,37 +118,647 @@ class Solver:
         )
         parser.add_argument(
             "input_file",
-            help="Path to input file to use",
+            nargs="?",
+            help="Path to input file to use, `-` for stdin (`.gz`, `.xz` and "
+            "`.bz2` files are decompressed)",
+        )
+        parser.add_argument(
+            "--batch",
+            nargs="+",
+            metavar="FILE",
+            help="Solve many input files in parallel instead, writing a JSON line "
+            "with the answer(s) and timing per file",
+        )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            help="Number of worker processes for `--batch` (default: #CPUs)",
         )
         parser.add_argument(
             "--part",
             "-p",
             default=1,
+            type=part_type,
+            choices=[1, 2, BOTH],
+            help=f"Run either part 1 (default), part 2 or `{BOTH}`",
+        )
+        parser.add_argument(
+            "--parse-cache",
+            action=BooleanOptionalAction,
+            default=os.environ.get(PARSE_CACHE_ENV, "0") != "0",
+            help="Store parsed inputs on disk, to skip parsing the same input again "
+            f"(default: off, unless `{PARSE_CACHE_ENV}=1`)",
+        )
+        parser.add_argument(
+            "--parse-cache-size",
+            type=float,
+            default=256.0,
+            metavar="MB",
+            help="Size limit of the parse cache (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--answer-cache",
+            action=BooleanOptionalAction,
+            default=os.environ.get(ANSWER_CACHE_ENV, "0") != "0",
+            help="Remember answers on disk, to return them instantly for the same "
+            f"input and code (default: off, unless `{ANSWER_CACHE_ENV}=1`)",
+        )
+        parser.add_argument(
+            "--answer-cache-entries",
             type=int,
-            choices=[1, 2],
-            help="Run either part 1 (default) or part 2",
+            default=10_000,
+            help="Maximum number of remembered answers (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--answer-cache-size",
+            type=float,
+            default=16.0,
+            metavar="MB",
+            help="Size limit of the answer cache (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--clear-cache",
+            action="store_true",
+            help="Empty the on-disk caches before running",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Run with cProfile and write a `.pstats` file next to the input",
+        )
+        parser.add_argument(
+            "--profile-top",
+            type=int,
+            default=20,
+            metavar="N",
+            help="Number of functions to list for `--profile` and `--sample-profile` "
+            "(default: %(default)s)",
+        )
+        parser.add_argument(
+            "--sample-profile",
+            action="store_true",
+            help="Sample the stack at a fixed rate, with little overhead, and write "
+            "the stacks in the collapsed format for flame graphs next to the input",
+        )
+        parser.add_argument(
+            "--sample-interval",
+            type=float,
+            default=0.005,
+            metavar="SECONDS",
+            help="Time between samples of `--sample-profile` (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--line-profile",
+            nargs="?",
+            const="",
+            metavar="MODULE",
+            help="Time each line of the functions in a module (default: that of the "
+            "solver, a package means its `__main__`), needs Python 3.12+",
+        )
+        parser.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="Trace memory allocations and report the peak and top sites",
+        )
+        parser.add_argument(
+            "--trace-memory-top",
+            type=int,
+            default=10,
+            metavar="N",
+            help="Number of sites to list for `--trace-memory` (default: "
+            "%(default)s)",
+        )
+        parser.add_argument(
+            "--progress",
+            action="store_true",
+            help="Report the progress of long loops on stderr",
+        )
+        parser.add_argument(
+            "--progress-json",
+            action="store_true",
+            help="Like `--progress`, but as JSON lines",
+        )
+        parser.add_argument(
+            "--progress-interval",
+            type=float,
+            default=1.0,
+            metavar="SECONDS",
+            help="Time between progress reports (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            metavar="SECONDS",
+            help=f"Stop the run after this long, with exit code {TIMEOUT_EXIT_CODE} "
+            "(long loops check it each iteration)",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Count allocations and calls of the shared classes (grid, priority "
+            "list and graph), this slows the run down",
+        )
+        parser.add_argument(
+            "--json",
+            nargs="?",
+            const="-",
+            metavar="FILE",
+            help="Write a JSON record of the run, with timings and resource usage: "
+            "to stdout instead of the text output, or appended to a file",
         )
         return parser
 
+    def progress(self, label: str, total: int | None = None) -> Progress | NullProgress:
+        """Get a tracker for a long loop, which only reports if a sink is set.
+
+        With a timeout, its updates also check if the run was cancelled.
+
+        :param total: Expected number of iterations, to estimate the remaining time
+        """
+        if self.progress_sink is None and self.args.timeout is None:
+            return NULL_PROGRESS
+
+        return Progress(
+            f"{type(self).__name__} part {self.args.part}: {label}",
+            total,
+            self.progress_sink,
+            interval=self.args.progress_interval,
+            cancel=self.cancel_token if self.args.timeout is not None else None,
+        )
+
+    @contextmanager
+    def deadline(self) -> Iterator[None]:
+        """Context in which the run gets cancelled after ``--timeout`` seconds."""
+        if self.args.timeout is None:
+            yield
+            return
+
+        with self.cancel_token.timeout(self.args.timeout):
+            yield
+
+    def is_stdin(self) -> bool:
+        return is_stdin(self.input_file)
+
+    def is_streamed(self) -> bool:
+        """Return True if the input cannot be accessed as a regular file."""
+        return self.is_stdin() or is_compressed(self.input_file)
+
     def iterate_input(self) -> Iterator[str]:
         """Yield each line of the input file (stripped)."""
-        with open(self.input_file, "r") as fh:
+        with open_text(self.input_file) as fh:
             while line := fh.readline():
                 yield line.strip()
 
     def get_input(self) -> List[str]:
-        return self.input_file.read_text().split("\n")
+        with open_text(self.input_file) as fh:
+            return fh.read().split("\n")
+
+    @contextmanager
+    def map_input(self) -> Iterator[mmap.mmap | bytes]:
+        """Memory-map the input file, for zero-copy access.
+
+        The mapping behaves like a read-only ``bytes`` object, e.g. compiled byte
+        regexes can search it directly. It is only valid inside the context.
+        Streamed inputs cannot be mapped and are read into memory instead.
+        """
+        if self.is_streamed():
+            yield self.get_input_bytes()
+            return
+
+        with open(self.input_file, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                yield b""  # Empty files cannot be mapped
+                return
+
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    def iterate_input_bytes(self) -> Iterator[bytes]:
+        """Yield each line of the input file (stripped), without decoding.
+
+        This is a faster alternative to :meth:`iterate_input`. Note that ``int()``
+        accepts bytes directly.
+        """
+        if self.is_streamed():
+            with open_binary(self.input_file) as fh:
+                while line := fh.readline():
+                    yield line.strip()
+            return
+
+        with self.map_input() as buffer:
+            if not buffer:
+                return
+
+            while line := buffer.readline():
+                yield line.strip()
+
+    @staticmethod
+    def parse_ints(data: bytes, per_line: int | None = None) -> array:
+        """Extract all (signed) integers from bytes in a single pass.
+
+        Anything other than a digit or a ``-`` directly before one is ignored, e.g.
+        ``b"p=0,4 v=3,-3"`` gives ``array('q', [0, 4, 3, -3])``. Numbers must fit in
+        64 bits.
+
+        :param per_line: Raise a ``ValueError`` unless each (non-blank) line has
+            this many numbers, as far as the total count can tell
+        """
+        tokens = data.translate(INT_SEPARATORS).split()
+        try:
+            numbers = array("q", map(int, tokens))
+        except ValueError:
+            # There is a `-` that is not a sign (e.g. `1-3`), use the slower regex
+            numbers = array("q", map(int, RE_INT.findall(data)))
+
+        if per_line is not None:
+            lines = sum(1 for line in data.splitlines() if line.strip())
+            if len(numbers) != per_line * lines:
+                raise ValueError(
+                    f"Expected {per_line} number(s) on each of {lines} line(s), "
+                    f"found {len(numbers)} in total"
+                )
+        return numbers
+
+    def input_ints(self, per_line: int | None = None) -> array:
+        """Get all integers in the input file, see :meth:`parse_ints`."""
+        return self.parse_ints(self.get_input_bytes(), per_line)
+
+    def input_sections(self) -> List[bytes]:
+        """Split the input file into blocks separated by blank lines (stripped).
+
+        The blocks are not split into lines, so they can be passed to e.g.
+        :meth:`parse_ints` directly.
+        """
+        data = self.get_input_bytes().replace(b"\r\n", b"\n")
+        return [
+            stripped for section in data.split(b"\n\n") if (stripped := section.strip())
+        ]
+
+    def output_path(self, suffix: str) -> Path:
+        """Get a file path next to the input, specific to this solver and part.
+
+        E.g. ``input.txt.Day01.part1.pstats``.
+        """
+        input_file = Path("stdin") if self.is_stdin() else self.input_file
+        name = f"{input_file.name}.{type(self).__name__}.part{self.args.part}"
+        return input_file.with_name(f"{name}.{suffix}")
+
+    def get_input_bytes(self) -> bytes:
+        """Get the full input file as bytes, without decoding."""
+        with open_binary(self.input_file) as fh:
+            return fh.read()
+
+    def input_digest(self) -> str:
+        """Get the SHA-256 hash of the input file (hexadecimal).
+
+        For compressed files this is the hash of the compressed content.
+        """
+        if self.is_stdin():
+            raise ValueError("Cannot hash an input from stdin")
+        if self._input_digest is None:
+            with open(self.input_file, "rb") as fh:
+                self._input_digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        return self._input_digest
+
+    def get_parse_cache(self) -> DiskCache:
+        return DiskCache(
+            default_cache_dir() / "parsed",
+            max_bytes=int(self.args.parse_cache_size * 1e6),
+        )
+
+    def get_parsed(self) -> Any:
+        """Return the result of :meth:`parse`, through the on-disk cache if enabled.
+
+        Cache entries are keyed by the class, its ``PARSE_VERSION`` and the hash of
+        the input content.
+        """
+        if not self.args.parse_cache:
+            return self.parse()
+
+        cache = self.get_parse_cache()
+        key = f"{type(self).__qualname__}:v{self.PARSE_VERSION}:{self.input_digest()}"
+
+        if (data := cache.get(key)) is not None:
+            try:
+                parsed = loads(data)
+                self.parse_cache_hit = True
+                return parsed
+            except CorruptEntryError:
+                pass  # E.g. truncated, parse again and overwrite it
+
+        self.parse_cache_hit = False
+        parsed = self.parse()
+        try:
+            data = dumps(parsed)
+        except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+            return parsed  # Cannot be stored, simply don't cache it
+
+        cache.put(key, data)
+        return parsed
+
+    @classmethod
+    def code_version(cls) -> str:
+        """Get a hash of the source code of this solver and of the shared code."""
+        files = [Path(sys.modules[cls.__module__].__file__)]
+        files += sorted(Path(__file__).parent.glob("*.py"))
+
+        hasher = hashlib.sha256()
+        for file in files:
+            hasher.update(file.read_bytes())
+        return hasher.hexdigest()
+
+    def get_answer_cache(self) -> DiskCache:
+        return DiskCache(
+            default_cache_dir() / "answers",
+            max_bytes=int(self.args.answer_cache_size * 1e6),
+            max_entries=self.args.answer_cache_entries,
+        )
+
+    def answer_key(self, part: int) -> str:
+        """Identifier of the answer for this input and code."""
+        return (
+            f"{type(self).__qualname__}:part{part}:{self.input_digest()}:"
+            f"{self.code_version()}"
+        )
+
+    def parse(self) -> Any:
+        """Read the input into a puzzle-specific structure.
+
+        Implementing this together with :meth:`solve` is an alternative to
+        implementing :meth:`__call__` directly, and allows the two phases to be
+        timed separately.
+        """
+        raise NotImplementedError("Class parse method must be implemented")
+
+    def solve(self, parsed: Any) -> str:
+        """Compute the answer from the result of :meth:`parse`."""
+        raise NotImplementedError("Class solve method must be implemented")
+
+    @classmethod
+    def has_phases(cls) -> bool:
+        """Return ``True`` if this class implements separate parse and solve steps."""
+        return cls.parse is not Solver.parse and cls.__call__ is Solver.__call__
+
+    def solve_both(self, parsed: Any) -> Tuple[str, str]:
+        """Compute the answers of both parts from a single parsed input.
+
+        By default :meth:`solve` is run for each part. Part 1 gets a deep copy of the
+        input, unless ``SOLVE_MODIFIES_INPUT`` is disabled. Override this to share
+        intermediate results between the parts.
+        """
+        parsed_part_1 = copy.deepcopy(parsed) if self.SOLVE_MODIFIES_INPUT else parsed
+        with self.as_part(1):
+            answer_1 = self.solve(parsed_part_1)
+        self.cancel_token.check()
+        with self.as_part(2):
+            answer_2 = self.solve(parsed)
+
+        return answer_1, answer_2
+
+    def both(self) -> Tuple[str, str]:
+        """Solve both parts, reading the input only once (if possible)."""
+        with self.deadline():
+            if not self.has_phases():
+                with self.as_part(1):
+                    answer_1 = self()
+                self.cancel_token.check()
+                with self.as_part(2):
+                    answer_2 = self()
+                return answer_1, answer_2
+
+            return self.solve_both(self.get_parsed())
+
+    @contextmanager
+    def as_part(self, part: int):
+        """Context in which this solver works on a specific part."""
+        part_before = self.args.part
+        self.args.part = part
+        try:
+            yield
+        finally:
+            self.args.part = part_before
 
     def __call__(self) -> str:
         """Magic method for object execution, which will do the puzzle solving."""
-        raise NotImplementedError("Class call method must be implemented")
+        if self.args.part == BOTH:
+            raise ValueError(f"Use `both()` to solve `--part {BOTH}`")
+
+        with self.deadline():
+            return self.solve(self.get_parsed())
+
+
+def solve_timed(cli_object: Solver) -> Tuple[Sequence[str], float | None]:
+    """Solve the selected part(s), timing the parse step if possible.
+
+    :raises Cancelled: If the run took longer than ``--timeout``
+
+    :return: The answer(s) and the parse duration (``None`` if not separate)
+    """
+    if not cli_object.has_phases():
+        if cli_object.args.part == BOTH:
+            return cli_object.both(), None
+        return (cli_object(),), None
+
+    with cli_object.deadline():
+        start = perf_counter()
+        parsed = cli_object.get_parsed()
+        parse_duration = perf_counter() - start
+        cli_object.cancel_token.check()
+        if cli_object.args.part == BOTH:
+            return cli_object.solve_both(parsed), parse_duration
+        return (cli_object.solve(parsed),), parse_duration
+
+
+def print_answers(
+    answers: Sequence[str],
+    duration: float,
+    parse_duration: float | None = None,
+    parse_cached: bool = False,
+):
+    """Print the answer(s) and timings, in the output format of :func:`main`."""
+    if len(answers) == 2:
+        print("Answer part 1:", answers[0])
+        print("Answer part 2:", answers[1])
+    else:
+        print("Answer:", answers[0])
+
+    if parse_duration is None:
+        print(f"(Time taken: {duration:.2f} seconds)")
+    else:
+        cached = " (cached)" if parse_cached else ""
+        print(
+            f"(Time taken: {duration:.2f} seconds - parse{cached}: "
+            f"{parse_duration:.3f}, solve: {duration - parse_duration:.3f})"
+        )
+
+
+def print_cancelled(err: Cancelled, stream: TextIO | None = None):
+    """Report a cancelled run and how far it got, on stderr by default."""
+    stream = stream or sys.stderr
+    print(err, file=stream)
+    if err.progress is not None:
+        print(f"Got to: {err.progress}", file=stream)
+    else:
+        print("Got to: no long loop was reached", file=stream)
+
+
+def main(cli_class: Type[Solver], argv: List[str] | None = None):
+    """Pass a class and execute it (if this is being run as main).
+
+    :param argv: Command line arguments (default: from ``sys.argv``)
+    """
+    cli_object = cli_class(sys.argv[1:] if argv is None else argv)
+    args = cli_object.args
+
+    if args.batch:
+        # Only imported when needed, to keep the startup of normal runs fast
+        from .batch import run_batch
+
+        solver_argv = ["--part", str(args.part)]
+        solver_argv += ["--parse-cache" if args.parse_cache else "--no-parse-cache"]
+        solver_argv += ["--parse-cache-size", str(args.parse_cache_size)]
+        if args.timeout is not None:
+            solver_argv += ["--timeout", str(args.timeout)]
+        failed = run_batch(cli_class, args.batch, solver_argv, jobs=args.jobs)
+        if failed:
+            print(f"{failed} of {len(args.batch)} files failed", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    parts = [1, 2] if args.part == BOTH else [args.part]
+
+    if args.clear_cache:
+        cli_object.get_parse_cache().clear()
+        cli_object.get_answer_cache().clear()
+
+    start = perf_counter()
+
+    recorder = None
+    if args.json is not None:
+        from .run_record import STDOUT, RunRecorder, write_record
+
+        recorder = RunRecorder()
+
+    profiling = (
+        args.profile
+        or args.sample_profile
+        or args.line_profile is not None
+        or args.trace_memory
+    )
+
+    answer_cache = cli_object.get_answer_cache() if args.answer_cache else None
+    answers = None
+    if answer_cache is not None and not (profiling or args.stats):
+        # A cached answer would leave nothing to measure, so those runs always solve
+        cached = [answer_cache.get(cli_object.answer_key(part)) for part in parts]
+        if all(answer is not None for answer in cached):
+            answers = [answer.decode() for answer in cached]
+
+    profiler, sampler, line_profiler, tracer = None, None, None, None
+    if profiling:
+        # Only imported when needed, to keep the startup of normal runs fast
+        from .profiling import (
+            LineProfiler,
+            MemoryTracer,
+            Profile,
+            SampleProfiler,
+            find_module,
+            print_line_profile,
+            print_memory,
+            print_profile,
+            print_samples,
+        )
+
+        profiler = Profile() if args.profile else None
+        sampler = SampleProfiler(args.sample_interval) if args.sample_profile else None
+        if args.line_profile is not None:
+            try:
+                module = (
+                    find_module(args.line_profile)
+                    if args.line_profile
+                    else sys.modules[cli_class.__module__]
+                )
+            except ModuleNotFoundError as err:
+                cli_object.argument_parser.error(str(err))
+            line_profiler = LineProfiler(module)
+        tracer = MemoryTracer() if args.trace_memory else None
+
+    stats = None
+    if args.stats:
+        from .stats import Stats, print_stats
+
+        stats = Stats()
+
+    parse_duration = None
+    answer_cached = answers is not None
+    if answers is None:
+        with ExitStack() as stack:
+            for context in (tracer, profiler, sampler, line_profiler, stats):
+                if context is not None:
+                    stack.enter_context(context)
+            try:
+                answers, parse_duration = solve_timed(cli_object)
+            except Cancelled as err:
+                print_cancelled(err)
+                if recorder is not None:
+                    progress = err.progress and asdict(err.progress)
+                    record = recorder.record(
+                        cli_object,
+                        None,
+                        perf_counter() - start,
+                        None,
+                        error=str(err),
+                        progress=progress,
+                    )
+                    write_record(record, args.json)
+                sys.exit(TIMEOUT_EXIT_CODE)
+        if answer_cache is not None:
+            for part, answer in zip(parts, answers):
+                answer_cache.put(cli_object.answer_key(part), str(answer).encode())
+
+    duration = perf_counter() - start
+    if recorder is not None:
+        record = recorder.record(
+            cli_object, answers, duration, parse_duration, answer_cached=answer_cached
+        )
+        write_record(record, args.json)
+
+    json_to_stdout = recorder is not None and args.json == STDOUT
+    # Reports go to stderr then, to keep stdout valid JSON lines:
+    report_stream = sys.stderr if json_to_stdout else sys.stdout
+
+    if not json_to_stdout:
+        print_answers(
+            answers,
+            duration,
+            parse_duration,
+            parse_cached=bool(cli_object.parse_cache_hit),
+        )
+
+        if answer_cache is not None:
+            print(
+                f"(Answer cache: {answer_cache.hits} hits, {answer_cache.misses} "
+                f"misses, {answer_cache.evictions} evictions)"
+            )
+
+    if stats is not None:
+        print_stats(stats, stream=report_stream)
+
+    if profiler is not None:
+        profile_file = cli_object.output_path("pstats")
+        profiler.dump_stats(profile_file)
+        print_profile(profiler, top=args.profile_top, stream=report_stream)
+        print(f"(Profile written to: {profile_file})", file=report_stream)
+
+    if sampler is not None:
+        collapsed_file = cli_object.output_path("collapsed")
+        sampler.write_collapsed(collapsed_file)
+        print_samples(sampler, top=args.profile_top, stream=report_stream)
+        print(f"(Collapsed stacks written to: {collapsed_file})", file=report_stream)
 
+    if line_profiler is not None:
+        print_line_profile(line_profiler, top=args.profile_top, stream=report_stream)
 
-def main(cli_class: Type[Solver]):
-    """Pass a class and execute it (if this is being run as main)."""
-    cli_object = cli_class(sys.argv[1:])
-    start = time()
-    result = cli_object()
-    print("Answer:", result)
-    duration = time() - start
-    print(f"(Time taken: {duration:.2f} seconds)")
+    if tracer is not None:
+        print_memory(tracer, top=args.trace_memory_top, stream=report_stream)
@@ -0,0 +1,140 @@
+"""Counters on the hot paths of the shared classes, see ``--stats``.
+
+The counters are installed by patching the classes only while collecting, so
+normal runs don't pay for them at all. Only modules that were already imported
+(by the day being solved) are patched.
+"""
+
+import functools
+import sys
+from collections import Counter
+from typing import Any, Callable, List, TextIO, Tuple
+
+_MISSING = object()
+
+
+class Stats:
+    """Context manager that counts calls to the shared classes while active.
+
+    Use like::
+
+        with Stats() as stats:
+            ...
+        print(stats.counts)
+    """
+
+    def __init__(self):
+        self.counts: Counter[str] = Counter()
+        self._patches: List[Tuple[type, str, Any]] = []  # Original attributes
+        self.caches: List[Any] = []  # Caches of the run, kept to print them later
+
+    def __enter__(self):
+        if grid := sys.modules.get(f"{__package__}.grid"):
+            self._count_calls(grid.RowCol, "__init__", "RowCol created")
+            self._count_calls(grid.Grid, "copy", "Grid.copy")
+            self._count_items_lookups(grid.Grid)
+
+        if priority_list := sys.modules.get(f"{__package__}.priority_list"):
+            self._count_push(priority_list.PriorityList)
+            self._count_calls(priority_list.PriorityList, "pop", "PriorityList.pop")
+            self.counts["PriorityList max size"] = 0
+
+        if graph := sys.modules.get(f"{__package__}.graph"):
+            self._count_calls(graph.Graph, "add_edge", "Graph.add_edge")
+            self._count_calls(
+                graph.Graph, "get_connected_nodes", "Graph.get_connected_nodes"
+            )
+            self._count_calls(graph.Graph, "get_edge", "Graph.get_edge")
+
+        if cache := sys.modules.get(f"{__package__}.cache"):
+            self.caches.extend(cache.CACHES)
+            self._keep_caches(cache.Cache)
+
+        return self
+
+    def __exit__(self, *exc_info):
+        for cls, name, original in reversed(self._patches):
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patches.clear()
+
+    def _patch(self, cls: type, name: str, value: Any):
+        self._patches.append((cls, name, cls.__dict__.get(name, _MISSING)))
+        setattr(cls, name, value)
+
+    def _count_calls(self, cls: type, name: str, key: str):
+        original: Callable = getattr(cls, name)
+        counts = self.counts
+        counts[key] = 0
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            counts[key] += 1
+            return original(*args, **kwargs)
+
+        self._patch(cls, name, wrapper)
+
+    def _count_push(self, cls: type):
+        """Count pushes and keep track of the largest heap."""
+        original: Callable = cls.push
+        counts = self.counts
+        counts["PriorityList.push"] = 0
+
+        @functools.wraps(original)
+        def push(priority_list, *args, **kwargs):
+            original(priority_list, *args, **kwargs)
+            counts["PriorityList.push"] += 1
+            size = len(priority_list)
+            if size > counts["PriorityList max size"]:
+                counts["PriorityList max size"] = size
+
+        self._patch(cls, "push", push)
+
+    def _count_items_lookups(self, cls: type):
+        """Count each access of the ``items`` attribute of grid instances.
+
+        A property on the class takes precedence over the instance attribute, and
+        simply passes it through.
+        """
+        counts = self.counts
+        counts["Grid.items lookups"] = 0
+
+        def get_items(grid):
+            counts["Grid.items lookups"] += 1
+            return grid.__dict__["items"]
+
+        def set_items(grid, value):
+            grid.__dict__["items"] = value
+
+        self._patch(cls, "items", property(get_items, set_items))
+
+    def _keep_caches(self, cls: type):
+        """Hold on to each new cache, as those of a run are gone when it's done."""
+        original: Callable = cls.__init__
+        caches = self.caches
+
+        @functools.wraps(original)
+        def __init__(cache, *args, **kwargs):
+            original(cache, *args, **kwargs)
+            caches.append(cache)
+
+        self._patch(cls, "__init__", __init__)
+
+
+def print_stats(stats: Stats, stream: TextIO | None = None):
+    """Print the collected counters, in the order they were installed, then caches."""
+    stream = stream or sys.stdout
+    if not stats.counts:
+        print("\nCounters: none (no shared classes used)", file=stream)
+    else:
+        print("\nCounters:", file=stream)
+        width = max(len(key) for key in stats.counts)
+        for key, count in stats.counts.items():
+            print(f"  {key:<{width}}  {count:>12,}", file=stream)
+
+    if stats.caches:
+        from .cache import print_cache_stats
+
+        print_cache_stats(stats.caches, stream=stream)
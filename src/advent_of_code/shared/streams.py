@@ -0,0 +1,44 @@
+import importlib
+import io
+import os
+import sys
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+STDIN = "-"  # Input file name to read from stdin instead
+
+# File suffix -> module that can open it, like `gzip.open()`
+COMPRESSION_MODULES = {".gz": "gzip", ".xz": "lzma", ".bz2": "bz2"}
+
+BUFFER_SIZE = 1 << 20  # Large reads, the inputs are read start to end anyway
+
+
+def is_stdin(path: Path | str) -> bool:
+    return str(path) == STDIN
+
+
+def is_compressed(path: Path | str) -> bool:
+    return Path(path).suffix in COMPRESSION_MODULES
+
+
+def open_binary(path: Path | str) -> BinaryIO:
+    """Open an input for buffered, sequential reading of bytes.
+
+    Use ``"-"`` for stdin, files ending in ``.gz``, ``.xz`` or ``.bz2`` are
+    decompressed on the fly.
+    """
+    if is_stdin(path):
+        return open(sys.stdin.fileno(), "rb", buffering=BUFFER_SIZE, closefd=False)
+
+    if is_compressed(path):
+        module = importlib.import_module(COMPRESSION_MODULES[Path(path).suffix])
+        return io.BufferedReader(module.open(path, "rb"), buffer_size=BUFFER_SIZE)
+
+    # No need for a big buffer for a small file:
+    buffer_size = min(BUFFER_SIZE, max(os.path.getsize(path), io.DEFAULT_BUFFER_SIZE))
+    return open(path, "rb", buffering=buffer_size)
+
+
+def open_text(path: Path | str) -> TextIO:
+    """Like :func:`open_binary`, but decoding the content."""
+    return io.TextIOWrapper(open_binary(path), encoding="utf-8")
@@ -1,10 +1,26 @@
 import inspect
+import os
+import tracemalloc
 from abc import ABCMeta
 from pathlib import Path
-from typing import Type
-from unittest import TestCase
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Sequence, Type
+from unittest import TestCase, skipUnless
 
+from advent_of_code.gen import write_input
+from advent_of_code.runner import RE_DAY_PACKAGE
 from advent_of_code.shared import Solver
+from advent_of_code.shared.solver import BOTH
+
+PERF_FACTOR_ENV = "AOC_PERF_FACTOR"  # Multiplier of time budgets, for slower machines
+PERF_TESTS_ENV = "AOC_PERF_TESTS"  # Set to "1" to run the performance tests
+
+# Decorator for tests with time and memory budgets, which are too noisy for shared
+# (CI) machines, so they only run on request:
+perf_test = skipUnless(
+    os.environ.get(PERF_TESTS_ENV, "0") != "0", f"Set `{PERF_TESTS_ENV}=1` to run"
+)
 
 
 class AdventTestCase(TestCase, metaclass=ABCMeta):
@@ -16,7 +32,7 @@ class AdventTestCase(TestCase, metaclass=ABCMeta):
         pass
 
     def get_solver(
-        self, part: int = 1, input_file: str | Path = "sample_input.txt"
+        self, part: int | str = 1, input_file: str | Path = "sample_input.txt"
     ) -> Solver:
         """Return solver instance based on ``PUZZLE`` variable."""
         # Get the .txt file next to the test file:
@@ -24,3 +40,62 @@ class AdventTestCase(TestCase, metaclass=ABCMeta):
         if isinstance(input_file, str) or not input_file.is_absolute():
             input_file = test_file.parent / Path(input_file)
         return self.PUZZLE([str(input_file), "--part", str(part)])
+
+    def get_generated_input(self, scale: float = 1.0, seed: int = 0) -> Path:
+        """Write a generated input for this day, removed again after the test."""
+        day = int(RE_DAY_PACKAGE.search(self.PUZZLE.__module__).group(1))
+        tmp_dir = TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        input_file = Path(tmp_dir.name) / f"day_{day:02d}_{scale}_{seed}.txt"
+        write_input(day, input_file, scale=scale, seed=seed)
+        return input_file
+
+    def assertSolvesWithin(
+        self,
+        part: int | str,
+        input_file: str | Path = "sample_input.txt",
+        seconds: float | None = None,
+        max_peak_mb: float | None = None,
+    ) -> str | Sequence[str]:
+        """Assert a part is solved within a time and memory budget.
+
+        The time budget is multiplied by ``AOC_PERF_FACTOR`` (default: 1), to
+        calibrate it for a slower or faster machine. The peak memory is that traced
+        by `tracemalloc`, which is measured in a separate run.
+
+        :return: The answer (or both answers)
+        """
+
+        def solve():
+            solver = self.get_solver(part, input_file)
+            return solver.both() if part == BOTH else solver()
+
+        start = perf_counter()
+        answer = solve()
+        duration = perf_counter() - start
+
+        if seconds is not None:
+            factor = float(os.environ.get(PERF_FACTOR_ENV, "1"))
+            self.assertLessEqual(
+                duration,
+                seconds * factor,
+                f"Part {part} took {duration:.3f} s, the budget is {seconds} s "
+                f"(times {factor} from `{PERF_FACTOR_ENV}`)",
+            )
+
+        if max_peak_mb is not None:
+            tracemalloc.start()
+            try:
+                solve()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertLessEqual(
+                peak / 1e6,
+                max_peak_mb,
+                f"Part {part} used {peak / 1e6:.1f} MB at its peak, the budget is "
+                f"{max_peak_mb} MB",
+            )
+
+        return answer
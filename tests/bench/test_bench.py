@@ -0,0 +1,144 @@
+import contextlib
+import io
+import math
+import unittest
+from pathlib import Path
+
+from advent_of_code.bench import (
+    BenchResult,
+    bench_solver,
+    compare,
+    percentile,
+    positive_int,
+    to_json,
+)
+from advent_of_code.bench.__main__ import main
+from advent_of_code.bench.scaling import ScalingResult, fit_exponent
+from advent_of_code.bench.scaling import main as scaling_main
+from advent_of_code.bench.scaling import measure_scaling
+from advent_of_code.bench.startup import (
+    STARTUP_PART,
+    bench_startup,
+    parse_import_time,
+)
+
+TESTS_DIR = Path(__file__).parent.parent
+
+
+class TestBench(unittest.TestCase):
+
+    def test_percentile(self):
+        samples = list(range(1, 101))
+        self.assertEqual(95, percentile(samples, 95))
+        self.assertEqual(50, percentile(samples, 50))
+        self.assertEqual(7, percentile([7], 95))
+
+    def test_bench_solver(self):
+        result = bench_solver(
+            1, 1, TESTS_DIR / "day_01" / "sample_input.txt", repeats=3, warmup=1
+        )
+        self.assertEqual("11", result.answer)
+        self.assertEqual(3, len(result.samples_ns))
+
+        summary = result.summary()
+        self.assertLessEqual(summary["min_ns"], summary["median_ns"])
+        self.assertLessEqual(summary["median_ns"], summary["p95_ns"])
+
+    def test_repeats(self):
+        self.assertEqual(3, positive_int("3"))
+        for argv, error in [
+            (["--startup", "--repeats", "0"], "must be at least 1"),
+            (["--startup", "-n", "-1"], "must be at least 1"),
+            (["--startup", "--warmup", "-1"], "must be at least 0"),
+            (["--startup", "--warmup", "x"], "invalid int value"),
+        ]:
+            f = io.StringIO()
+            with contextlib.redirect_stderr(f), self.assertRaises(SystemExit):
+                main(argv)
+            self.assertIn(error, f.getvalue())
+
+    def test_compare(self):
+        results = [
+            BenchResult(day=1, part=1, samples_ns=[100, 100, 100]),
+            BenchResult(day=1, part=2, samples_ns=[200, 200, 200]),
+            BenchResult(day=2, part=1, samples_ns=[100]),
+        ]
+        baseline = {
+            (r["day"], r["part"]): r
+            for r in to_json(
+                [
+                    BenchResult(day=1, part=1, samples_ns=[95]),
+                    BenchResult(day=1, part=2, samples_ns=[100]),
+                ]
+            )["results"]
+        }
+        comparisons = compare(results, baseline, threshold=0.1)
+        self.assertEqual(2, len(comparisons))  # Day 2 is not in the baseline
+        self.assertFalse(comparisons[0].regressed)
+        self.assertTrue(comparisons[1].regressed)
+        self.assertAlmostEqual(2.0, comparisons[1].ratio)
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_parse_import_time(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       100 |        100 |   typing\n"
+            "import time:        50 |        150 | advent_of_code\n"
+            "import time:        20 |         20 |     bidict._base\n"
+            "import time:        30 |         50 |   bidict\n"
+            "import time:        10 |         60 | advent_of_code.day_01\n"
+        )
+        times = parse_import_time(output)
+        self.assertEqual({"advent_of_code": 150, "advent_of_code.day_01": 60}, times)
+
+    def test_bench_startup(self):
+        result = bench_startup(1, repeats=2)
+        self.assertEqual(STARTUP_PART, result.part)
+        self.assertEqual(2, len(result.samples_ns))
+        self.assertTrue(all(sample > 0 for sample in result.samples_ns))
+
+
+class TestScaling(unittest.TestCase):
+
+    def test_fit_exponent(self):
+        sizes = [1, 2, 4, 8]
+        self.assertAlmostEqual(2.0, fit_exponent(sizes, [3 * s**2 for s in sizes]))
+        self.assertAlmostEqual(0.5, fit_exponent(sizes, [s**0.5 for s in sizes]))
+        self.assertTrue(math.isnan(fit_exponent([1, 1], [1, 2])))
+
+    def test_over_budget(self):
+        result = ScalingResult(day=1, part=1, sizes=[1, 2, 4], times=[1, 4, 16])
+        self.assertFalse(result.over_budget)  # No budget
+        result.budget = 2.5
+        self.assertFalse(result.over_budget)
+        result.budget = 1.5
+        self.assertTrue(result.over_budget)
+
+        result.times = [0, 0, 0]  # Too fast to measure, so no exponent to check
+        self.assertTrue(math.isnan(result.time_exponent))
+        self.assertTrue(result.over_budget)
+
+    def test_steps(self):
+        f = io.StringIO()
+        with contextlib.redirect_stderr(f), self.assertRaises(SystemExit):
+            scaling_main(["--steps", "1"])
+        self.assertIn("must be at least 2", f.getvalue())
+
+    def test_measure_scaling(self):
+        result = measure_scaling(1, 1, [0.1, 0.2, 0.4])
+        self.assertEqual(3, len(result.times))
+        self.assertEqual(3, len(result.peaks))
+        self.assertLess(result.sizes[0], result.sizes[1])
+        self.assertGreater(result.peaks[-1], result.peaks[0])
+
+    def test_budget_from_solver(self):
+        result = measure_scaling(9, 2, [0.01, 0.02], memory=False)
+        self.assertEqual(2.3, result.budget)
+        result = measure_scaling(9, 2, [0.01, 0.02], memory=False, budget=1.0)
+        self.assertEqual(1.0, result.budget)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from advent_of_code.day_01.__main__ import Day01
 
@@ -19,6 +21,19 @@ class TestDay01(AdventTestCase):
         result = solver()
         self.assertEqual("31", result)
 
+    def test_sample_both(self):
+        solver = self.get_solver("both")
+        result = solver.both()
+        self.assertEqual(("11", "31"), result)
+
+    def test_invalid_input(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "input.txt"
+            for text in ("garbage\n", "3   4\n4\n"):
+                input_file.write_text(text)
+                with self.assertRaises(ValueError):
+                    self.get_solver(1, input_file)()
+
 
 if __name__ == "__main__":
     unittest.main()
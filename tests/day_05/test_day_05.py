@@ -9,9 +9,6 @@ class TestDay05(AdventTestCase):
 
     PUZZLE = Day05
 
-    def setUp(self):
-        Page.ORDER.clear()
-
     def test_sample_part_1(self):
         solver = self.get_solver(1)
         result = solver()
@@ -22,16 +19,25 @@ class TestDay05(AdventTestCase):
         result = solver()
         self.assertEqual("123", result)
 
+    def test_sample_both(self):
+        solver = self.get_solver("both")
+        result = solver.both()
+        self.assertEqual(("143", "123"), result)
+
     def test_page_hash(self):
         my_set = {Page(10), Page(15), Page(9)}
         self.assertTrue(Page(15) in my_set)
 
     def test_page_sort(self):
-        Page.ORDER[9] = {Page(5), Page(2)}
-        Page.ORDER[5] = {Page(2), Page(1)}
-        Page.ORDER[4] = {Page(2)}
-        self.assertTrue(Page(9) < Page(5))
-        self.assertTrue(Page(5) < Page(2))
+        order = {9: {Page(5), Page(2)}, 5: {Page(2), Page(1)}, 4: {Page(2)}}
+        self.assertTrue(Page(9, order) < Page(5, order))
+        self.assertTrue(Page(5, order) < Page(2, order))
+        self.assertFalse(Page(9) < Page(5))  # Without an order
+
+    def test_independent_inputs(self):
+        """Rules of one input must not leak into the next."""
+        self.assertEqual("143", self.get_solver(1)())
+        self.assertEqual("75", self.get_solver(1, "sample_input_other_rules.txt")())
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ import unittest
 
 from advent_of_code.day_06.__main__ import Day06
 
-from ..advent_testcase import AdventTestCase
+from ..advent_testcase import AdventTestCase, perf_test
 
 
 class TestDay06(AdventTestCase):
@@ -44,6 +44,11 @@ class TestDay06(AdventTestCase):
         result = solver()
         self.assertEqual("6", result)
 
+    def test_sample_both(self):
+        solver = self.get_solver("both")
+        result = solver.both()
+        self.assertEqual(("41", "6"), result)
+
     def test_sample_part_2_custom(self):
         solver = self.get_solver(2, input_file="sample_input_loop.txt")
         result = solver()
@@ -55,6 +60,11 @@ class TestDay06(AdventTestCase):
         # Row, cols: [(2, 3), (3, 3), (4, 3), (4, 2), (4, 0)]
         self.assertEqual("5", result)
 
+    @perf_test
+    def test_performance(self):
+        input_file = self.get_generated_input(scale=0.5)
+        self.assertSolvesWithin("both", input_file, seconds=1.5, max_peak_mb=2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,6 +19,11 @@ class TestDay07(AdventTestCase):
         result = solver()
         self.assertEqual("11387", result)
 
+    def test_sample_parts_in_sequence(self):
+        """Part 2 must not change the operators of a later part 1."""
+        self.assertEqual("11387", self.get_solver(2)())
+        self.assertEqual("3749", self.get_solver(1)())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,6 +19,12 @@ class TestDay09(AdventTestCase):
         result = solver()
         self.assertEqual("2858", result)
 
+    def test_no_gaps(self):
+        """The last block is already in place, this used to loop forever."""
+        solver = self.get_solver(1, "sample_input_no_gaps.txt")
+        result = solver()
+        self.assertEqual("5", result)
+
 
 if __name__ == "__main__":
     unittest.main()
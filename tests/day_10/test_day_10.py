@@ -39,6 +39,11 @@ class TestDay10(AdventTestCase):
         result = solver()
         self.assertEqual("81", result)
 
+    def test_sample_both(self):
+        solver = self.get_solver("both")
+        result = solver.both()
+        self.assertEqual(("36", "81"), result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -50,6 +50,11 @@ class TestDay12(AdventTestCase):
         result = solver()
         self.assertEqual("1206", result)
 
+    def test_sample_both(self):
+        solver = self.get_solver("both")
+        result = solver.both()
+        self.assertEqual(("1930", "1206"), result)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@ import unittest
 
 from advent_of_code.day_16.__main__ import Day16
 
-from ..advent_testcase import AdventTestCase
+from ..advent_testcase import AdventTestCase, perf_test
 
 
 class TestDay16(AdventTestCase):
@@ -39,6 +39,12 @@ class TestDay16(AdventTestCase):
         result = solver()
         self.assertEqual("64", result)
 
+    @perf_test
+    def test_performance(self):
+        input_file = self.get_generated_input(scale=0.1)
+        self.assertSolvesWithin(1, input_file, seconds=1.0, max_peak_mb=2)
+        self.assertSolvesWithin(2, input_file, seconds=1.0, max_peak_mb=2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,9 @@
 import unittest
+from unittest.mock import patch
 
 from advent_of_code.day_18.__main__ import Day18
 
-from ..advent_testcase import AdventTestCase
+from ..advent_testcase import AdventTestCase, perf_test
 
 
 class TestDay18(AdventTestCase):
@@ -22,21 +23,23 @@ class TestDay18(AdventTestCase):
             #.#...E
         ```
         """
-        Day18.BYTE_LIMIT = 12  # Reduce limit for this sample
-        Day18.GRID_SIZE = 6
-
         solver = self.get_solver(1)
-        result = solver()
+        with patch.object(Day18, "BYTE_LIMIT", 12), patch.object(Day18, "GRID_SIZE", 6):
+            result = solver()  # Reduced limits for this sample
         self.assertEqual("22", result)
 
     def test_sample_part_2(self):
-        Day18.BYTE_LIMIT = 12  # Reduce limit for this sample
-        Day18.GRID_SIZE = 6
-
         solver = self.get_solver(2)
-        result = solver()
+        with patch.object(Day18, "BYTE_LIMIT", 12), patch.object(Day18, "GRID_SIZE", 6):
+            result = solver()  # Reduced limits for this sample
         self.assertEqual("6,1", result)
 
+    @perf_test
+    def test_performance_part_1(self):
+        """Generated inputs are always full size for this day."""
+        input_file = self.get_generated_input()
+        self.assertSolvesWithin(1, input_file, seconds=1.0, max_peak_mb=4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from advent_of_code.day_19.__main__ import Day19
 
@@ -39,6 +41,25 @@ class TestDay19(AdventTestCase):
         result = solver()
         self.assertEqual("16", result)
 
+    def test_long_design(self):
+        """Designs of any length are fine, there is no recursion."""
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "input.txt"
+            input_file.write_text(
+                "r, b, rr\n\n" + "r" * 3000 + "b\n" + "b" * 10 + "w\n"
+            )
+            self.assertEqual("1", self.get_solver(1, input_file)())
+
+            solver = self.get_solver(2, input_file)
+            self.assertEqual(str(self.fibonacci(3001)), solver())
+
+    @staticmethod
+    def fibonacci(n: int) -> int:
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from advent_of_code.gen import GENERATORS, generate, write_input
+from advent_of_code.runner import find_days, get_solver
+
+
+class TestGen(unittest.TestCase):
+
+    def test_all_days(self):
+        self.assertEqual(find_days(), sorted(GENERATORS))
+
+    def test_seed(self):
+        for day in [1, 12, 24]:
+            lines = list(generate(day, scale=0.1, seed=1))
+            self.assertEqual(lines, list(generate(day, scale=0.1, seed=1)))
+            self.assertNotEqual(lines, list(generate(day, scale=0.1, seed=2)))
+
+    def test_scale(self):
+        self.assertEqual(1000, len(list(generate(1))))
+        self.assertEqual(10_000, len(list(generate(1, scale=10))))
+
+    def test_unknown_day(self):
+        with self.assertRaises(LookupError):
+            generate(26)
+
+    def test_solvable(self):
+        """Generated inputs should be valid for the solvers."""
+        with TemporaryDirectory() as tmp_dir:
+            for day in sorted(GENERATORS):
+                with self.subTest(day=day):
+                    input_file = Path(tmp_dir) / f"day_{day:02d}.txt"
+                    write_input(day, input_file, scale=0.02)
+                    # Day 18 has a fixed size, part 2 takes too long for a test
+                    part = 1 if day == 18 else "both"
+                    solver = get_solver(day)([str(input_file), "--part", str(part)])
+                    answers = solver.both() if part == "both" else [solver()]
+                    for answer in answers:
+                        self.assertIsNotNone(answer)
+
+    def test_write_compressed(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "day_01.txt.gz"
+            write_input(1, input_file, scale=0.01)
+            solver = get_solver(1)([str(input_file)])
+            self.assertEqual(10, len(solver.parse()[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
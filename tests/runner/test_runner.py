@@ -0,0 +1,130 @@
+import contextlib
+import io
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import advent_of_code
+from advent_of_code.__main__ import main
+from advent_of_code.day_01.__main__ import Day01
+from advent_of_code.runner import (
+    find_inputs,
+    find_solvers,
+    format_table,
+    run_all,
+    run_job,
+)
+
+TESTS_DIR = Path(__file__).parent.parent
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_find_solvers(self):
+        solvers = find_solvers()
+        self.assertEqual(list(range(1, 26)), sorted(solvers.keys()))
+        self.assertIs(Day01, solvers[1])
+
+    def test_run_job(self):
+        result = run_job(1, 2, TESTS_DIR / "day_01" / "sample_input.txt")
+        self.assertEqual("31", result.answer)
+        self.assertIsNone(result.error)
+
+    def test_run_job_error(self):
+        result = run_job(1, 1, TESTS_DIR / "does_not_exist.txt")
+        self.assertIsNone(result.answer)
+        self.assertTrue(result.error.startswith("FileNotFoundError"))
+
+    def test_run_job_profile(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "day_01.txt"
+            shutil.copy(TESTS_DIR / "day_01" / "sample_input.txt", input_file)
+
+            result = run_job(1, 2, input_file, profile=True)
+            self.assertEqual("31", result.answer)
+            self.assertEqual(
+                Path(tmp_dir) / "day_01.txt.Day01.part2.pstats", result.profile_file
+            )
+            self.assertTrue(result.profile_file.is_file())
+
+    def test_run_all(self):
+        with TemporaryDirectory() as tmp_dir:
+            for day in [1, 7]:
+                shutil.copy(
+                    TESTS_DIR / f"day_{day:02d}" / "sample_input.txt",
+                    Path(tmp_dir) / f"day_{day:02d}.txt",
+                )
+
+            inputs = find_inputs(Path(tmp_dir), range(1, 26))
+            self.assertEqual([1, 7], sorted(inputs.keys()))
+
+            results, total_time = run_all(inputs, jobs=2)
+
+        answers = {(r.day, r.part): r.answer for r in results}
+        expected = {(1, 1): "11", (1, 2): "31", (7, 1): "3749", (7, 2): "11387"}
+        self.assertEqual(expected, answers)
+
+        # Slowest job first:
+        self.assertEqual(
+            sorted((r.wall_time for r in results), reverse=True),
+            [r.wall_time for r in results],
+        )
+
+        table = format_table(results, total_time)
+        self.assertIn("3749", table)
+        self.assertIn("4 jobs in", table)
+
+
+class TestDispatcher(unittest.TestCase):
+
+    def test_day(self):
+        input_file = str(TESTS_DIR / "day_01" / "sample_input.txt")
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            result = main(["1", input_file, "--part", "2"])
+
+        self.assertEqual(0, result)
+        self.assertTrue(f.getvalue().startswith("Answer: 31\n"))
+
+    def test_stdin(self):
+        with open(TESTS_DIR / "day_01" / "sample_input.txt", "rb") as fh:
+            process = subprocess.run(
+                [sys.executable, "-m", "advent_of_code", "1", "-", "--part", "2"],
+                stdin=fh,
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=Path(advent_of_code.__file__).parent.parent,
+            )
+        self.assertTrue(process.stdout.startswith("Answer: 31\n"))
+
+    def test_unknown_day(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(1, main(["31", "input.txt"]))
+
+    def test_lazy_imports(self):
+        """Days that don't need the grid should not import `bidict`.
+
+        Nor should the dispatcher import the profiler.
+        """
+        code = (
+            "import sys; import advent_of_code.__main__; "
+            "import advent_of_code.day_01.__main__; "
+            "print('bidict' in sys.modules, 'advent_of_code.shared.grid' in "
+            "sys.modules, 'cProfile' in sys.modules)"
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(advent_of_code.__file__).parent.parent,
+        )
+        self.assertEqual("False False False", process.stdout.strip())
+
+
+if __name__ == "__main__":
+    unittest.main()
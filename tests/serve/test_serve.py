@@ -0,0 +1,179 @@
+import contextlib
+import io
+import socket
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from advent_of_code.__main__ import main
+from advent_of_code.serve import UNSUPPORTED, Server, SolverService, request
+from advent_of_code.shared import Solver
+
+from ..shared.test_cancel import INPUT_FILE, Day00Endless
+
+TESTS_DIR = Path(__file__).parent.parent
+
+
+class Day00Sleeping(Solver):
+    """Dummy puzzle that takes a while, without checking for cancellation."""
+
+    def __call__(self):
+        time.sleep(0.5)
+        return "late"
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "No Unix domain sockets")
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.socket_path = Path(self.tmp_dir.name) / "aoc.sock"
+        self.server = Server(self.socket_path, SolverService(workers=2))
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def request(self, **message):
+        return request(message, self.socket_path)
+
+    def test_input_path(self):
+        input_path = str(TESTS_DIR / "day_01" / "sample_input.txt")
+        response = self.request(day=1, part=2, input_path=input_path)
+        self.assertEqual(["31"], response["answers"])
+        self.assertFalse(response["answer_cached"])
+
+        response = self.request(day=1, part=2, input_path=input_path)
+        self.assertEqual(["31"], response["answers"])
+        self.assertTrue(response["answer_cached"])
+
+    def test_input_text(self):
+        input_text = (TESTS_DIR / "day_01" / "sample_input.txt").read_text()
+        response = self.request(day=1, part="both", input_text=input_text)
+        self.assertEqual(["11", "31"], response["answers"])
+
+    def test_no_cross_talk(self):
+        """Solving part 2 first must not change the answer of part 1 afterwards."""
+        input_text = (TESTS_DIR / "day_07" / "sample_input.txt").read_text()
+        response = self.request(day=7, part=2, input_text=input_text)
+        self.assertEqual(["11387"], response["answers"])
+        response = self.request(day=7, part=1, input_text=input_text)
+        self.assertEqual(["3749"], response["answers"])
+
+    def test_parsed_cache(self):
+        input_path = str(TESTS_DIR / "day_05" / "sample_input.txt")
+        response = self.request(day=5, part=1, input_path=input_path)
+        self.assertFalse(response["parse_cached"])
+
+        response = self.request(day=5, part=2, input_path=input_path)
+        self.assertEqual(["123"], response["answers"])
+        self.assertTrue(response["parse_cached"])
+
+    def test_concurrent_clients(self):
+        input_path = str(TESTS_DIR / "day_01" / "sample_input.txt")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(
+                executor.map(
+                    lambda part: self.request(day=1, part=part, input_path=input_path),
+                    [1, 2] * 4,
+                )
+            )
+        self.assertEqual([["11"], ["31"]] * 4, [r["answers"] for r in responses])
+
+    def test_errors(self):
+        response = self.request(day=31, input_path="input.txt")
+        self.assertEqual("LookupError: No solution found for day 31", response["error"])
+
+        response = self.request(day=1, input_path=str(TESTS_DIR / "missing.txt"))
+        self.assertTrue(response["error"].startswith("FileNotFoundError"))
+
+        response = self.request(day=1)
+        self.assertTrue(response["error"].startswith("ValueError"))
+
+    def test_invalid_requests(self):
+        input_path = str(TESTS_DIR / "day_01" / "sample_input.txt")
+        for message, error in [
+            ([1], "expected a JSON object"),
+            ({"day": "1", "input_path": input_path}, "`day` must be a number"),
+            ({"day": 1, "part": 3, "input_path": input_path}, "`part` must be 1, 2"),
+            ({"day": 1, "part": True, "input_path": input_path}, "`part` must be"),
+            ({"day": 1, "timeout": "x", "input_path": input_path}, "`timeout` must"),
+            ({"day": 1, "timeout": -1, "input_path": input_path}, "`timeout` must"),
+            ({"day": 1, "input_path": 5}, "`input_path` must be a string"),
+        ]:
+            response = request(message, self.socket_path)
+            self.assertTrue(response["error"].startswith("Invalid request: "))
+            self.assertIn(error, response["error"])
+
+        # The connection and the daemon are still fine:
+        response = self.request(day=1, part=2, input_path=input_path)
+        self.assertEqual(["31"], response["answers"])
+
+    def test_invalid_solver_arguments(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaisesRegex(ValueError, "Invalid arguments"):
+                self.server.service.solve(Day00Endless, 3, Path(INPUT_FILE))
+
+    def test_timeout(self):
+        self.server.service.solvers[0] = Day00Endless
+        response = self.request(day=0, part=2, input_path=INPUT_FILE, timeout=0.1)
+        self.assertEqual("Timed out after 0.1 s", response["error"])
+        self.assertTrue(response["cancelled"])
+        self.assertEqual("Day00Endless part 2: forever", response["progress"]["label"])
+
+        response = self.request(day=0, part=1, input_path=INPUT_FILE, timeout=5)
+        self.assertEqual(["test"], response["answers"])
+
+    def test_timeout_ignored(self):
+        self.server.service.solvers[0] = Day00Sleeping
+        with patch.object(SolverService, "CANCEL_GRACE", 0.05):
+            response = self.request(day=0, input_path=INPUT_FILE, timeout=0.05)
+        self.assertEqual("Timed out after 0.05 s", response["error"])
+        self.assertTrue(response["cancelled"])
+
+    def test_already_listening(self):
+        with self.assertRaises(RuntimeError):
+            Server(self.socket_path, self.server.service)
+
+    def test_client(self):
+        input_file = str(TESTS_DIR / "day_01" / "sample_input.txt")
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            result = main(
+                [
+                    "client",
+                    "1",
+                    input_file,
+                    "-p",
+                    "both",
+                    "--socket",
+                    str(self.socket_path),
+                ]
+            )
+
+        self.assertEqual(0, result)
+        self.assertTrue(f.getvalue().startswith("Answer part 1: 11\nAnswer part 2: 31"))
+        self.assertIn("(Time taken:", f.getvalue())
+
+
+class TestUnsupported(unittest.TestCase):
+
+    def test_main(self):
+        for argv in (["serve"], ["client", "1", "input.txt"]):
+            f = io.StringIO()
+            with patch("advent_of_code.serve.SUPPORTED", False):
+                with contextlib.redirect_stderr(f):
+                    self.assertEqual(1, main(argv))
+            self.assertEqual(UNSUPPORTED, f.getvalue().strip())
+
+
+if __name__ == "__main__":
+    unittest.main()
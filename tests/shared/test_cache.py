@@ -0,0 +1,151 @@
+import io
+import threading
+import unittest
+
+from advent_of_code.shared.cache import LFU, Cache, memoize, print_cache_stats
+from advent_of_code.shared.stats import Stats, print_stats
+
+
+class TestCache(unittest.TestCase):
+
+    def test_least_recently_used(self):
+        cache = Cache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual((3, 1, 1), (cache.hits, cache.misses, cache.evictions))
+        self.assertEqual(0.75, cache.hit_rate)
+
+    def test_least_frequently_used(self):
+        cache = Cache(max_entries=2, policy=LFU)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        for _ in range(3):
+            cache.get("a")
+        cache.put("c", 3)  # Evicts "b", used the least
+        self.assertNotIn("b", cache)
+
+        cache.get("c")
+        cache.put("d", 4)  # Evicts "c", as "a" is still used more
+        self.assertEqual(["a", "d"], sorted(cache._entries))
+        cache.put("a", 5)
+        self.assertEqual(5, cache.get("a"))
+        self.assertEqual(2, cache.evictions)
+
+    def test_lfu_oldest_first(self):
+        cache = Cache(max_entries=2, policy=LFU)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        self.assertEqual(["b", "c"], sorted(cache._entries))
+
+    def test_unbounded_and_clear(self):
+        cache = Cache()
+        for i in range(1000):
+            cache.put(i, i)
+        self.assertEqual(1000, len(cache))
+        self.assertEqual(0, cache.evictions)
+
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(-1, cache.get(1, -1))
+
+    def test_get_or_compute(self):
+        cache = Cache(lock=True)
+        self.assertEqual(2, cache.get_or_compute("a", lambda: 2))
+        self.assertEqual(2, cache.get_or_compute("a", lambda: 3))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_threads(self):
+        cache = Cache(max_entries=10, policy=LFU, lock=True)
+
+        def work(offset):
+            for i in range(1000):
+                cache.put((i + offset) % 20, i)
+                cache.get(i % 20)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(10, len(cache))
+        self.assertEqual(4000, cache.hits + cache.misses)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            Cache(policy="fifo")
+
+
+class TestMemoize(unittest.TestCase):
+
+    def test_function(self):
+        calls = []
+
+        @memoize(max_entries=2)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual([1, 4, 1, 9, 1], [square(x) for x in (1, 2, 1, 3, 1)])
+        self.assertEqual([1, 2, 3], calls)
+        self.assertEqual(1, square.cache.evictions)  # Of 2
+        self.assertEqual("square", square.__name__)
+
+    def test_per_instance(self):
+        class Counter:
+            def __init__(self, step):
+                self.step = step
+
+            @memoize(per_instance=True)
+            def count(self, n):
+                return 0 if n == 0 else self.step + self.count(n - 1)
+
+        one, two = Counter(1), Counter(2)
+        self.assertEqual(50, one.count(50))
+        self.assertEqual(100, two.count(50))
+        self.assertEqual(51, len(Counter.count.cache_of(one)))
+        self.assertEqual(0, Counter.count.cache_of(one).hits)
+        self.assertEqual(50, one.count(50))
+        self.assertEqual(1, Counter.count.cache_of(one).hits)
+        self.assertTrue(Counter.count.cache_of(two).name.endswith("Counter.count"))
+
+
+class TestCacheStats(unittest.TestCase):
+
+    def test_print_cache_stats(self):
+        cache = Cache(name="test cache")
+        cache.put(1, 1)
+        cache.get(1)
+        cache.get(2)
+        unused = Cache(name="unused")
+
+        stream = io.StringIO()
+        print_cache_stats([cache, unused], stream=stream)
+        self.assertIn("Caches:", stream.getvalue())
+        self.assertIn("test cache", stream.getvalue())
+        self.assertIn("50.0% hits", stream.getvalue())
+        self.assertNotIn("unused", stream.getvalue())
+
+    def test_stats_keep_caches(self):
+        def run():
+            cache = Cache(name="run cache")
+            cache.get(1)
+
+        with Stats() as stats:
+            run()
+
+        stream = io.StringIO()
+        print_stats(stats, stream=stream)
+        self.assertIn("run cache", stream.getvalue())
+        self.assertFalse(hasattr(Cache.__init__, "__wrapped__"))  # Restored
+
+
+if __name__ == "__main__":
+    unittest.main()
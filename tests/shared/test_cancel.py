@@ -0,0 +1,111 @@
+import contextlib
+import io
+import json
+import time
+import unittest
+from pathlib import Path
+
+from advent_of_code.shared import Solver, main
+from advent_of_code.shared.cancel import TIMEOUT_EXIT_CODE, Cancelled, CancelToken
+from advent_of_code.shared.progress import NULL_PROGRESS, Progress
+
+INPUT_FILE = str(Path(__file__).parent / "sample_input.txt")
+
+
+class Day00Endless(Solver):
+    """Dummy puzzle that never finishes part 2."""
+
+    def parse(self):
+        return list(self.iterate_input())
+
+    def solve(self, parsed):
+        if self.args.part == 1:
+            return parsed[0]
+
+        with self.progress("forever") as progress:
+            while True:
+                progress.update()
+
+
+class TestCancelToken(unittest.TestCase):
+
+    def test_check(self):
+        token = CancelToken()
+        token.check()
+        token.cancel("Stop")
+        with self.assertRaisesRegex(Cancelled, "Stop"):
+            token.check()
+
+    def test_timeout(self):
+        token = CancelToken()
+        with token.timeout(0.01):
+            with token.timeout(100):  # The outer timer is kept
+                time.sleep(0.1)
+        self.assertTrue(token.cancelled)
+        self.assertEqual("Timed out after 0.01 s", token.reason)
+
+        token = CancelToken()
+        with token.timeout(0.05):
+            pass
+        time.sleep(0.1)
+        self.assertFalse(token.cancelled)  # Timer stopped with the context
+
+    def test_progress(self):
+        token = CancelToken()
+        reports = []
+        with self.assertRaises(Cancelled) as context:
+            with Progress("outer", None, None, cancel=token) as outer:
+                outer.update()
+                with Progress("inner", 10, reports.append, cancel=token) as inner:
+                    inner.update(3)
+                    token.cancel()
+                    inner.update()
+
+        self.assertEqual("inner", context.exception.progress.label)
+        self.assertEqual(4, context.exception.progress.count)
+        self.assertEqual(1, len(reports))
+        self.assertFalse(reports[0].done)  # How far it got, not a final report
+
+
+class TestTimeout(unittest.TestCase):
+
+    def test_solver(self):
+        self.assertIs(NULL_PROGRESS, Day00Endless([INPUT_FILE]).progress("loop"))
+        solver = Day00Endless([INPUT_FILE, "--timeout", "5"])
+        progress = solver.progress("loop")
+        self.assertIs(solver.cancel_token, progress.cancel)
+        self.assertIsNone(progress.sink)
+
+        self.assertEqual("test", Day00Endless([INPUT_FILE, "--timeout", "5"])())
+
+    def test_main(self):
+        f, out = io.StringIO(), io.StringIO()
+        argv = [INPUT_FILE, "--part", "both", "--timeout", "0.1", "--json"]
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(f):
+            with self.assertRaises(SystemExit) as context:
+                main(Day00Endless, argv)
+
+        self.assertEqual(TIMEOUT_EXIT_CODE, context.exception.code)
+        lines = f.getvalue().splitlines()
+        self.assertEqual("Timed out after 0.1 s", lines[0])
+        self.assertTrue(lines[1].startswith("Got to: [Day00Endless part 2: forever]"))
+
+        record = json.loads(out.getvalue())
+        self.assertIsNone(record["answers"])
+        self.assertEqual("Timed out after 0.1 s", record["error"])
+        self.assertEqual("Day00Endless part 2: forever", record["progress"]["label"])
+
+    def test_batch(self):
+        f = io.StringIO()
+        argv = ["--batch", INPUT_FILE, "--part", "2", "--timeout", "0.1", "-j", "1"]
+        with contextlib.redirect_stdout(f), contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                main(Day00Endless, argv)
+
+        (result,) = [json.loads(line) for line in f.getvalue().splitlines()]
+        self.assertEqual("Cancelled: Timed out after 0.1 s", result["error"])
+        self.assertGreater(result["progress"]["count"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import contextlib
+import io
+import os
+import pickle
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from advent_of_code.shared import main
+from advent_of_code.shared.disk_cache import (
+    CACHE_DIR_ENV,
+    CorruptEntryError,
+    DiskCache,
+    dumps,
+    loads,
+)
+
+from ..advent_testcase import AdventTestCase
+from .test_shared import Day00Phases
+
+
+class TestSerialization(unittest.TestCase):
+
+    def test_round_trip(self):
+        obj = {"a": [1, 2, 3], "b": ("x", None)}
+        self.assertEqual(obj, loads(dumps(obj)))
+
+    def test_out_of_band(self):
+        buffer = bytearray(b"abc" * 1000)
+        blob = dumps([pickle.PickleBuffer(buffer), 5])
+        result = loads(blob)
+        self.assertEqual(bytes(buffer), bytes(result[0]))
+        self.assertEqual(5, result[1])
+
+    def test_corrupt(self):
+        blob = dumps([pickle.PickleBuffer(bytearray(b"abc" * 1000)), 5])
+        for data in (b"", b"\x01", blob[:10], blob[:-1], blob + b"x", b"\x00" * 20):
+            with self.assertRaises(CorruptEntryError):
+                loads(data)
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def test_get_put(self):
+        with TemporaryDirectory() as tmp_dir:
+            cache = DiskCache(Path(tmp_dir))
+            self.assertIsNone(cache.get("key"))
+            cache.put("key", b"data")
+            self.assertEqual(b"data", cache.get("key"))
+            self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+            cache.clear()
+            self.assertIsNone(cache.get("key"))
+
+    def test_eviction(self):
+        with TemporaryDirectory() as tmp_dir:
+            cache = DiskCache(Path(tmp_dir), max_bytes=25)
+            for i, key in enumerate(["a", "b", "c"]):
+                cache.put(key, b"0123456789")
+                os.utime(cache.path(key), ns=(i, i))  # Force distinct timestamps
+
+            self.assertIsNone(cache.get("a"))  # Least recently used
+            self.assertIsNotNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("c"))
+            self.assertEqual(1, cache.evictions)
+
+            cache.max_bytes = None
+            cache.max_entries = 1
+            os.utime(cache.path("b"), ns=(0, 0))
+            cache.evict()
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("c"))
+
+
+class TestParseCache(AdventTestCase):
+
+    PUZZLE = Day00Phases
+
+    def test_parse_cache(self):
+        with TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {CACHE_DIR_ENV: tmp_dir}):
+                solver = self.PUZZLE(
+                    [str(Path(__file__).parent / "sample_input.txt"), "--parse-cache"]
+                )
+                self.assertEqual("TEST", solver())
+                self.assertFalse(solver.parse_cache_hit)
+
+                solver = self.PUZZLE(
+                    [str(Path(__file__).parent / "sample_input.txt"), "--parse-cache"]
+                )
+                self.assertEqual("TEST", solver())
+                self.assertTrue(solver.parse_cache_hit)
+
+    def test_parse_cache_corrupt(self):
+        with TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {CACHE_DIR_ENV: tmp_dir}):
+                input_file = str(Path(__file__).parent / "sample_input.txt")
+                self.assertEqual("TEST", self.PUZZLE([input_file, "--parse-cache"])())
+
+                (entry,) = Path(tmp_dir).glob("parsed/*.bin")
+                entry.write_bytes(entry.read_bytes()[:7])  # Truncated
+
+                solver = self.PUZZLE([input_file, "--parse-cache"])
+                self.assertEqual("TEST", solver())
+                self.assertFalse(solver.parse_cache_hit)
+
+                solver = self.PUZZLE([input_file, "--parse-cache"])
+                self.assertEqual("TEST", solver())
+                self.assertTrue(solver.parse_cache_hit)  # Overwritten
+
+    def test_parse_cache_disabled(self):
+        solver = self.get_solver()
+        self.assertEqual("TEST", solver())
+        self.assertIsNone(solver.parse_cache_hit)
+
+
+class TestAnswerCache(unittest.TestCase):
+
+    def test_answer_cache(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        outputs = []
+        with TemporaryDirectory() as tmp_dir:
+            with patch.dict(os.environ, {CACHE_DIR_ENV: tmp_dir}):
+                for _ in range(2):
+                    f = io.StringIO()
+                    argv = ["day_00", input_file, "--answer-cache", "-p", "both"]
+                    with patch("sys.argv", argv), contextlib.redirect_stdout(f):
+                        main(Day00Phases)
+                    outputs.append(f.getvalue())
+
+        self.assertIn("Answer part 2: TEST", outputs[0])
+        self.assertIn("0 hits, 2 misses", outputs[0])
+        self.assertIn("Answer part 2: TEST", outputs[1])
+        self.assertIn("2 hits, 0 misses", outputs[1])
+
+    def test_answer_cache_profile(self):
+        """A profiled run must solve, even when the answer is cached."""
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "input.txt"
+            input_file.write_text(
+                (Path(__file__).parent / "sample_input.txt").read_text()
+            )
+            with patch.dict(os.environ, {CACHE_DIR_ENV: tmp_dir}):
+                for flag in ("--stats", "--profile"):
+                    f = io.StringIO()
+                    argv = ["day_00", str(input_file), "--answer-cache", flag]
+                    with patch("sys.argv", argv), contextlib.redirect_stdout(f):
+                        main(Day00Phases)
+                    self.assertIn("0 hits, 0 misses", f.getvalue())
+
+            self.assertIn("(Profile written to:", f.getvalue())
+
+    def test_answer_key(self):
+        solver = Day00Phases([str(Path(__file__).parent / "sample_input.txt")])
+        self.assertNotEqual(solver.answer_key(1), solver.answer_key(2))
+        self.assertIn(solver.input_digest(), solver.answer_key(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
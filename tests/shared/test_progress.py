@@ -0,0 +1,86 @@
+import io
+import json
+import unittest
+from pathlib import Path
+
+from advent_of_code.shared.progress import (
+    NULL_PROGRESS,
+    JsonSink,
+    Progress,
+    ProgressReport,
+    TextSink,
+)
+
+from .test_shared import Day00Phases
+
+
+class TestProgress(unittest.TestCase):
+
+    def test_reports(self):
+        reports = []
+        with Progress("loop", total=10, sink=reports.append, interval=0) as progress:
+            for _ in range(4):
+                progress.update()
+
+        self.assertEqual(5, len(reports))  # One per update and one when done
+        self.assertEqual([1, 2, 3, 4, 4], [r.count for r in reports])
+        self.assertFalse(reports[-2].done)
+        self.assertTrue(reports[-1].done)
+        self.assertEqual("loop", reports[-1].label)
+        self.assertGreater(reports[-1].rate, 0)
+        self.assertGreater(reports[-2].eta, 0)
+
+    def test_error(self):
+        reports = []
+        with self.assertRaises(ValueError):
+            with Progress("loop", total=10, sink=reports.append, interval=60) as p:
+                p.update(3)
+                raise ValueError("Crashed")
+
+        (report,) = reports
+        self.assertEqual(3, report.count)
+        self.assertFalse(report.done)  # A crashed loop is not finished
+
+    def test_interval(self):
+        reports = []
+        with Progress("loop", total=None, sink=reports.append, interval=60) as progress:
+            for _ in range(1000):
+                progress.update()
+
+        self.assertEqual(1, len(reports))  # Only the final one
+        self.assertEqual(1000, reports[0].count)
+        self.assertIsNone(reports[0].eta)
+
+    def test_format(self):
+        report = ProgressReport("loop", 50, 200, elapsed=2.0, rate=25.0, eta=6.0)
+        self.assertEqual(
+            "[loop] 50 / 200 (25%) in 2.0 s (25/s), ETA 6.0 s", str(report)
+        )
+
+    def test_sinks(self):
+        report = ProgressReport("loop", 1, None, elapsed=1.0, rate=1.0, eta=None)
+
+        stream = io.StringIO()
+        TextSink(stream)(report)
+        self.assertEqual("[loop] 1 in 1.0 s (1/s)\n", stream.getvalue())
+
+        stream = io.StringIO()
+        JsonSink(stream)(report)
+        self.assertEqual("loop", json.loads(stream.getvalue())["label"])
+
+    def test_solver(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        self.assertIs(NULL_PROGRESS, Day00Phases([input_file]).progress("loop"))
+
+        solver = Day00Phases([input_file, "--progress", "--part", "2"])
+        progress = solver.progress("loop", total=3)
+        self.assertIsInstance(progress, Progress)
+        self.assertEqual("Day00Phases part 2: loop", progress.label)
+        self.assertIsInstance(progress.sink, TextSink)
+
+        solver = Day00Phases([input_file, "--progress-json"])
+        self.assertIsInstance(solver.progress("loop").sink, JsonSink)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,30 @@
+import bz2
 import contextlib
+import gzip
 import io
+import json
+import lzma
+import os
+import platform
+import pstats
+import shutil
+import sys
+import time
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
-from advent_of_code.shared import Grid, RowCol, Solver
+from advent_of_code.shared import Grid, RowCol, Solver, main, run_record
+from advent_of_code.shared.profiling import (
+    LineProfiler,
+    MemoryTracer,
+    SampleProfiler,
+    find_module,
+    iterate_code_objects,
+    print_line_profile,
+    print_samples,
+)
 
 from ..advent_testcase import AdventTestCase
 
@@ -14,6 +36,16 @@ class Day00(Solver):
         return 42
 
 
+class Day00Phases(Solver):
+    """Dummy puzzle implementation with separate parse and solve steps."""
+
+    def parse(self):
+        return list(self.iterate_input())
+
+    def solve(self, parsed):
+        return parsed[0].upper()
+
+
 class TestDay00Bare(unittest.TestCase):
 
     def test_help(self):
@@ -40,6 +72,381 @@ class TestDay00(AdventTestCase):
         txt = "\n".join(list(obj.iterate_input()))
         self.assertEqual("test", txt)
 
+    def test_both(self):
+        obj = self.get_solver("both")
+        self.assertEqual((42, 42), obj.both())
+
+    def test_input_bytes(self):
+        obj = self.get_solver()
+        self.assertEqual([b"test"], list(obj.iterate_input_bytes()))
+        self.assertEqual(b"test\n", obj.get_input_bytes())
+        with obj.map_input() as buffer:
+            self.assertEqual(0, buffer.find(b"test"))
+
+    def test_input_bytes_lines(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "input.txt"
+            for content in ["", "a\n", "a\n\n b \nc", "a\r\nb\r\n"]:
+                input_file.write_text(content, newline="")
+                obj = self.get_solver(input_file=input_file)
+                lines_text = list(obj.iterate_input())
+                lines_bytes = list(obj.iterate_input_bytes())
+                self.assertEqual([t.encode() for t in lines_text], lines_bytes)
+
+    def test_input_compressed(self):
+        content = b"a\n\n b \nc"
+        with TemporaryDirectory() as tmp_dir:
+            for suffix, module in [(".gz", gzip), (".xz", lzma), (".bz2", bz2)]:
+                input_file = Path(tmp_dir) / f"input.txt{suffix}"
+                input_file.write_bytes(module.compress(content))
+
+                obj = self.get_solver(input_file=input_file)
+                self.assertTrue(obj.is_streamed())
+                self.assertEqual(["a", "", "b", "c"], list(obj.iterate_input()))
+                self.assertEqual(
+                    [b"a", b"", b"b", b"c"], list(obj.iterate_input_bytes())
+                )
+                self.assertEqual(["a", "", " b ", "c"], obj.get_input())
+                self.assertEqual(content, obj.get_input_bytes())
+                with obj.map_input() as buffer:
+                    self.assertEqual(content, buffer)
+
+    def test_input_stdin(self):
+        input_file = Path(__file__).parent / "sample_input.txt"
+        with open(input_file) as fake_stdin, patch("sys.stdin", fake_stdin):
+            obj = Day00(["-"])
+            self.assertTrue(obj.is_stdin())
+            self.assertFalse(obj.args.parse_cache)
+            self.assertFalse(obj.args.answer_cache)
+            self.assertEqual(["test"], list(obj.iterate_input()))
+            self.assertEqual("stdin.Day00.part1.pstats", str(obj.output_path("pstats")))
+
+    def test_parse_ints(self):
+        self.assertEqual([0, 4, 3, -3], list(Solver.parse_ints(b"p=0,4 v=3,-3\n")))
+        self.assertEqual([12, 345], list(Solver.parse_ints(b"X+12, Y=345")))
+        self.assertEqual([], list(Solver.parse_ints(b"")))
+        # A `-` that is not a sign:
+        self.assertEqual([1, 3, -4], list(Solver.parse_ints(b"1- 3--4 -")))
+
+        self.assertEqual([1, 2, 3, 4], list(Solver.parse_ints(b"1,2\n\n3,4\n", 2)))
+        for data in (b"garbage\n", b"1 2\n3\n"):
+            with self.assertRaisesRegex(ValueError, "Expected 2 number"):
+                Solver.parse_ints(data, per_line=2)
+
+    def test_input_ints_and_sections(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "input.txt"
+            input_file.write_bytes(b"1|2\n3|4\n\n5,6\n\n\n7 -8\n")
+            obj = Day00([str(input_file)])
+
+            self.assertEqual([1, 2, 3, 4, 5, 6, 7, -8], list(obj.input_ints()))
+            self.assertEqual([b"1|2\n3|4", b"5,6", b"7 -8"], obj.input_sections())
+
+
+class TestDay00Phases(AdventTestCase):
+
+    PUZZLE = Day00Phases
+
+    def test_call(self):
+        self.assertTrue(Day00Phases.has_phases())
+        self.assertFalse(Day00.has_phases())
+        self.assertEqual("TEST", self.get_solver()())
+
+    def test_both(self):
+        obj = self.get_solver("both")
+        self.assertEqual(("TEST", "TEST"), obj.both())
+        with self.assertRaises(ValueError):
+            obj()  # Calling is ambiguous for both parts
+
+    def test_solves_within(self):
+        self.assertEqual("TEST", self.assertSolvesWithin(1, seconds=10, max_peak_mb=1))
+
+        with self.assertRaises(self.failureException):
+            self.assertSolvesWithin(1, seconds=0)
+        with self.assertRaises(self.failureException):
+            self.assertSolvesWithin(1, max_peak_mb=0)
+
+        with patch.dict("os.environ", {"AOC_PERF_FACTOR": "1e9"}):
+            self.assertSolvesWithin(1, seconds=1e-9)
+
+    def test_main(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        f = io.StringIO()
+        with patch("sys.argv", ["day_00", input_file]):
+            with contextlib.redirect_stdout(f):
+                main(Day00Phases)
+
+        txt = f.getvalue()
+        self.assertTrue(txt.startswith("Answer: TEST\n"))
+        self.assertIn("parse: ", txt)
+        self.assertIn("solve: ", txt)
+
+    def test_main_both(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        f = io.StringIO()
+        with patch("sys.argv", ["day_00", input_file, "--part", "both"]):
+            with contextlib.redirect_stdout(f):
+                main(Day00Phases)
+
+        txt = f.getvalue()
+        self.assertTrue(txt.startswith("Answer part 1: TEST\nAnswer part 2: TEST\n"))
+
+    def test_main_profile(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "input.txt"
+            shutil.copy(Path(__file__).parent / "sample_input.txt", input_file)
+
+            f = io.StringIO()
+            argv = ["day_00", str(input_file), "--profile", "--profile-top", "3"]
+            with patch("sys.argv", argv):
+                with contextlib.redirect_stdout(f):
+                    main(Day00Phases)
+
+            profile_file = Path(tmp_dir) / "input.txt.Day00Phases.part1.pstats"
+            self.assertTrue(profile_file.is_file())
+            stats = pstats.Stats(str(profile_file))
+            functions = {name for _, _, name in stats.stats}
+            self.assertIn("solve", functions)
+
+        txt = f.getvalue()
+        self.assertTrue(txt.startswith("Answer: TEST\n"))
+        self.assertIn("Top 3 functions by cumulative time", txt)
+        self.assertIn("Top 3 functions by self time", txt)
+
+    def test_main_sample_profile(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / "input.txt"
+            shutil.copy(Path(__file__).parent / "sample_input.txt", input_file)
+
+            f = io.StringIO()
+            argv = [str(input_file), "--sample-profile", "--sample-interval", "0.001"]
+            with contextlib.redirect_stdout(f):
+                main(Day00Phases, argv)
+
+            collapsed_file = Path(tmp_dir) / "input.txt.Day00Phases.part1.collapsed"
+            self.assertTrue(collapsed_file.is_file())
+
+        txt = f.getvalue()
+        self.assertTrue(txt.startswith("Answer: TEST\n"))
+        self.assertIn("functions by self samples", txt)
+        self.assertIn(f"(Collapsed stacks written to: {collapsed_file})", txt)
+
+    def test_main_json(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            main(Day00Phases, [input_file, "--part", "both", "--json"])
+
+        (line,) = f.getvalue().splitlines()  # Instead of the text output
+        record = json.loads(line)
+        self.assertEqual("Day00Phases", record["solver"])
+        self.assertEqual(0, record["day"])
+        self.assertEqual("both", record["part"])
+        self.assertEqual(["TEST", "TEST"], record["answers"])
+        self.assertEqual(len(record["input_digest"]), 64)
+        self.assertEqual(Path(input_file).stat().st_size, record["input_size"])
+        self.assertAlmostEqual(
+            record["time"], record["parse_time"] + record["solve_time"]
+        )
+        if run_record.resource is None:  # E.g. on Windows
+            self.assertIsNone(record["cpu_user"])
+            self.assertIsNone(record["max_rss"])
+        else:
+            self.assertGreaterEqual(record["cpu_user"], 0)
+            self.assertGreater(record["max_rss"], 0)
+        self.assertEqual(3, len(record["gc_collections"]))
+        self.assertTrue(record["python"].endswith(platform.python_version()))
+
+        f, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(f), contextlib.redirect_stderr(err):
+            main(Day00Phases, [input_file, "--json", "--stats"])
+        (line,) = f.getvalue().splitlines()  # The report goes to stderr instead
+        self.assertEqual(["TEST"], json.loads(line)["answers"])
+        self.assertIn("Counters", err.getvalue())
+
+        with TemporaryDirectory() as tmp_dir:
+            records_file = Path(tmp_dir) / "runs.jsonl"
+            f = io.StringIO()
+            with contextlib.redirect_stdout(f):
+                for part in ("1", "2"):
+                    argv = [input_file, "--part", part, "--json", str(records_file)]
+                    main(Day00Phases, argv)
+
+            self.assertTrue(f.getvalue().startswith("Answer: TEST\n"))
+            lines = records_file.read_text().splitlines()
+            records = [json.loads(line) for line in lines]
+            self.assertEqual([1, 2], [record["part"] for record in records])
+
+    def test_main_trace_memory(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        f = io.StringIO()
+        argv = ["day_00", input_file, "--trace-memory", "--trace-memory-top", "3"]
+        with patch("sys.argv", argv):
+            with contextlib.redirect_stdout(f):
+                main(Day00Phases)
+
+        txt = f.getvalue()
+        self.assertTrue(txt.startswith("Answer: TEST\n"))
+        self.assertIn("(Memory - peak traced: ", txt)
+        self.assertIn("Top 3 allocation sites near the peak:", txt)
+
+    def test_main_stats(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        f = io.StringIO()
+        with contextlib.redirect_stdout(f):
+            main(Day00Phases, [input_file, "--stats"])
+
+        txt = f.getvalue()
+        self.assertTrue(txt.startswith("Answer: TEST\n"))
+        self.assertIn("\nCounters:", txt)
+
+    def test_main_batch(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        missing_file = str(Path(__file__).parent / "missing.txt")
+        f = io.StringIO()
+        argv = ["--batch", input_file, missing_file, input_file, "--jobs", "2"]
+        with contextlib.redirect_stdout(f), contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit) as context:
+                main(Day00Phases, argv)
+
+        self.assertEqual(1, context.exception.code)  # Only one file failed
+        results = [json.loads(line) for line in f.getvalue().splitlines()]
+        self.assertEqual(3, len(results))
+        answers = [r["answers"] for r in results if r["input"] == input_file]
+        self.assertEqual([["TEST"], ["TEST"]], answers)
+        (error,) = [r["error"] for r in results if r["input"] == missing_file]
+        self.assertTrue(error.startswith("FileNotFoundError"))
+
+    def test_batch_or_input(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                Day00Phases([])
+            with self.assertRaises(SystemExit):
+                Day00Phases([input_file, "--batch", input_file])
+
+    def test_batch_unsupported(self):
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        for option in ("--answer-cache", "--profile", "--stats", "--json"):
+            f = io.StringIO()
+            with contextlib.redirect_stderr(f), self.assertRaises(SystemExit):
+                Day00Phases(["--batch", input_file, option])
+            self.assertIn(f"`{option}` is not supported with `--batch`", f.getvalue())
+
+        with patch.dict(os.environ, {"AOC_ANSWER_CACHE": "1"}):
+            Day00Phases(["--batch", input_file])  # Only given explicitly is an error
+
+
+class TestMemoryTracer(unittest.TestCase):
+
+    def test_peak(self):
+        with MemoryTracer() as tracer:
+            data = [str(i) for i in range(100_000)]
+            time.sleep(0.2)  # Let the sampler see it
+            del data
+
+        self.assertGreater(tracer.peak, 1_000_000)
+        # The freed list is still the biggest site, in this file:
+        site = tracer.top_sites(1)[0]
+        self.assertEqual(__file__, site.traceback[0].filename)
+        self.assertGreater(site.size, 1_000_000)
+
+
+def busy_loop(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestSampleProfiler(unittest.TestCase):
+
+    def test_samples(self):
+        with SampleProfiler(interval=0.001) as profiler:
+            busy_loop(0.3)
+
+        self.assertGreater(profiler.samples, 5)
+        self.assertEqual(profiler.samples, sum(profiler.stacks.values()))
+        self.assertLess(profiler.overhead, profiler.duration)
+
+        label, own, total = profiler.top_functions(1)[0]
+        self.assertTrue(label.startswith("busy_loop (test_shared.py:"))
+        self.assertGreater(own, profiler.samples / 2)
+
+        stack, count = profiler.collapsed()[0].rsplit(" ", 1)
+        self.assertGreater(int(count), 0)
+        frames = stack.split(";")
+        self.assertTrue(frames[-1].startswith("busy_loop "))
+        self.assertTrue(frames[-2].startswith("TestSampleProfiler.test_samples "))
+
+        f = io.StringIO()
+        print_samples(profiler, top=2, stream=f)
+        self.assertIn("top 2 functions by self samples", f.getvalue())
+        self.assertIn("busy_loop", f.getvalue())
+
+
+def count_lines(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += busy_square(i)
+    return total
+
+
+def busy_square(i: int) -> int:
+    return i * i
+
+
+class TestLineProfiler(unittest.TestCase):
+
+    def test_find_module(self):
+        module = find_module("advent_of_code.day_20")  # A package means `__main__`
+        self.assertEqual("advent_of_code.day_20.__main__", module.__name__)
+        self.assertIs(sys.modules[__name__], find_module(__name__))
+        with self.assertRaises(ModuleNotFoundError):
+            find_module("advent_of_code.day_99")
+
+    def test_code_objects(self):
+        module = find_module("advent_of_code.day_20")
+        names = {code.co_qualname for code in iterate_code_objects(module)}
+        self.assertIn("Day20.find_any_cheats", names)
+        self.assertIn("Day20.solve_maze", names)
+        self.assertNotIn("Solver.solve_both", names)  # Imported, not defined there
+
+    @unittest.skipIf(sys.version_info >= (3, 12), "Python 3.11 only")
+    def test_unsupported(self):
+        with self.assertRaises(RuntimeError):
+            LineProfiler(sys.modules[__name__])
+
+        input_file = str(Path(__file__).parent / "sample_input.txt")
+        with contextlib.redirect_stderr(io.StringIO()) as f:
+            with self.assertRaises(SystemExit):
+                Day00Phases([input_file, "--line-profile"])
+        self.assertIn("needs Python 3.12", f.getvalue())
+
+    @unittest.skipUnless(hasattr(sys, "monitoring"), "Needs Python 3.12+")
+    def test_lines(self):
+        with LineProfiler(sys.modules[__name__]) as profiler:
+            self.assertEqual(285, count_lines(10))
+
+        code = count_lines.__code__
+        loop_line = code.co_firstlineno + 2
+        self.assertEqual(11, profiler.hits[code, loop_line])  # Also the last check
+        self.assertEqual(10, profiler.hits[code, loop_line + 1])
+        self.assertEqual(10, profiler.hits[busy_square.__code__, loop_line + 6])
+
+        functions = dict(profiler.functions())
+        self.assertGreater(functions[code], functions[busy_square.__code__])
+        # The calls are included in the time of the calling line:
+        self.assertGreater(
+            profiler.times[code, loop_line + 1], functions[busy_square.__code__]
+        )
+
+        f = io.StringIO()
+        print_line_profile(profiler, top=2, stream=f)  # This test, and `count_lines`
+        self.assertIn("top 2 of 3 functions that ran", f.getvalue())
+        self.assertIn("\ncount_lines (test_shared.py:", f.getvalue())
+        self.assertIn("total += busy_square(i)", f.getvalue())
+        self.assertNotIn("\nbusy_square (", f.getvalue())
+
 
 class TestGrid(unittest.TestCase):
 
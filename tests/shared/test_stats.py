@@ -0,0 +1,65 @@
+import io
+import unittest
+
+from advent_of_code.shared import (
+    EdgeBidirectional,
+    Graph,
+    Grid,
+    Node,
+    PriorityList,
+    RowCol,
+)
+from advent_of_code.shared.stats import Stats, print_stats
+
+
+class TestStats(unittest.TestCase):
+
+    def test_counts(self):
+        grid = Grid()
+        grid.add_str_row("#.#")
+
+        with Stats() as stats:
+            RowCol(0, 0) + RowCol(1, 1)  # Creates three
+            _ = grid.items[RowCol(0, 0)]
+            grid.copy()
+
+            queue = PriorityList()
+            for priority in range(5):
+                queue.push(priority, None)
+            queue.pop()
+            queue.push(0, None)
+
+            graph = Graph()
+            graph.add_and_create_edge(EdgeBidirectional, Node("a"), Node("b"))
+
+        self.assertEqual(4, stats.counts["RowCol created"])
+        self.assertEqual(1, stats.counts["Grid.copy"])
+        self.assertEqual(2, stats.counts["Grid.items lookups"])  # Once more in copy
+        self.assertEqual(6, stats.counts["PriorityList.push"])
+        self.assertEqual(1, stats.counts["PriorityList.pop"])
+        self.assertEqual(5, stats.counts["PriorityList max size"])
+        self.assertEqual(1, stats.counts["Graph.add_edge"])
+
+    def test_restored(self):
+        original_init = RowCol.__init__
+        with Stats():
+            pass
+
+        self.assertIs(original_init, RowCol.__init__)
+        self.assertNotIn("items", vars(Grid))
+
+        grid = Grid()
+        grid.items = {}
+        self.assertEqual({}, grid.items)
+
+    def test_print_stats(self):
+        with Stats() as stats:
+            RowCol(0, 0)
+
+        f = io.StringIO()
+        print_stats(stats, stream=f)
+        self.assertIn("RowCol created", f.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()